@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Benchmark
+Builds a synthetic corpus of business stories in which about half of the
+stories are carried by two or three sources, each copy with its own
+headline edits (reworded, trimmed, prefixed, number formats) and excerpt
+length, sometimes with no excerpt at all, published the same day or the next.
+Some stories have a mirror on another source: the same headline template
+and most of the same excerpt, but moving the other way ("Meralco cuts power
+rates this month" vs "Meralco hikes power rates this month"). Every article
+is labelled with its story, so the clusters are scored as pairwise precision
+/ recall against the labels, next to the previous exact-title check; the
+mirrors' similarity shows why the threshold alone cannot keep them apart.
+The index's insert time is reported at growing corpus sizes to show that
+it stays flat, and an all-pairs comparison on a sample shows what the
+index avoids
+
+Usage: python benchmarks/dedupe_benchmark.py [--articles 100000] [--thresholds 0.3,0.4,0.5,0.7] [--title-threshold 0.7]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedupe import (DedupeArticle, NearDuplicateIndex, near_duplicate_clusters, shingles, DEDUPE_THRESHOLD,
+                    DEDUPE_TITLE_THRESHOLD)
+
+SOURCES = ['inquirer', 'philstar', 'businessmirror']
+SUBJECTS = ['BSP', 'The peso', 'PSEi', 'Meralco', 'Ayala Land', 'SM Investments', 'The government', 'Exporters',
+            'Rice farmers', 'Jollibee', 'PLDT', 'Foreign investors', 'Inflation', 'Remittances', 'Manufacturers',
+            'DOF', 'NEDA', 'San Miguel', 'Globe Telecom', 'Cebu Pacific', 'BDO', 'Metrobank', 'The DTI', 'Petron']
+EVENTS = ['surges to a record high', 'slumps amid weak demand', 'holds steady', 'beats profit forecasts',
+          'warns of higher costs', 'expands into new markets', 'faces a regulatory probe', 'cuts its outlook',
+          'posts strong first-half earnings', 'struggles with rising fuel prices', 'signs a landmark deal']
+REWORDS = {'surges': 'jumps', 'slumps': 'drops', 'record': 'all-time', 'strong': 'robust', 'rising': 'higher',
+           'higher': 'bigger', 'landmark': 'major', 'warns': 'cautions', 'cuts': 'trims', 'amid': 'on'}
+PREFIXES = ['BREAKING: ', 'UPDATE: ', 'Business: ', '']
+MIRRORS = {'surges to a record high': 'slumps to a record low',
+           'slumps amid weak demand': 'surges amid strong demand',
+           'cuts its outlook': 'raises its outlook',
+           'posts strong first-half earnings': 'posts weak first-half earnings',
+           'struggles with rising fuel prices': 'struggles with falling fuel prices'}
+FIRST_DAY = date(2025, 8, 4)
+COMMON = ('the of to and in a for on that is said with as its by at from will be has was it an are this '
+          'percent year billion million pesos growth market prices rate rates bank banks government economy '
+          'quarter first second sales demand investors shares company companies officials data month higher '
+          'lower increase decline expected report according analysts local global exports imports trade '
+          'inflation interest policy power energy property consumer business sector industry').split()
+
+def pseudo_words(count, rng):
+    """A vocabulary of distinct made-up words for the story-specific details (names, places, figures)"""
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice('bcdfghklmnprstvz') + rng.choice('aeiou') for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+def sentence(rng, vocabulary):
+    """A sentence of common business words and story-specific ones, about half each"""
+    words = [rng.choice(COMMON) if rng.random() < 0.5 else rng.choice(vocabulary) for _ in range(rng.randint(10, 16))]
+    return ' '.join(words).capitalize() + '.'
+
+def base_story(rng, vocabulary, previous=None):
+    """One story: a headline and a four to six sentence lede
+
+    A follow-up story reuses an earlier story's subject and event with new
+    details, so unrelated articles can look alike without being duplicates.
+    """
+    number = f"{rng.randint(1, 99)}.{rng.randint(0, 9)}%"
+    if previous is not None:
+        template = ' '.join(previous.split()[:-4])
+    else:
+        template = f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)}"
+    title = f"{template} {' '.join(rng.sample(vocabulary, 3))} {number}"
+    return title, ' '.join(sentence(rng, vocabulary) for _ in range(rng.randint(4, 6)))
+
+def source_copy(title, description, rng):
+    """How another source carries the same story: an edited headline and a shorter or longer excerpt (or none)"""
+    words = title.split()
+    words = [REWORDS.get(word, word) if rng.random() < 0.5 else word for word in words]
+    if rng.random() < 0.3:
+        del words[rng.randrange(1, len(words))]
+    words = [word.replace('%', ' percent') if rng.random() < 0.5 else word for word in words]
+    title = rng.choice(PREFIXES) + ' '.join(words)
+    if rng.random() < 0.3:
+        title = title.upper()
+    if rng.random() < 0.2:
+        return title, ''
+    sentences = description.split('. ')
+    return title, '. '.join(sentences[:rng.randint(2, len(sentences))])
+
+def mirror_story(title, description, rng, vocabulary):
+    """The same template moving the other way: the opposite event, and a tenth of the excerpt's words changed"""
+    for event, opposite in MIRRORS.items():
+        if event in title:
+            title = title.replace(event, opposite)
+            break
+    else:
+        return None
+    words = [rng.choice(vocabulary) if rng.random() < 0.1 else word for word in description.split()]
+    return title, ' '.join(words)
+
+def corpus(count, seed=11):
+    """(source, title, description, published, story) rows; about half the stories appear on more than one source"""
+    rng = random.Random(seed)
+    vocabulary = pseudo_words(20000, rng)
+    rows = []
+    story = 0
+    title = None
+    while len(rows) < count:
+        title, description = base_story(rng, vocabulary, previous=title if rng.random() < 0.3 else None)
+        published = FIRST_DAY + timedelta(days=rng.randint(0, 3))
+        sources = rng.sample(SOURCES, rng.choice([1, 1, 2, 3]))
+        rows.append((sources[0], title, description, published, story))
+        for source in sources[1:]:
+            copy_published = published + timedelta(days=rng.randint(0, 1))
+            rows.append((source, *source_copy(title, description, rng), copy_published, story))
+        mirror = mirror_story(title, description, rng, vocabulary) if rng.random() < 0.3 else None
+        if mirror is not None:
+            story += 1
+            rows.append((rng.choice([source for source in SOURCES if source != sources[0]]), *mirror, published, story))
+        story += 1
+    rows = rows[:count]
+    rng.shuffle(rows)
+    return rows
+
+def pair_count(sizes):
+    return sum(size * (size - 1) // 2 for size in sizes)
+
+def pairwise_scores(labels, clusters):
+    """(precision, recall) of the same-cluster article pairs against the same-story pairs"""
+    predicted = pair_count(len(cluster) for cluster in clusters)
+    expected = pair_count(Counter(labels).values())
+    correct = pair_count(Counter((cluster_id, labels[position]) for cluster_id, cluster in enumerate(clusters)
+                                 for position in cluster).values())
+    return (correct / predicted if predicted else 1.0), (correct / expected if expected else 1.0)
+
+def exact_title_clusters(rows):
+    """The previous check: articles are the same only when their titles are identical"""
+    clusters = {}
+    for position, (_, title, _, _, _) in enumerate(rows):
+        clusters.setdefault(title, []).append(position)
+    return list(clusters.values())
+
+def mirror_similarities(count, seed=11):
+    """Exact Jaccard similarity of title + excerpt between stories and their mirrors"""
+    rng = random.Random(seed)
+    vocabulary = pseudo_words(20000, rng)
+    scores = []
+    while len(scores) < count:
+        title, description = base_story(rng, vocabulary)
+        mirror = mirror_story(title, description, rng, vocabulary)
+        if mirror is not None:
+            first, second = shingles(f"{title} {description}"), shingles(' '.join(mirror))
+            scores.append(len(first & second) / len(first | second))
+    return scores
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure near-duplicate detection quality and insert cost")
+    parser.add_argument('--articles', type=int, default=100000, help="Synthetic articles indexed")
+    parser.add_argument('--thresholds', default='0.3,0.4,0.5,0.7', help="Comma-separated similarity thresholds")
+    parser.add_argument('--title-threshold', type=float, default=DEDUPE_TITLE_THRESHOLD,
+                        help="Threshold for articles matched on the headline alone (no excerpt)")
+    parser.add_argument('--sample', type=int, default=2000, help="Articles compared all-pairs for the baseline timing")
+    args = parser.parse_args()
+
+    rows = corpus(args.articles)
+    labels = [story for _, _, _, _, story in rows]
+    duplicates = len(rows) - len(set(labels))
+    print(f"🏁 {len(rows)} articles, {len(set(labels))} stories ({duplicates} copies carried by a second or third source)")
+
+    precision, recall = pairwise_scores(labels, exact_title_clusters(rows))
+    print(f"\nexact title check: precision {precision:.3f}, recall {recall:.3f}")
+
+    scores = mirror_similarities(1000)
+    print(f"\nmirror stories (same template, opposite direction): similarity median {statistics.median(scores):.2f}, "
+          f"{sum(score >= 0.7 for score in scores) / len(scores) * 100:.0f}% at 0.7 or more - "
+          f"kept apart by the headline direction check, not by the threshold")
+
+    articles = [DedupeArticle(*row[:4]) for row in rows]
+    print(f"\nheadline-only matches at {args.title_threshold:.2f}")
+    print(f"{'threshold':<10} {'precision':>10} {'recall':>8} {'removed':>8} {'per article':>12}")
+    for threshold in (float(value) for value in args.thresholds.split(',')):
+        start = time.perf_counter()
+        clusters = near_duplicate_clusters(articles, threshold, args.title_threshold)
+        elapsed = time.perf_counter() - start
+        precision, recall = pairwise_scores(labels, clusters)
+        print(f"{threshold:<10.2f} {precision:>10.3f} {recall:>8.3f} {len(rows) - len(clusters):>8} "
+              f"{elapsed / len(rows) * 1e6:>10.0f}µs")
+
+    # Insert cost of one index as it grows: the band lookups and candidate checks do not depend on its size
+    index = NearDuplicateIndex(threshold=DEDUPE_THRESHOLD)
+    texts = [f"{article.title} {article.description}" for article in articles]
+    checkpoints = sorted({len(rows) // 10, len(rows) // 2, len(rows)})
+    costs, inserted, start = [], 0, time.perf_counter()
+    for position, text in enumerate(texts, 1):
+        index.add(text)
+        if position in checkpoints:
+            now = time.perf_counter()
+            costs.append(f"{(now - start) / (position - inserted) * 1e6:.0f}µs up to {position}")
+            inserted, start = position, now
+    print(f"\nindex insert cost ({index.bands} bands x {index.rows} rows, "
+          f"{index.stats['candidates'] / len(texts):.2f} candidate checks per insert): {', '.join(costs)}")
+
+    # What the index avoids: exact Jaccard over every pair of a sample grows with the square of its size
+    sample = [shingles(text) for text in texts[:args.sample]]
+    start = time.perf_counter()
+    for position, first in enumerate(sample):
+        for second in sample[position + 1:]:
+            len(first & second) / len(first | second)
+    elapsed = time.perf_counter() - start
+    projected = elapsed * (len(rows) / len(sample)) ** 2
+    print(f"\nall-pairs Jaccard on {len(sample)} articles: {elapsed:.2f}s "
+          f"(about {projected / 60:.0f} min at {len(rows)} articles, growing with the square of the corpus)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+HTTP/2 Transport Benchmark
+Compares the current requests/urllib3 HTTP/1.1 path with the optional HTTP/2
+transport against a local stand-in server, fetching the same pages with the
+same number of worker threads as the scrapers. The stand-in speaks HTTP/1.1
+and cleartext HTTP/2 (h2c with prior knowledge) on one port, and adds a
+connection setup delay and a per-response delay to stand in for the TCP+TLS
+handshake and the round trip to the news sites
+
+Usage: python benchmarks/http2_transport_benchmark.py [--requests 200] [--workers 12]
+Requires: pip install 'httpx[http2]'
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http2_transport import HTTP2Adapter, HTTP2_AVAILABLE
+
+if not HTTP2_AVAILABLE:
+    sys.exit("httpx[http2] is required for this benchmark: pip install 'httpx[http2]'")
+
+import h2.config
+import h2.connection
+import h2.events
+
+H2_PREFACE_LINE = b'PRI * HTTP/2.0\r\n'
+
+class StandInServer:
+    """Local HTTP/1.1 + h2c server returning an article-sized page after a fixed delay
+
+    Runs in its own process so its HTTP/2 framing does not compete with the
+    client for the GIL.
+    """
+
+    def __init__(self, body_size, response_delay, connect_delay):
+        self.body = (b'<html><head><title>Article</title></head><body>'
+                     + b'x' * body_size + b'</body></html>')
+        self.response_delay = response_delay
+        self.connect_delay = connect_delay
+        self.connection_count = multiprocessing.Value('i', 0)
+        self.port = None
+
+    @property
+    def connections(self):
+        return self.connection_count.value
+
+    def start(self):
+        ready = multiprocessing.Queue()
+        multiprocessing.Process(target=self._run, args=(ready,), daemon=True).start()
+        self.port = ready.get(timeout=10)
+
+    def _run(self, ready):
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(self._handle, '127.0.0.1', 0))
+        ready.put(server.sockets[0].getsockname()[1])
+        loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        with self.connection_count.get_lock():
+            self.connection_count.value += 1
+        await asyncio.sleep(self.connect_delay)
+        try:
+            first_line = await reader.readline()
+            if first_line == H2_PREFACE_LINE:
+                await self._serve_h2(first_line, reader, writer)
+            else:
+                await self._serve_http1(first_line, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(self, request_line, reader, writer):
+        while request_line:
+            while (await reader.readline()) not in (b'\r\n', b''):
+                pass
+            await asyncio.sleep(self.response_delay)
+            writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n'
+                         + f'Content-Length: {len(self.body)}\r\n\r\n'.encode() + self.body)
+            await writer.drain()
+            request_line = await reader.readline()
+
+    async def _serve_h2(self, data, reader, writer):
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        window_opened = asyncio.Event()
+
+        async def respond(stream_id):
+            await asyncio.sleep(self.response_delay)
+            conn.send_headers(stream_id, [(':status', '200'), ('content-type', 'text/html; charset=utf-8'),
+                                          ('content-length', str(len(self.body)))])
+            body = self.body
+            while body:
+                window = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                if window <= 0:
+                    window_opened.clear()
+                    await window_opened.wait()
+                    continue
+                conn.send_data(stream_id, body[:window], end_stream=len(body) <= window)
+                body = body[window:]
+                writer.write(conn.data_to_send())
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    asyncio.ensure_future(respond(event.stream_id))
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_opened.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+def http1_session(pool_maxsize):
+    """The scrapers' current transport: a pooled requests session over HTTP/1.1"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize))
+    return session
+
+def http2_session():
+    """The same session with the HTTP/2 adapter (h2c, since the stand-in has no TLS)"""
+    session = requests.Session()
+    session.mount('http://', HTTP2Adapter(prior_knowledge=True))
+    return session
+
+def run(session, urls, workers):
+    """Fetch every URL with a thread pool and return (total seconds, per-request latencies)"""
+    def fetch(url):
+        start_time = time.perf_counter()
+        response = session.get(url, timeout=(10, 30))
+        response.raise_for_status()
+        assert len(response.content) > 0
+        return time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = list(executor.map(fetch, urls))
+    return time.perf_counter() - start_time, latencies
+
+def report(name, total, latencies, connections):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"{name:<22} {total:7.2f}s {len(latencies) / total:8.1f} req/s "
+          f"{statistics.mean(latencies) * 1000:8.1f} ms {statistics.median(latencies) * 1000:8.1f} ms "
+          f"{p95 * 1000:8.1f} ms {connections:6d}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the HTTP/1.1 and HTTP/2 transports against a local stand-in")
+    parser.add_argument('--requests', type=int, default=200, help="Pages fetched per transport")
+    parser.add_argument('--workers', type=int, default=12, help="Concurrent fetch threads")
+    parser.add_argument('--pool-maxsize', type=int, default=8, help="HTTP/1.1 keep-alive connections per host")
+    parser.add_argument('--body-kb', type=int, default=60, help="Page size in KB")
+    parser.add_argument('--delay-ms', type=float, default=50, help="Server delay per response")
+    parser.add_argument('--connect-ms', type=float, default=100, help="Delay per new connection (handshake stand-in)")
+    args = parser.parse_args()
+
+    server = StandInServer(args.body_kb * 1024, args.delay_ms / 1000, args.connect_ms / 1000)
+    server.start()
+    urls = [f'http://127.0.0.1:{server.port}/news/{i}/article' for i in range(args.requests)]
+
+    print(f"🏁 {args.requests} pages of {args.body_kb} KB, {args.workers} workers, "
+          f"{args.delay_ms:.0f} ms response delay, {args.connect_ms:.0f} ms connection setup")
+    print(f"{'transport':<22} {'total':>8} {'throughput':>12} {'mean':>11} {'median':>11} {'p95':>11} {'conns':>6}")
+
+    for name, session in ((f'HTTP/1.1 (pool {args.pool_maxsize})', http1_session(args.pool_maxsize)),
+                          ('HTTP/2 (multiplexed)', http2_session())):
+        connections_before = server.connections
+        total, latencies = run(session, urls, args.workers)
+        report(name, total, latencies, server.connections - connections_before)
+        session.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+Measures the cold start of the entry points: each one is imported in a
+fresh interpreter several times with -X importtime, and the median total
+and the slowest top-level imports are reported. Also checks that the heavy
+libraries that are only needed later (pandas, numpy, the Azure SDK, TextBlob/NLTK,
+VADER, httpx) are not pulled in at start-up, so a module-level import that
+slips back in fails the run
+
+Usage: python benchmarks/import_time_benchmark.py [--runs 5] [--budget-ms 800]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ['universal_news_scraper', 'scrape_inquirer', 'scrape_philstar_improved', 'scrape_businessmirror_fixed']
+
+# Imported on first use only; none of these may be loaded by importing an entry point
+DEFERRED_MODULES = ['pandas', 'numpy', 'azure.storage.blob', 'textblob', 'nltk', 'vaderSentiment', 'httpx']
+
+def import_profile(module):
+    """(total microseconds, {direct import: cumulative microseconds}, loaded deferred modules) in a fresh interpreter"""
+    check = f"import sys, {module}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    # Lines read "import time: self | cumulative | name", nested imports indented two spaces per level;
+    # a module's nested imports are listed before it
+    total, direct, pending = 0, {}, {}
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative, name = int(parts[1]), parts[2][1:]
+        level = (len(name) - len(name.lstrip(' '))) // 2
+        if level == 1:
+            pending[name.strip()] = cumulative
+        elif level == 0:
+            if name == module:
+                total, direct = cumulative, pending
+            pending = {}
+    loaded = [name for name in result.stdout.strip().split(',') if name]
+    return total, direct, loaded
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the start-up import time of the scraper entry points")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument('--budget-ms', type=float, default=None, help="Fail when a median import exceeds this")
+    parser.add_argument('--top', type=int, default=5, help="Slowest direct imports listed per entry point")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"🏁 {args.runs} cold imports per entry point (median of cumulative import time)")
+    for module in ENTRY_POINTS:
+        runs = [import_profile(module) for _ in range(args.runs)]
+        median_ms = statistics.median(total for total, _, _ in runs) / 1000
+        print(f"\n{module:<30} {median_ms:>8.0f} ms")
+        slowest = sorted(runs[-1][1].items(), key=lambda entry: -entry[1])[:args.top]
+        for name, cumulative in slowest:
+            print(f"   {name:<40} {cumulative / 1000:>7.0f} ms")
+
+        loaded = runs[-1][2]
+        if loaded:
+            failures.append(f"{module} imports {', '.join(loaded)} at start-up")
+        if args.budget_ms is not None and median_ms > args.budget_ms:
+            failures.append(f"{module} takes {median_ms:.0f} ms to import (budget {args.budget_ms:.0f} ms)")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ No deferred library is imported at start-up" +
+          (f" and every entry point is within {args.budget_ms:.0f} ms" if args.budget_ms is not None else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Sentiment Engine Benchmark
+Scores the same batch of article-like texts (headline + excerpt) with the
+previous per-article inline path and with the batch engine at increasing
+worker counts, and reports throughput and the speed-up over one process.
+The worker pool is started and warmed up before each timed run, so the
+figures show steady-state scoring throughput; the start-up cost is reported
+separately
+
+Usage: python benchmarks/sentiment_benchmark.py [--texts 2000] [--workers 1,2,4] [--vader-only]
+Requires: pip install textblob vaderSentiment
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment_engine import SentimentEngine, analyze_texts, load_analyzers
+
+if load_analyzers() is None:
+    sys.exit("textblob and vaderSentiment are required for this benchmark: pip install textblob vaderSentiment")
+
+SUBJECTS = ['BSP', 'The peso', 'PSEi', 'Meralco', 'Ayala Land', 'SM Investments', 'The government', 'Exporters',
+            'Rice farmers', 'Jollibee', 'PLDT', 'Foreign investors', 'Inflation', 'Remittances', 'Manufacturers']
+EVENTS = ['surges to a record high', 'slumps amid weak demand', 'holds steady', 'beats profit forecasts',
+          'warns of higher costs', 'expands into new markets', 'faces a regulatory probe', 'cuts its outlook',
+          'posts strong first-half earnings', 'struggles with rising fuel prices', 'signs a landmark deal']
+DETAILS = ['Analysts expect growth to recover in the second half.', 'Officials said the decline was temporary.',
+           'Investors welcomed the better-than-expected results.', 'The company blamed supply chain disruptions.',
+           'Economists warned that the outlook remains uncertain.', 'Demand improved across most segments.',
+           'Shares fell sharply after the announcement.', 'The deal is expected to create thousands of jobs.']
+
+def article_texts(count, seed=7):
+    """Article-like texts: a headline and a two to four sentence excerpt"""
+    rng = random.Random(seed)
+    return [f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)} " + ' '.join(rng.sample(DETAILS, rng.randint(2, 4)))
+            for _ in range(count)]
+
+def report(name, seconds, count, baseline=None):
+    speedup = f"{baseline / seconds:>7.2f}x" if baseline else f"{'':>8}"
+    print(f"{name:<26} {seconds:>8.2f}s {count / seconds:>10.0f}/s {speedup}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure batch sentiment throughput across worker processes")
+    parser.add_argument('--texts', type=int, default=2000, help="Texts scored per run")
+    parser.add_argument('--workers', default=','.join(str(n) for n in sorted({1, 2, os.cpu_count() or 1})),
+                        help="Comma-separated worker counts to measure")
+    parser.add_argument('--chunk-size', type=int, default=64, help="Texts sent to a worker at a time")
+    parser.add_argument('--vader-only', action='store_true', help="Skip TextBlob (the tight-deadline mode)")
+    args = parser.parse_args()
+    texts = article_texts(args.texts)
+    use_textblob = not args.vader_only
+
+    print(f"🏁 {args.texts} texts, {os.cpu_count()} CPU cores, {'VADER only' if args.vader_only else 'TextBlob + VADER'}")
+    print(f"{'run':<26} {'total':>9} {'throughput':>11} {'speed-up':>8}")
+
+    # Previous path: one call per article, in the crawling process (after the lexicons are warm)
+    analyze_texts(texts[:50], use_textblob)
+    start = time.perf_counter()
+    expected = [analyze_texts([text], use_textblob)[0] for text in texts]
+    baseline = time.perf_counter() - start
+    report('per article (inline)', baseline, len(texts))
+
+    for workers in (int(n) for n in args.workers.split(',')):
+        engine = SentimentEngine(workers=workers, chunk_size=args.chunk_size, pool_min_texts=0)
+        if workers > 1:
+            start = time.perf_counter()
+            engine.analyze_batch(texts[:workers * args.chunk_size], use_textblob)  # Start and warm up every worker
+            print(f"   ({workers} workers started in {time.perf_counter() - start:.2f}s)")
+        start = time.perf_counter()
+        results = engine.analyze_batch(texts, use_textblob)
+        report(f'batch, {workers} worker(s)', time.perf_counter() - start, len(texts), baseline)
+        engine.shutdown()
+        if results != expected:
+            sys.exit(f"❌ Batch results with {workers} worker(s) differ from the per-article results")
+
+if __name__ == "__main__":
+    main()
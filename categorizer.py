@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Keyword Categorizer - shared by the site engine
+Assigns business categories from the keyword sets in sites/keyword_sets.json.
+All keywords of a set are compiled once into a keyword automaton (a trie
+run by the regex engine), so one scan of a batch of titles and descriptions
+finds every keyword of every category, however long the lists grow.
+Matches respect word boundaries: keywords of up to three letters (SM, AI, SEC, BIR) must be whole words,
+longer ones must start a word (bank -> banks, banking). Each category gets a
+score (title hits count double) and the best one wins; the previous
+behaviour - plain substring tests, first category in definition order - is
+kept as the first_match compatibility mode
+"""
+import hashlib
+import json
+import os
+import re
+
+# Categorizer settings (override via environment or a site's "categories" block)
+CATEGORY_MODE = os.getenv('CATEGORY_MODE', 'score')  # score (best keyword score) or first_match (previous behaviour)
+CATEGORY_TITLE_WEIGHT = int(os.getenv('CATEGORY_TITLE_WEIGHT', '2'))  # Score of a keyword hit in the title (description hits score 1)
+
+MODES = ('score', 'first_match')
+CATEGORIZER_VERSION = 1  # Bump when the matching or scoring rules change (invalidates cached categories)
+WHOLE_WORD_MAX_LENGTH = 3  # Keywords this short are acronyms or short words and must match a whole word
+
+class KeywordAutomaton:
+    """Trie over a list of lowercase keywords, compiled into one regular expression
+
+    The regex is the trie itself (shared prefixes factored out, greedy so the
+    longest keyword wins) inside a lookahead, so the C regex engine walks the
+    trie at every candidate start without consuming text; the few starts that
+    match are then walked in Python to list every keyword ending there.
+    """
+
+    def __init__(self, keywords, word_starts=True):
+        self.keywords = list(keywords)
+        self.children = [{}]  # node -> {character: next node}
+        self.ends = [None]  # node -> index of the keyword ending at this node
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for char in keyword:
+                if char not in self.children[node]:
+                    self.children[node][char] = len(self.children)
+                    self.children.append({})
+                    self.ends.append(None)
+                node = self.children[node][char]
+            self.ends[node] = index
+        # Candidate starts: word starts only, or every position for plain substring tests
+        anchor = r'(?<![^\W_])' if word_starts else ''
+        self.pattern = re.compile(f"{anchor}(?=({self._regex(0)}))") if self.keywords else None
+
+    def _regex(self, node):
+        branches = [re.escape(char) + self._regex(child) for char, child in self.children[node].items()]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if self.ends[node] is not None else body
+
+    def scan(self, text):
+        """Yield (start position, keyword index) for every keyword occurrence at a candidate start"""
+        if self.pattern is None:
+            return
+        children, ends = self.children, self.ends
+        for match in self.pattern.finditer(text):
+            node = 0
+            for char in match.group(1):
+                node = children[node][char]
+                if ends[node] is not None:
+                    yield match.start(), ends[node]
+
+class Categorizer:
+    """Keyword categories of one keyword set, scored in a single automaton scan per batch
+
+    categories maps each category name to its keywords, in priority order (the
+    order breaks score ties and decides the first_match mode).
+    """
+
+    def __init__(self, categories, default, mode=CATEGORY_MODE, title_weight=CATEGORY_TITLE_WEIGHT):
+        if mode not in MODES:
+            raise ValueError(f"Unknown category mode {mode!r} (expected one of {', '.join(MODES)})")
+        self.names = list(categories)
+        self.default = default
+        self.mode = mode
+        self.title_weight = title_weight
+
+        # A keyword listed under several categories ("export", "construction") scores for each of them
+        keyword_categories = {}
+        for position, keywords in enumerate(categories.values()):
+            for keyword in keywords:
+                positions = keyword_categories.setdefault(keyword.lower(), [])
+                if position not in positions:
+                    positions.append(position)
+        self.automaton = KeywordAutomaton(keyword_categories, word_starts=mode != 'first_match')
+        self.categories = [tuple(positions) for positions in keyword_categories.values()]
+        self.lengths = [len(keyword) for keyword in self.automaton.keywords]
+        # Identifies the rules and keyword lists behind a result (part of the enrichment cache key)
+        config = json.dumps([CATEGORIZER_VERSION, WHOLE_WORD_MAX_LENGTH, mode, title_weight, default, categories])
+        self.version = f"category/{hashlib.sha256(config.encode('utf-8')).hexdigest()[:12]}"
+
+    def _matches(self, text, end, index):
+        """True when a keyword occurrence ending before end satisfies its end boundary"""
+        if self.mode == 'first_match' or self.lengths[index] > WHOLE_WORD_MAX_LENGTH:
+            return True  # Substring tests as before; longer keywords only need to start a word
+        return end == len(text) or not text[end].isalnum()
+
+    def score_batch(self, articles):
+        """Score every category for a batch of (title, description) pairs in one scan
+
+        Returns one {category: score} dict per article, every category included.
+        """
+        # Join the batch into one text; the newline separators never match a keyword
+        text_parts, spans = [], []
+        offset = 0
+        for title, description in articles:
+            title, description = (title or '').lower(), (description or '').lower()
+            spans.append((offset, offset + len(title)))
+            text_parts.append(f"{title} {description}")
+            offset += len(title) + len(description) + 2
+        text = '\n'.join(text_parts)
+
+        scores = [[0] * len(self.names) for _ in spans]
+        article = 0
+        for start, index in self.automaton.scan(text):
+            while start >= spans[article][0] + len(text_parts[article]):
+                article += 1
+            if not self._matches(text, start + self.lengths[index], index):
+                continue
+            weight = self.title_weight if start < spans[article][1] else 1
+            for position in self.categories[index]:
+                scores[article][position] += weight
+        return [dict(zip(self.names, article_scores)) for article_scores in scores]
+
+    def scores(self, title, description):
+        """Score every category for one article"""
+        return self.score_batch([(title, description)])[0]
+
+    def categorize_batch(self, articles):
+        """Category of each (title, description) pair; the default when no keyword matches"""
+        categories = []
+        for scores in self.score_batch(articles):
+            matched = [name for name in self.names if scores[name] > 0]
+            if not matched:
+                categories.append(self.default)
+            elif self.mode == 'first_match':
+                categories.append(matched[0])
+            else:
+                # max() keeps the first of equal scores, so ties go to the earlier category
+                categories.append(max(matched, key=lambda name: scores[name]))
+        return categories
+
+    def categorize(self, title, description):
+        """Category of one article"""
+        return self.categorize_batch([(title, description)])[0]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Per-Host Circuit Breaker and Run-Wide Retry Budget - shared by all news scrapers
+A host that keeps failing (blocked, throttled or down) has its circuit opened
+so the remaining URLs for it fail fast instead of each sitting through its
+own back-off. Retries across the whole run draw from one budget, and failed
+URLs are deferred to a retry pass at the end of their batch instead of being
+retried inline
+"""
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+# Circuit breaker settings (override via environment)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))  # Consecutive failures that open a host's circuit
+CIRCUIT_OPEN_SECONDS = float(os.getenv('CIRCUIT_OPEN_SECONDS', '120'))  # Time before one trial request is let through
+RETRY_BUDGET = int(os.getenv('RETRY_BUDGET', '40'))  # Retries allowed across the whole run
+
+# Statuses that mean "blocked, throttled or down" rather than "this page does not exist"
+RETRYABLE_STATUSES = {403, 429, 500, 502, 503, 504}
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+class CircuitBreaker:
+    """Consecutive-failure circuit per host, a shared retry budget and a deferred-retry queue"""
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, open_seconds=CIRCUIT_OPEN_SECONDS,
+                 retry_budget=RETRY_BUDGET):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.retries_left = retry_budget
+        self.lock = threading.Lock()
+        self.failures = {}    # host -> consecutive failures
+        self.opened_at = {}   # host -> time the circuit opened
+        self.deferred = set()
+        self.stats = {'fast_failed': 0, 'circuits_opened': 0, 'retries_used': 0,
+                      'retries_refused': 0, 'deferred': 0, 'deferred_recovered': 0}
+
+    def allow(self, url):
+        """True when a request to the URL's host may be sent
+
+        An open circuit fast-fails until CIRCUIT_OPEN_SECONDS have passed; then
+        one trial request is let through (half-open) and its outcome decides
+        whether the circuit closes again.
+        """
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return True
+            if time.monotonic() - opened_at >= self.open_seconds:
+                # Half-open: re-arm the timer so only this one trial goes through
+                self.opened_at[host] = time.monotonic()
+                return True
+            self.stats['fast_failed'] += 1
+            return False
+
+    def record_success(self, url):
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            self.failures[host] = 0
+            if self.opened_at.pop(host, None) is not None:
+                print(f"  🔌 Circuit for {host} closed again")
+
+    def record_failure(self, url):
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if self.failures[host] >= self.failure_threshold and host not in self.opened_at:
+                self.opened_at[host] = time.monotonic()
+                self.stats['circuits_opened'] += 1
+                print(f"  ⛔ Circuit opened for {host} after {self.failures[host]} consecutive failures")
+            elif host in self.opened_at:
+                # A failed half-open trial keeps the circuit open for another period
+                self.opened_at[host] = time.monotonic()
+
+    def spend_retry(self):
+        """Take one retry from the run-wide budget; False once it is exhausted"""
+        with self.lock:
+            if self.retries_left <= 0:
+                self.stats['retries_refused'] += 1
+                return False
+            self.retries_left -= 1
+            self.stats['retries_used'] += 1
+            return True
+
+    def defer(self, url):
+        """Queue a URL that failed with a retryable error for the end-of-batch retry pass"""
+        with self.lock:
+            if url not in self.deferred:
+                self.deferred.add(url)
+                self.stats['deferred'] += 1
+
+    def pop_deferred(self, urls):
+        """Remove and return the given URLs that were deferred, keeping their order"""
+        with self.lock:
+            popped = [url for url in urls if url in self.deferred]
+            self.deferred.difference_update(popped)
+        return popped
+
+    def record_deferred_recovered(self, count):
+        with self.lock:
+            self.stats['deferred_recovered'] += count
+
+    def print_summary(self):
+        """Print circuit breaker and retry budget statistics for this run"""
+        print(f"⛔ Circuit breaker: {self.stats['circuits_opened']} circuit(s) opened, "
+              f"{self.stats['fast_failed']} requests fast-failed")
+        print(f"💸 Retry budget: {self.stats['retries_used']} retries used, {self.retries_left} left, "
+              f"{self.stats['retries_refused']} refused; {self.stats['deferred_recovered']}/{self.stats['deferred']} "
+              f"deferred URLs recovered")
+
+_circuit_breaker = None
+_circuit_breaker_lock = threading.Lock()
+
+def get_circuit_breaker():
+    """Return the process-wide circuit breaker shared by every scraper"""
+    global _circuit_breaker
+    with _circuit_breaker_lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker()
+        return _circuit_breaker
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Incremental Crawl State - shared by all news scrapers
+Remembers which canonical article URLs were already processed, with their
+resolved date, modified time and enrichment (category, sentiment), so
+repeat runs reuse them instead of re-fetching and re-enriching; an article
+whose description or modified time changed is processed again. Also
+keeps a per-section high-water mark (the newest article seen last run) so
+pagination can stop as soon as it reaches already-known content
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from date_engine import json_default, parse_date, restore_dates
+from url_utils import canonical_url
+
+# Directory for state persisted between runs (cached in the GitHub workflow)
+CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache')
+CRAWL_STATE_PATH = os.path.join(CACHE_DIR, 'crawl_state.json')
+CRAWL_STATE_RETENTION_DAYS = float(os.getenv('CRAWL_STATE_RETENTION_DAYS', '3'))
+
+class CrawlState:
+    """Canonical-URL store of processed articles plus per-section high-water marks"""
+
+    def __init__(self, path=CRAWL_STATE_PATH, retention_days=CRAWL_STATE_RETENTION_DAYS):
+        self.path = path
+        self.retention_seconds = retention_days * 86400
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()  # One save at a time, so an older snapshot never replaces a newer one
+        self.articles = {}
+        self.sections = {}
+        self.stats = {'known_reused': 0, 'changed': 0, 'new_recorded': 0, 'pages_skipped': 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.articles = data.get('articles', {})
+            self.sections = data.get('sections', {})
+            # Dates are stored as strings; turn them back into dates once, at load
+            for record in self.articles.values():
+                if isinstance(record.get('published_date'), str):
+                    record['published_date'] = parse_date(record['published_date'])
+                restore_dates(record.get('item'))
+            print(f"📚 Loaded crawl state: {len(self.articles)} known articles, {len(self.sections)} sections")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Could not read crawl state {self.path}: {e}")
+            self.articles = {}
+            self.sections = {}
+
+    def get(self, url):
+        """Return the stored record for an already-processed article, or None for a new one
+
+        A record's 'item' is the enriched news item, or None when the article was
+        resolved to a date outside the target window.
+        """
+        key = canonical_url(url)
+        with self.lock:
+            record = self.articles.get(key)
+            if record is None:
+                return None
+            record['last_seen'] = time.time()
+            self.stats['known_reused'] += 1
+            return {'published_date': record.get('published_date'),
+                    'modified': record.get('modified'),
+                    'item': dict(record['item']) if record.get('item') else None}
+
+    def changed(self, url, description=None, modified=None):
+        """True when a remembered article now has another description or modified time than was stored
+
+        Only the values the caller knows are compared (None skips one); the
+        description is the stored item's. A change is counted for the summary.
+        """
+        with self.lock:
+            record = self.articles.get(canonical_url(url))
+            if record is None:
+                return False
+            item = record.get('item')
+            changed = ((modified is not None and modified != record.get('modified'))
+                       or (description is not None and item is not None and description != item.get('description')))
+            if changed:
+                self.stats['changed'] += 1
+            return changed
+
+    def modified(self, url):
+        """Stored modified time of an article, or None"""
+        with self.lock:
+            record = self.articles.get(canonical_url(url))
+            return record.get('modified') if record else None
+
+    def remember(self, url, item=None, published_date=None, section=None, modified=None):
+        """Record a processed article; unresolved articles (no item and no date) are not stored"""
+        if item is None and published_date is None:
+            return
+
+        now = time.time()
+        with self.lock:
+            self.articles[canonical_url(url)] = {
+                'published_date': item['published_date'] if item else published_date,
+                'modified': modified,
+                'item': item,
+                'section': section,
+                'last_seen': now,
+            }
+            self.stats['new_recorded'] += 1
+
+    def section_urls(self, section):
+        """Return the article URLs remembered for a section (used when pagination stops early)"""
+        with self.lock:
+            return [record['item']['link'] for record in self.articles.values()
+                    if record.get('section') == section and record.get('item')]
+
+    def reached_high_water(self, section, links):
+        """True when a page's links include the newest article seen in this section last run"""
+        with self.lock:
+            mark = self.sections.get(section, {}).get('high_water')
+        if not mark:
+            return False
+        return any(canonical_url(link) == mark for link in links)
+
+    def set_high_water(self, section, newest_url):
+        """Remember the newest article of a section for the next run"""
+        if not newest_url:
+            return
+        with self.lock:
+            self.sections[section] = {
+                'high_water': canonical_url(newest_url),
+                'updated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+    def record_skipped_pages(self, count):
+        with self.lock:
+            self.stats['pages_skipped'] += count
+
+    def save(self):
+        """Drop articles not seen within the retention window and persist the state atomically"""
+        with self.save_lock:
+            cutoff = time.time() - self.retention_seconds
+            with self.lock:
+                self.articles = {url: record for url, record in self.articles.items()
+                                 if record.get('last_seen', 0) >= cutoff}
+                data = json.dumps({'articles': self.articles, 'sections': self.sections}, ensure_ascii=False,
+                                  default=json_default)
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"  # Runs sharing the cache may save together
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"⚠️ Could not save crawl state {self.path}: {e}")
+
+    def print_summary(self):
+        """Print incremental crawl statistics for this run"""
+        print(f"📚 Crawl state: {self.stats['known_reused']} known articles reused "
+              f"({self.stats['changed']} of them changed and processed again), "
+              f"{self.stats['new_recorded']} newly processed, "
+              f"{self.stats['pages_skipped']} listing pages skipped at the high-water mark")
+
+_crawl_state = None
+_crawl_state_lock = threading.Lock()
+
+def get_crawl_state():
+    """Return the process-wide crawl state shared by every scraper"""
+    global _crawl_state
+    with _crawl_state_lock:
+        if _crawl_state is None:
+            _crawl_state = CrawlState()
+        return _crawl_state
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Date Engine - shared by the site engine and the output writer
+Parses the dates found on news pages (ISO timestamps, "August 6, 2025",
+"6 Aug 2025", "08/06/2025", "2 hours ago") with precompiled patterns and
+memoizes each raw string, so the same text is never parsed twice. The
+target window (today and yesterday by default) is fixed once per run;
+dates travel through the pipeline as date objects and are only formatted
+when the output is written
+"""
+import functools
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Date settings (override via environment)
+DATE_WINDOW_DAYS = int(os.getenv('DATE_WINDOW_DAYS', '2'))  # Days kept counting back from today (2 = today and yesterday)
+DATE_CACHE_SIZE = int(os.getenv('DATE_CACHE_SIZE', '8192'))  # Raw date strings memoized per process
+SITE_TIMEZONE = os.getenv('SITE_TIMEZONE', 'Asia/Manila')  # Timezone whose calendar day an article is dated by
+
+try:
+    SITE_TZ = ZoneInfo(SITE_TIMEZONE)
+except ZoneInfoNotFoundError:
+    # No tz database (Windows without tzdata): Manila has no daylight saving, so a fixed offset is exact
+    SITE_TZ = timezone(timedelta(hours=8))
+
+# How published_date is written to the Excel output ("August 06, 2025")
+OUTPUT_DATE_FORMAT = "%B %d, %Y"
+
+MONTHS = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+          'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+MONTH_NAME = (r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+              r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?')
+
+# Tried in order on the raw string; each yields (year, month, day) groups in its own order
+ISO_DATE = re.compile(r'\b(\d{4})[-/](\d{1,2})[-/](\d{1,2})')
+MONTH_DAY_YEAR = re.compile(rf'\b{MONTH_NAME}\s+(\d{{1,2}})(?:st|nd|rd|th)?,?\s+(\d{{4}})\b', re.IGNORECASE)
+DAY_MONTH_YEAR = re.compile(rf'\b(\d{{1,2}})(?:st|nd|rd|th)?\s+{MONTH_NAME},?\s+(\d{{4}})\b', re.IGNORECASE)
+NUMERIC_DATE = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')  # US order: month/day/year
+RELATIVE_TIME = re.compile(r'(\d+)\s*(minute|hour|day|week)s?\s*ago', re.IGNORECASE)
+
+def _make_date(year, month, day):
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(text):
+    """First calendar date in a raw string; None when it has none
+
+    Understands ISO timestamps (the date part, as written), "August 6, 2025",
+    "Aug. 6 2025", "6 August 2025" and "08/06/2025". Results are memoized.
+    """
+    if not text:
+        return None
+    match = ISO_DATE.search(text)
+    if match:
+        return _make_date(*match.groups())
+    match = MONTH_DAY_YEAR.search(text)
+    if match:
+        return _make_date(match.group(3), MONTHS[match.group(1)[:3].lower()], match.group(2))
+    match = DAY_MONTH_YEAR.search(text)
+    if match:
+        return _make_date(match.group(3), MONTHS[match.group(2)[:3].lower()], match.group(1))
+    match = NUMERIC_DATE.search(text)
+    if match:
+        return _make_date(match.group(3), match.group(1), match.group(2))
+    return None
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_relative_date(text, now):
+    """Date of a relative time ("2 hours ago", "yesterday") as seen at `now`; None when not relative"""
+    if not text:
+        return None
+    match = RELATIVE_TIME.search(text)
+    if match:
+        return (now - timedelta(**{match.group(2).lower() + 's': int(match.group(1))})).date()
+    text = text.lower()
+    if 'yesterday' in text or 'a day ago' in text:
+        return (now - timedelta(days=1)).date()
+    if 'today' in text:
+        return now.date()
+    return None
+
+def local_date(value):
+    """Calendar day of a datetime in the sites' timezone (a naive datetime is taken as already local)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(SITE_TZ)
+    return value.date()
+
+def format_date(value):
+    """Format a published date for the output file"""
+    return value.strftime(OUTPUT_DATE_FORMAT) if value else None
+
+def json_default(value):
+    """json.dumps hook: dates are stored as ISO strings in the state files"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def restore_dates(item):
+    """Turn a stored item's published_date back into a date (ISO or older "August 06, 2025" strings)"""
+    if item and isinstance(item.get('published_date'), str):
+        item['published_date'] = parse_date(item['published_date'])
+    return item
+
+class DateWindow:
+    """The run's target dates: the last `days` days up to and including today, fixed at start"""
+
+    def __init__(self, days=DATE_WINDOW_DAYS, now=None):
+        self.now = now or datetime.now()
+        self.today = self.now.date()
+        self.first_day = self.today - timedelta(days=max(1, days) - 1)
+
+    def contains(self, value):
+        """True when a date (or datetime) falls inside the window"""
+        if isinstance(value, datetime):
+            value = value.date()
+        return value is not None and self.first_day <= value <= self.today
+
+    def parse(self, text, relative=False):
+        """Parse a raw date string, optionally accepting relative times measured from the run start"""
+        return parse_date(text) or (parse_relative_date(text, self.now) if relative else None)
+
+    def describe(self):
+        if self.first_day == self.today:
+            return format_date(self.today)
+        return f"{format_date(self.first_day)} - {format_date(self.today)}"
+
+_date_window = None
+_date_window_lock = threading.Lock()
+
+def get_date_window():
+    """Return the process-wide date window (computed on first use, then fixed for the run)"""
+    global _date_window
+    with _date_window_lock:
+        if _date_window is None:
+            _date_window = DateWindow()
+            print(f"📅 Date window: {_date_window.describe()}")
+        return _date_window
+
+def use_date_window(window):
+    """Install a window computed elsewhere (parse workers share their parent run's window)"""
+    global _date_window
+    with _date_window_lock:
+        _date_window = window
+
+def print_summary():
+    """Print how often a raw date string was served from the parse memo"""
+    info = parse_date.cache_info()
+    relative = parse_relative_date.cache_info()
+    print(f"📅 Date parsing: {info.misses + relative.misses} distinct strings parsed, "
+          f"{info.hits + relative.hits} repeat lookups served from the memo")
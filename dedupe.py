@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection - used by the orchestrator across all sources
+The same wire story runs on Inquirer, Philstar and Business Mirror under
+slightly different headlines and excerpts, so exact title matching misses
+it. Each article's normalized title + description is reduced to a MinHash
+signature over its word shingles; the signature is cut into bands and each
+band is looked up in a hash table (locality-sensitive hashing), so an
+insert costs the same however many articles are already indexed. Articles
+whose estimated Jaccard similarity reaches the threshold join one cluster
+(an article without a description is matched on its headline alone), and
+only the cluster's canonical record - the most complete one - is kept. A
+cluster holds at most one article per source, published at most a day
+apart, and never two headlines moving in opposite directions ("Meralco cuts
+power rates" vs "Meralco hikes power rates" share most of their words)
+"""
+import os
+import re
+import unicodedata
+import zlib
+from collections import namedtuple
+
+from enrichment_cache import normalize_text
+
+# Near-duplicate settings (override via environment)
+CROSS_SOURCE_DEDUPE = os.getenv('CROSS_SOURCE_DEDUPE', 'true').lower() == 'true'  # Drop near-duplicate articles across sources before saving
+DEDUPE_THRESHOLD = float(os.getenv('DEDUPE_THRESHOLD', '0.4'))  # Estimated Jaccard similarity of word shingles that counts as the same story
+DEDUPE_TITLE_THRESHOLD = float(os.getenv('DEDUPE_TITLE_THRESHOLD', '0.7'))  # Same, for matching on the title alone (an article without a description)
+DEDUPE_PERMUTATIONS = int(os.getenv('DEDUPE_PERMUTATIONS', '128'))  # MinHash signature length (more = finer similarity estimates, slower)
+DEDUPE_MAX_DAYS_APART = int(os.getenv('DEDUPE_MAX_DAYS_APART', '1'))  # Copies of one story are published at most this many days apart
+DEDUPE_SHINGLE_WORDS = 2  # Words per shingle
+DEDUPE_BUCKET_SIZE = 8  # Clusters remembered per LSH bucket (keeps the work per insert bounded)
+
+WORD = re.compile(r'\w+')
+COMBINING_MARKS = re.compile(r'[\u0300-\u036f]')  # Accents left over by NFKD decomposition
+
+# Headline words that say which way something moved: two headlines that differ in opposite
+# directions are different stories, however many of their other words they share
+RISE_WORDS = frozenset('up rise rises rising rose higher high hike hikes hiked raise raises raised increase increases '
+                       'increased gain gains gained surge surges surged jump jumps jumped climb climbs climbed soar '
+                       'soars soared rebound rebounds rebounded strong stronger robust record expands expand '
+                       'more'.split())
+FALL_WORDS = frozenset('down fall falls falling fell lower low cut cuts cutting slash slashes slashed reduce reduces '
+                       'reduced decrease decreases decreased drop drops dropped dip dips dipped slump slumps slumped '
+                       'decline declines declined sink sinks sank slide slides slid plunge plunges plunged weak '
+                       'weaker trim trims trimmed shrinks shrink less'.split())
+
+# One article as seen by the clustering: its source, headline, description ("" when none) and publication date
+DedupeArticle = namedtuple('DedupeArticle', ['source', 'title', 'description', 'published'])
+
+def shingles(text, size=DEDUPE_SHINGLE_WORDS):
+    """Word shingles of a text: case, accents and punctuation are ignored (one shingle for very short texts)"""
+    text = normalize_text(text).casefold()
+    if not text.isascii():
+        text = COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text))
+    words = WORD.findall(text)
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[start:start + size]) for start in range(len(words) - size + 1)}
+
+def directions(title):
+    """(rise words, fall words) of a headline"""
+    words = set(shingles(title, size=1))
+    return words & RISE_WORDS, words & FALL_WORDS
+
+def opposite_directions(first, second):
+    """True when one headline has a rise word the other lacks while the other has a fall word the first lacks"""
+    (first_rises, first_falls), (second_rises, second_falls) = first, second
+    return bool((first_rises - second_rises and second_falls - first_falls)
+                or (first_falls - second_falls and second_rises - first_rises))
+
+def lsh_bands(threshold, permutations):
+    """(bands, rows per band) whose candidate curve rises just below the threshold
+
+    Two signatures with similarity s share at least one band with probability
+    1 - (1 - s**rows)**bands, which climbs steeply around (1 / bands)**(1 / rows).
+    Keeping that point at or below the threshold favours recall; candidates are
+    checked against the threshold afterwards, so precision does not suffer.
+    """
+    best = (1, permutations)
+    for rows in range(1, permutations + 1):
+        bands = permutations // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+class NearDuplicateIndex:
+    """MinHash LSH index that groups near-identical texts into clusters"""
+
+    def __init__(self, threshold=DEDUPE_THRESHOLD, permutations=DEDUPE_PERMUTATIONS, seed=1):
+        import numpy as np
+
+        self.threshold = threshold
+        self.bands, self.rows = lsh_bands(threshold, permutations)
+        # One hash permutation per signature position: h -> (a * h + b) mod 2**32 with an odd a is a bijection
+        # of the 32-bit shingle hashes, and uint32 arithmetic wraps around for free
+        random = np.random.RandomState(seed)
+        self.multipliers = random.randint(0, 1 << 31, size=(permutations, 1), dtype=np.uint32) * 2 + 1
+        self.offsets = random.randint(0, 1 << 32, size=(permutations, 1), dtype=np.uint64).astype(np.uint32)
+        self.buckets = [{} for _ in range(self.bands)]  # band -> {band bytes: {cluster: member signature}}
+        self.clusters = []  # cluster -> member positions, in insertion order
+        self.stats = {'texts': 0, 'candidates': 0, 'matches': 0}
+
+    def signature(self, text):
+        """MinHash signature of a text's shingles, or None when it has no words"""
+        import numpy as np
+
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles(text)]
+        if not hashes:
+            return None
+        return (self.multipliers * np.array(hashes, dtype=np.uint32) + self.offsets).min(axis=1)
+
+    def similarity(self, first, second):
+        """Estimated Jaccard similarity of two signatures: the share of positions where they agree"""
+        return float((first == second).mean())
+
+    def add(self, text):
+        """Index one text; returns its cluster number (a new cluster when nothing similar was indexed)"""
+        position = self.stats['texts']
+        self.stats['texts'] += 1
+        signature = self.signature(text)
+        if signature is None:
+            self.clusters.append([position])
+            return len(self.clusters) - 1
+
+        raw, width = signature.tobytes(), self.rows * signature.itemsize
+        keys = [raw[band * width:(band + 1) * width] for band in range(self.bands)]
+        entries_of_bands = [bucket.setdefault(key, {}) for bucket, key in zip(self.buckets, keys)]
+        best, best_similarity, checked = None, self.threshold, set()
+        for entries in entries_of_bands:
+            for cluster, other in entries.items():
+                if cluster in checked:
+                    continue
+                checked.add(cluster)
+                similarity = self.similarity(signature, other)
+                if similarity >= best_similarity:
+                    best, best_similarity = cluster, similarity
+        self.stats['candidates'] += len(checked)
+
+        if best is None:
+            best = len(self.clusters)
+            self.clusters.append([position])
+        else:
+            self.stats['matches'] += 1
+            self.clusters[best].append(position)
+        # Every member registers its bands, so a story whose wording drifts from source to source still chains
+        for entries in entries_of_bands:
+            if best not in entries and len(entries) < DEDUPE_BUCKET_SIZE:
+                entries[best] = signature
+        return best
+
+def near_duplicate_clusters(articles, threshold=DEDUPE_THRESHOLD, title_threshold=DEDUPE_TITLE_THRESHOLD,
+                            max_days_apart=DEDUPE_MAX_DAYS_APART):
+    """Clusters (lists of positions) of DedupeArticles that carry the same story
+
+    Articles that both have a description match on title + description. A
+    missing description (a bare listing card next to a feed entry) would halve
+    that similarity, so such an article matches on its title alone, against
+    the stricter title threshold. Two matching articles join only when their
+    clusters have no source in common, span at most max_days_apart days
+    together (an unknown date fits any), and their headlines do not move in
+    opposite directions (checked cluster-wide, so a copy that dropped the
+    direction word cannot bridge a story and its mirror).
+    """
+    full_index = NearDuplicateIndex(threshold=threshold)
+    title_index = NearDuplicateIndex(threshold=title_threshold)
+    parents = list(range(len(articles)))
+    sources = [{article.source} for article in articles]  # Per cluster root
+    days = [(article.published.toordinal(),) * 2 if article.published else None for article in articles]
+    headline_directions = [directions(article.title) for article in articles]  # Per cluster root
+
+    def root(position):
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position = parents[position]
+        return position
+
+    def join(position, other):
+        first, second = root(position), root(other)
+        if first == second or sources[first] & sources[second]:
+            return
+        if opposite_directions(headline_directions[first], headline_directions[second]):
+            return
+        span = days[first] or days[second]
+        if days[first] and days[second]:
+            span = (min(days[first][0], days[second][0]), max(days[first][1], days[second][1]))
+            if span[1] - span[0] > max_days_apart:
+                return
+        parents[second] = first
+        sources[first] |= sources[second]
+        days[first] = span
+        headline_directions[first] = tuple(mine | theirs for mine, theirs in
+                                           zip(headline_directions[first], headline_directions[second]))
+
+    full_members, title_members = {}, {}  # Index cluster -> article positions
+    for position, article in enumerate(articles):
+        if article.description:
+            members = full_members.setdefault(full_index.add(f"{article.title} {article.description}"), [])
+            for other in members:
+                join(other, position)
+            members.append(position)
+        members = title_members.setdefault(title_index.add(article.title), [])
+        for other in members:
+            if not (article.description and articles[other].description):
+                join(other, position)
+        members.append(position)
+
+    clusters = {}
+    for position in range(len(articles)):
+        clusters.setdefault(root(position), []).append(position)
+    return list(clusters.values())
+
+def remove_near_duplicates(collections, description_of, threshold=DEDUPE_THRESHOLD):
+    """Keep one canonical article per cluster of near-duplicates across sources
+
+    collections maps a source name to its article list (in discovery order);
+    returns the same mapping with the other cluster members removed.
+    description_of gives an article's description ("" when it has none). The
+    canonical record is the one with the longest description, then one with a
+    named author; ties go to the article seen first, i.e. to the earlier source.
+    """
+    members = [(source, item) for source, items in collections.items() for item in items]
+    articles = [DedupeArticle(source, item['title'], description_of(item), item.get('published_date'))
+                for source, item in members]
+
+    dropped = set()
+    duplicated = 0
+    for cluster in near_duplicate_clusters(articles, threshold):
+        if len(cluster) < 2:
+            continue
+        canonical = max(cluster, key=lambda position: (len(articles[position].description),
+                                                       bool(members[position][1].get('author')), -position))
+        kept_source, kept_item = members[canonical]
+        for position in cluster:
+            if position != canonical:
+                dropped.add(position)
+                source, item = members[position]
+                print(f"   🧬 {source}: {item['title'][:50]}... duplicates {kept_source}: {kept_item['title'][:50]}...")
+        duplicated += 1
+
+    kept = {source: [] for source in collections}
+    for position, (source, item) in enumerate(members):
+        if position not in dropped:
+            kept[source].append(item)
+    print(f"🧬 Near-duplicates: {len(dropped)} of {len(members)} articles removed "
+          f"({duplicated} stories seen more than once, similarity >= {threshold:.2f})")
+    return kept
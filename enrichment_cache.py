@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Enrichment Cache - shared by the site engine and the sentiment engine
+Remembers category and sentiment results by content fingerprint: a hash of
+the analyzer version, the normalized title + description and the article's
+modified time (its publication date when the page gives none). The same
+story seen again - on the next daily run, in another section or on another
+site - reuses its results instead of being scored and categorized again,
+while an article whose text or modified time changed (or a new keyword
+set, analyzer or library version) gets a new fingerprint and is enriched
+afresh. Persisted between runs next to the crawl state
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+# Directory for state persisted between runs (cached in the GitHub workflow)
+CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache')
+ENRICHMENT_CACHE_PATH = os.path.join(CACHE_DIR, 'enrichment_cache.json')
+ENRICHMENT_CACHE_RETENTION_DAYS = float(os.getenv('ENRICHMENT_CACHE_RETENTION_DAYS', '14'))  # Entries unused this long are dropped
+
+def normalize_text(text):
+    """Text as fingerprinted: Unicode-normalized with whitespace runs collapsed (case is kept, VADER reads it)"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text or '')).strip()
+
+class EnrichmentCache:
+    """Fingerprint-keyed store of enrichment results with per-kind hit statistics"""
+
+    def __init__(self, path=ENRICHMENT_CACHE_PATH, retention_days=ENRICHMENT_CACHE_RETENTION_DAYS):
+        self.path = path
+        self.retention_seconds = retention_days * 86400
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()  # One save at a time, so an older snapshot never replaces a newer one
+        self.entries = {}
+        self.stats = {}  # kind -> {'hits': n, 'misses': n}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            print(f"🧠 Loaded {len(self.entries)} cached enrichment results from {self.path}")
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            print(f"⚠️ Could not read enrichment cache {self.path}: {e}")
+            self.entries = {}
+
+    @staticmethod
+    def fingerprint(version, text, modified=None):
+        """Cache key of one input: analyzer version, normalized text and the article's modified time (or date)"""
+        modified = modified.isoformat() if hasattr(modified, 'isoformat') else (modified or '')
+        data = '\x1f'.join((version, normalize_text(text), modified))
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()[:32]
+
+    def lookup(self, kind, key):
+        """Stored result for a fingerprint, or None; counted as a hit or miss for kind"""
+        with self.lock:
+            entry = self.entries.get(key)
+            counts = self.stats.setdefault(kind, {'hits': 0, 'misses': 0})
+            if entry is None:
+                counts['misses'] += 1
+                return None
+            entry['last_used'] = time.time()
+            counts['hits'] += 1
+            return entry['value']
+
+    def store(self, key, value):
+        with self.lock:
+            self.entries[key] = {'value': value, 'last_used': time.time()}
+
+    def save(self):
+        """Drop entries unused within the retention window and persist the cache atomically"""
+        with self.save_lock:
+            cutoff = time.time() - self.retention_seconds
+            with self.lock:
+                self.entries = {key: entry for key, entry in self.entries.items()
+                                if entry.get('last_used', 0) >= cutoff}
+                data = json.dumps(self.entries, ensure_ascii=False)
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"  # Runs sharing the cache may save together
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"⚠️ Could not save enrichment cache {self.path}: {e}")
+
+    def print_summary(self):
+        """Print the cache hit rate of each kind of enrichment for this run"""
+        with self.lock:
+            stats = {kind: dict(counts) for kind, counts in self.stats.items()}
+        if not stats:
+            return
+        rates = []
+        for kind, counts in stats.items():
+            total = counts['hits'] + counts['misses']
+            rates.append(f"{kind} {counts['hits']}/{total} hits ({counts['hits'] / total:.0%})")
+        print(f"🧠 Enrichment cache: {', '.join(rates)}")
+
+_enrichment_cache = None
+_enrichment_cache_lock = threading.Lock()
+
+def get_enrichment_cache():
+    """Return the process-wide enrichment cache shared by every scraper"""
+    global _enrichment_cache
+    with _enrichment_cache_lock:
+        if _enrichment_cache is None:
+            _enrichment_cache = EnrichmentCache()
+        return _enrichment_cache
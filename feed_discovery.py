@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Feed Discovery - shared by all news scrapers
+Reads RSS/Atom feeds and news sitemaps, which already carry each article's
+URL, title, publication time and often a summary, so articles can be
+discovered in bulk without parsing HTML listing pages or fetching every
+article to learn its date. Sections without a usable feed fall back to the
+HTML path
+"""
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+import http_client
+from fetch_engine import fetch_pages
+from html_parser import parse_html
+from rate_limiter import get_rate_limiter
+from run_deadline import get_run_deadline
+
+# Feed discovery settings (override via environment)
+FEED_DISCOVERY_ENABLED = os.getenv('FEED_DISCOVERY', 'true').lower() not in ('0', 'false', 'no')
+FEED_TIMEOUT = float(os.getenv('FEED_TIMEOUT', '15'))
+
+FEED_HEADERS = {
+    'Accept': 'application/rss+xml,application/atom+xml,application/xml;q=0.9,text/xml;q=0.8,*/*;q=0.5',
+}
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+NEWS_NS = '{http://www.google.com/schemas/sitemap-news/0.9}'
+
+# One discovered article: published is a datetime (or None when the feed has no date), updated the
+# raw last-modified timestamp ('' when the feed has none)
+FeedEntry = namedtuple('FeedEntry', ['url', 'title', 'published', 'summary', 'updated'])
+
+def parse_feed_date(text):
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom, sitemap) timestamp; None when unparseable"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+def clean_summary(text, limit=200):
+    """Strip markup from a feed summary and shorten it like the scrapers' descriptions"""
+    if not text:
+        return ""
+    if '<' in text:
+        text = parse_html(text).get_text(' ', strip=True)
+    text = re.sub(r'\s+', ' ', text).strip()
+    # WordPress appends "The post ... appeared first on ..." to every excerpt
+    text = re.sub(r'\s*The post .* appeared first on .*$', '', text)
+    return text[:limit] + "..." if len(text) > limit else text
+
+def _text(element, path):
+    found = element.find(path)
+    return found.text.strip() if found is not None and found.text else ''
+
+def _parse_rss(root):
+    entries = []
+    for item in root.iter('item'):
+        url = _text(item, 'link') or _text(item, 'guid')
+        title = _text(item, 'title')
+        published = parse_feed_date(_text(item, 'pubDate') or _text(item, f'{DC_NS}date'))
+        entries.append(FeedEntry(url, title, published, _text(item, 'description'), _text(item, f'{ATOM_NS}updated')))
+    return entries
+
+def _parse_atom(root):
+    entries = []
+    for entry in root.iter(f'{ATOM_NS}entry'):
+        url = ''
+        for link in entry.findall(f'{ATOM_NS}link'):
+            if link.get('rel', 'alternate') == 'alternate' and link.get('href'):
+                url = link.get('href')
+                break
+        title = _text(entry, f'{ATOM_NS}title')
+        published = parse_feed_date(_text(entry, f'{ATOM_NS}published') or _text(entry, f'{ATOM_NS}updated'))
+        summary = _text(entry, f'{ATOM_NS}summary') or _text(entry, f'{ATOM_NS}content')
+        entries.append(FeedEntry(url, title, published, summary, _text(entry, f'{ATOM_NS}updated')))
+    return entries
+
+def _parse_news_sitemap(root):
+    entries = []
+    for url_element in root.iter(f'{SITEMAP_NS}url'):
+        url = _text(url_element, f'{SITEMAP_NS}loc')
+        title = _text(url_element, f'{NEWS_NS}news/{NEWS_NS}title')
+        published = parse_feed_date(_text(url_element, f'{NEWS_NS}news/{NEWS_NS}publication_date')
+                                    or _text(url_element, f'{SITEMAP_NS}lastmod'))
+        entries.append(FeedEntry(url, title, published, '', _text(url_element, f'{SITEMAP_NS}lastmod')))
+    return entries
+
+def parse_feed(content):
+    """Parse RSS 2.0, Atom or a news sitemap into FeedEntry items
+
+    Returns None when the document is not a feed (e.g. an HTML error page),
+    so callers can fall back to scraping the section's HTML.
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return None
+
+    if root.tag == 'rss' or root.tag.endswith('RDF'):
+        entries = _parse_rss(root)
+    elif root.tag == f'{ATOM_NS}feed':
+        entries = _parse_atom(root)
+    elif root.tag == f'{SITEMAP_NS}urlset':
+        entries = _parse_news_sitemap(root)
+    else:
+        return None
+
+    return [entry for entry in entries if entry.url and entry.title]
+
+def fetch_feed(url, headers=None):
+    """Fetch and parse one feed URL; None when the site does not serve a usable feed there"""
+    request_headers = dict(FEED_HEADERS)
+    request_headers.update(headers or {})
+    try:
+        get_rate_limiter().wait(url)
+        response = http_client.get(url, headers=request_headers, timeout=FEED_TIMEOUT)
+    except Exception as e:
+        print(f"  ⚠️ Feed {url} unavailable: {e}")
+        return None
+
+    if response.status_code != 200:
+        print(f"  ⚠️ Feed {url} returned status {response.status_code}")
+        return None
+    return parse_feed(response.content)
+
+def discover_sections(section_feeds, headers=None):
+    """Read the feeds of several sections concurrently
+
+    section_feeds maps each section URL to a list of candidate feed URLs, tried
+    in order. Returns {section URL: [FeedEntry, ...] or None}; None means no
+    candidate produced a feed and the section should be scraped from HTML.
+    """
+    if not FEED_DISCOVERY_ENABLED:
+        return {section: None for section in section_feeds}
+
+    def discover(section):
+        for feed_url in section_feeds[section]:
+            if get_run_deadline().crawl_expired():
+                return None
+            entries = fetch_feed(feed_url, headers=headers)
+            if entries is not None:
+                return entries
+        return None
+
+    sections = list(section_feeds)
+    results = fetch_pages(sections, discover)
+
+    discovered = dict(zip(sections, results))
+    for section, entries in discovered.items():
+        if entries is None:
+            print(f"  📡 No feed for {section}, falling back to HTML listing")
+        else:
+            print(f"  📡 Feed for {section}: {len(entries)} articles")
+    return discovered
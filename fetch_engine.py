@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Asyncio Fetch Engine - shared by all news scrapers
+Fetches lists of URLs concurrently with bounded concurrency per host
+and hands the responses back in the same order they were submitted
+"""
+import asyncio
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from circuit_breaker import get_circuit_breaker
+
+# Maximum number of in-flight requests per host (override via environment)
+MAX_CONCURRENCY_PER_HOST = int(os.getenv('FETCH_CONCURRENCY_PER_HOST', '3'))
+
+# Outcome of one worker-pool job: error is None on success, "timeout" or the exception text otherwise
+WorkResult = namedtuple('WorkResult', ['item', 'value', 'error', 'elapsed'])
+
+def get_host(url):
+    """Return the lower-cased host name of a URL"""
+    return urlparse(url).netloc.lower()
+
+async def _fetch_one(url, fetch_func, semaphore, delay_range):
+    """Fetch a single URL while holding its host's concurrency slot"""
+    async with semaphore:
+        # The blocking fetch runs in a worker thread so other hosts keep going
+        response = await asyncio.to_thread(fetch_func, url)
+        if delay_range:
+            # Keep the slot during the politeness delay so per-host spacing is preserved
+            await asyncio.sleep(random.uniform(*delay_range))
+        return response
+
+async def _fetch_all(urls, fetch_func, max_per_host, delay_range):
+    """Schedule every URL and gather the results in submission order"""
+    semaphores = {}
+    for url in urls:
+        host = get_host(url)
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(max_per_host)
+
+    tasks = [
+        _fetch_one(url, fetch_func, semaphores[get_host(url)], delay_range)
+        for url in urls
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+def fetch_pages(urls, fetch_func, max_per_host=None, delay_range=None):
+    """Fetch all URLs concurrently and return their responses in order
+
+    fetch_func is called as fetch_func(url) from a worker thread and should
+    return a response or None. Failed fetches are returned as None so callers
+    can keep their existing "response is None" handling. Request spacing is
+    left to the per-host rate limiter; delay_range adds an optional extra pause.
+    """
+    if not urls:
+        return []
+
+    max_per_host = max_per_host or MAX_CONCURRENCY_PER_HOST
+    hosts = {get_host(url) for url in urls}
+    print(f"⚡ Fetching {len(urls)} pages from {len(hosts)} host(s) (max {max_per_host} concurrent per host)...")
+
+    start_time = time.time()
+    results = asyncio.run(_fetch_all(urls, fetch_func, max_per_host, delay_range))
+    elapsed = time.time() - start_time
+
+    responses = []
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(f"  ❌ Error fetching {url}: {result}")
+            responses.append(None)
+        else:
+            responses.append(result)
+
+    # Deferred retry pass: pages that failed with a retryable error get one more try now that the
+    # rest of the batch is done and their hosts have cooled down (each retry spends the run budget)
+    breaker = get_circuit_breaker()
+    deferred = [url for url in breaker.pop_deferred([url for url, response in zip(urls, responses) if response is None])
+                if breaker.spend_retry()]
+    if deferred:
+        print(f"🔁 Retrying {len(deferred)} deferred page(s)...")
+        retry_results = asyncio.run(_fetch_all(deferred, fetch_func, max_per_host, delay_range))
+        recovered = 0
+        for url, result in zip(deferred, retry_results):
+            if result is None or isinstance(result, BaseException):
+                continue
+            recovered += 1
+            for index, original_url in enumerate(urls):
+                if original_url == url:
+                    responses[index] = result
+        breaker.record_deferred_recovered(recovered)
+        elapsed = time.time() - start_time
+
+    succeeded = sum(1 for response in responses if response is not None)
+    print(f"⚡ Fetched {succeeded}/{len(urls)} pages in {elapsed:.1f}s")
+    return responses
+
+async def _run_job(item, worker, semaphore, executor, timeout):
+    """Run one worker job in a thread, recording its outcome instead of raising"""
+    async with semaphore:
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        try:
+            value = await asyncio.wait_for(loop.run_in_executor(executor, worker, item), timeout)
+            return WorkResult(item, value, None, time.time() - start_time)
+        except asyncio.TimeoutError:
+            return WorkResult(item, None, 'timeout', time.time() - start_time)
+        except Exception as e:
+            return WorkResult(item, None, str(e) or type(e).__name__, time.time() - start_time)
+
+async def _run_all_jobs(items, worker, concurrency, executor, timeout):
+    """Schedule every job on a shared pool and gather the results in order"""
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*[
+        _run_job(item, worker, semaphore, executor, timeout) for item in items
+    ])
+
+def run_worker_pool(items, worker, concurrency, timeout=None):
+    """Run worker(item) for every item on a pool of `concurrency` workers
+
+    Returns one WorkResult per item in the original item order. Exceptions and
+    timeouts are captured per item so a single bad URL never aborts the batch.
+    """
+    if not items:
+        return []
+
+    concurrency = max(1, concurrency)
+    print(f"⚙️ Running {len(items)} jobs on a pool of {concurrency} workers...")
+    start_time = time.time()
+
+    # A dedicated executor lets us walk away from timed-out jobs instead of joining them
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        results = asyncio.run(_run_all_jobs(items, worker, concurrency, executor, timeout))
+    finally:
+        executor.shutdown(wait=False)
+
+    failed = sum(1 for result in results if result.error)
+    print(f"⚙️ Finished {len(items)} jobs in {time.time() - start_time:.1f}s ({failed} failed)")
+    return results
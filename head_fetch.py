@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Head-Only Streaming Fetch - shared by the article date lookups
+Streams an article page and stops downloading as soon as the publication
+date can be read from the part received so far (normally the <head> with
+its article:published_time meta tag), instead of downloading the whole
+page just to read one tag near the top. Pages whose date is not in the
+first HEAD_FETCH_MAX_BYTES are downloaded in full as before
+"""
+import os
+import threading
+import time
+
+import http_client
+from fetch_engine import get_host
+from rate_limiter import get_rate_limiter
+from response_cache import get_response_cache
+
+# Head fetch settings (override via environment)
+HEAD_FETCH_ENABLED = os.getenv('HEAD_FETCH', 'true').lower() not in ('0', 'false', 'no')
+HEAD_FETCH_MAX_BYTES = int(os.getenv('HEAD_FETCH_MAX_BYTES', '65536'))
+HEAD_FETCH_CHUNK_SIZE = 8192
+
+class HeadFetcher:
+    """Streaming date lookups with per-host bytes-saved and time-to-date statistics"""
+
+    def __init__(self, max_bytes=HEAD_FETCH_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.host_stats = {}
+
+    def _record(self, url, resolved, bytes_read, bytes_saved, elapsed):
+        with self.lock:
+            stats = self.host_stats.setdefault(get_host(url), {
+                'fetches': 0, 'resolved_early': 0, 'bytes_read': 0, 'bytes_saved': 0, 'time_to_date': 0.0
+            })
+            stats['fetches'] += 1
+            stats['bytes_read'] += bytes_read
+            if resolved:
+                stats['resolved_early'] += 1
+                stats['bytes_saved'] += bytes_saved
+                stats['time_to_date'] += elapsed
+
+    def fetch_date(self, url, extract_date, headers=None, timeout=10):
+        """Return (date, content) for an article page
+
+        extract_date(markup_bytes) is called on the received prefix once the
+        </head> has arrived, and again after each further chunk up to the byte
+        cap. When it returns a date the download stops and content is None.
+        Otherwise the rest of the page is read and returned as content (None
+        when the page could not be fetched) so the caller can run its
+        full-page fallbacks.
+        """
+        cached = get_response_cache().get(url)
+        if cached is not None:
+            return None, cached.content
+
+        if not HEAD_FETCH_ENABLED:
+            get_rate_limiter().wait(url)
+            response = http_client.get(url, headers=headers, timeout=timeout)
+            get_response_cache().put(url, response)
+            return None, response.content if response.status_code == 200 else None
+
+        start_time = time.time()
+        get_rate_limiter().wait(url)
+        response = http_client.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            if response.status_code != 200:
+                return None, None
+
+            received = bytearray()
+            head_seen = False
+            for chunk in response.iter_content(chunk_size=HEAD_FETCH_CHUNK_SIZE):
+                received.extend(chunk)
+                if not head_seen:
+                    head_seen = b'</head>' in received.lower()
+                if head_seen or len(received) >= self.max_bytes:
+                    date = extract_date(bytes(received))
+                    if date:
+                        # Stop the download here; the connection is dropped instead of drained
+                        content_length = int(response.headers.get('Content-Length') or 0)
+                        bytes_read = response.raw.tell()
+                        self._record(url, True, bytes_read, max(0, content_length - bytes_read), time.time() - start_time)
+                        return date, None
+                if len(received) >= self.max_bytes:
+                    break
+
+            # Date not near the top: read the rest so the caller gets the full page
+            for chunk in response.iter_content(chunk_size=HEAD_FETCH_CHUNK_SIZE):
+                received.extend(chunk)
+            self._record(url, False, response.raw.tell(), 0, 0.0)
+
+            # Store it like any other full download so later lookups skip the network
+            response._content = bytes(received)
+            get_response_cache().put(url, response)
+            return None, response._content
+        finally:
+            response.close()
+
+    def print_summary(self):
+        """Print bytes saved and mean time-to-date per host"""
+        if not self.host_stats:
+            return
+
+        print("✂️ Head-only date fetches:")
+        for host, stats in sorted(self.host_stats.items()):
+            mean_time = (stats['time_to_date'] / stats['resolved_early']) if stats['resolved_early'] else 0.0
+            print(f"   {host}: {stats['resolved_early']}/{stats['fetches']} dates found in the head, "
+                  f"{stats['bytes_read'] / 1024:.0f} KB read, ~{stats['bytes_saved'] / 1024:.0f} KB not downloaded, "
+                  f"{mean_time:.2f}s mean time to date")
+
+_head_fetcher = None
+_head_fetcher_lock = threading.Lock()
+
+def get_head_fetcher():
+    """Return the process-wide head fetcher shared by every scraper"""
+    global _head_fetcher
+    with _head_fetcher_lock:
+        if _head_fetcher is None:
+            _head_fetcher = HeadFetcher()
+        return _head_fetcher
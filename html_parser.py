@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Backend - shared by all news scrapers
+Parses pages with the fastest available BeautifulSoup tree builder (lxml
+when installed, the pure-Python html.parser otherwise) straight from the
+response bytes, and can build only the elements an extraction needs
+(e.g. just the anchors of a listing page or the <meta> tags of an article)
+"""
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401 - only needed as the BeautifulSoup tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Parser backend (override via environment): "lxml" or "html.parser"
+HTML_PARSER = os.getenv('HTML_PARSER', 'lxml' if LXML_AVAILABLE else 'html.parser')
+if HTML_PARSER == 'lxml' and not LXML_AVAILABLE:
+    print("Note: lxml not available, falling back to html.parser. Install with: pip install lxml")
+    HTML_PARSER = 'html.parser'
+
+# Strainers for partial parsing: only matching elements (and their children) are built
+ANCHORS = SoupStrainer('a')
+METADATA_TAGS = SoupStrainer(['meta', 'time', 'script'])  # Structured metadata incl. JSON-LD
+
+def parse_html(markup, only=None):
+    """Parse a page with the configured backend
+
+    Pass response.content (bytes) rather than response.text so the page is not
+    decoded twice; the parser detects the charset itself. only takes one of the
+    strainers above to build a partial tree.
+    """
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=only)
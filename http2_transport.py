@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+HTTP/2 Transport - optional backend for the shared HTTP client
+A requests transport adapter that sends requests through httpx with HTTP/2,
+so the listing and article requests to a host are multiplexed as streams
+over one connection with HPACK header compression instead of queueing for
+a handful of HTTP/1.1 keep-alive connections. Callers keep using the same
+requests session and responses; hosts that do not negotiate h2 are served
+over HTTP/1.1 by the same client
+"""
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx only speaks HTTP/2 when h2 is installed
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection-specific headers are not allowed in HTTP/2 (RFC 9113 section 8.2.2)
+HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'}
+
+def _to_httpx_timeout(timeout):
+    """Translate a requests timeout (seconds or a (connect, read) tuple) to httpx"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+    return httpx.Timeout(timeout)
+
+def _to_requests_error(error, request):
+    """Map an httpx exception to the requests exception callers already catch"""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.ReadTimeout(error, request=request)
+    if isinstance(error, httpx.TransportError):
+        return requests.exceptions.ConnectionError(error, request=request)
+    return requests.exceptions.RequestException(error, request=request)
+
+class HTTP2Body:
+    """File-like body of a streamed httpx response, used as requests' Response.raw"""
+
+    def __init__(self, response, request, loop):
+        self.response = response
+        self.request = request
+        self.loop = loop
+        self.chunks = None
+        self.buffer = b''
+
+    def _next_chunk(self, chunk_size):
+        """Read the next decoded chunk on the transport's event loop; None at the end"""
+        if self.chunks is None:
+            self.chunks = self.response.aiter_bytes(chunk_size)
+        try:
+            return asyncio.run_coroutine_threadsafe(self.chunks.__anext__(), self.loop).result()
+        except StopAsyncIteration:
+            return None
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ChunkedEncodingError(e, request=self.request)
+
+    def stream(self, chunk_size=8192, decode_content=True):
+        """Yield the decoded body (requests' iter_content reads through this)"""
+        if self.buffer:
+            yield self.buffer
+            self.buffer = b''
+        while True:
+            chunk = self._next_chunk(chunk_size)
+            if chunk is None:
+                return
+            yield chunk
+
+    def read(self, amt=None):
+        while amt is None or len(self.buffer) < amt:
+            chunk = self._next_chunk(amt)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if amt is None:
+            data, self.buffer = self.buffer, b''
+        else:
+            data, self.buffer = self.buffer[:amt], self.buffer[amt:]
+        return data
+
+    def tell(self):
+        """Bytes received from the network so far (before decompression, like urllib3)"""
+        return self.response.num_bytes_downloaded
+
+    def close(self):
+        if not self.response.is_closed and not self.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.response.aclose(), self.loop).result()
+
+    def release_conn(self):
+        self.close()
+
+class HTTP2Adapter(BaseAdapter):
+    """requests adapter backed by one httpx client with HTTP/2 enabled
+
+    The httpx client runs on its own event loop thread and every worker thread
+    hands its request to that loop, so all requests to a host share one
+    connection whose state is only ever touched from a single thread.
+    prior_knowledge=True speaks HTTP/2 straight away without TLS/ALPN (h2c),
+    which is only useful against a local stand-in server such as the one in
+    benchmarks/http2_transport_benchmark.py.
+    """
+
+    def __init__(self, max_connections=10, retries=0, prior_knowledge=False):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.host_stats = {}
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name='http2-transport', daemon=True).start()
+
+        async def create_client():
+            transport = httpx.AsyncHTTPTransport(http1=not prior_knowledge, http2=True, retries=retries,
+                                                 limits=httpx.Limits(max_connections=max_connections))
+            # The requests session handles redirects itself
+            return httpx.AsyncClient(transport=transport, follow_redirects=False)
+
+        self.client = self._run(create_client())
+
+    def _run(self, coroutine):
+        """Run a coroutine on the transport's event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        headers = [(name, value) for name, value in request.headers.items()
+                   if name.lower() not in HOP_BY_HOP_HEADERS]
+
+        async def send_request():
+            httpx_request = self.client.build_request(request.method, request.url, headers=headers,
+                                                      content=request.body, timeout=_to_httpx_timeout(timeout))
+            httpx_response = await self.client.send(httpx_request, stream=True)
+            if not stream:
+                # Read the whole body on the loop instead of handing it over chunk by chunk
+                try:
+                    await httpx_response.aread()
+                finally:
+                    await httpx_response.aclose()
+            return httpx_response
+
+        try:
+            httpx_response = self._run(send_request())
+        except httpx.HTTPError as e:
+            raise _to_requests_error(e, request)
+
+        self._record(request.url, httpx_response.http_version)
+        response = self.build_response(request, httpx_response)
+        if not stream:
+            response._content = httpx_response.content
+            response._content_consumed = True
+        return response
+
+    def build_response(self, request, httpx_response):
+        """Wrap an httpx response in a requests.Response"""
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        headers = CaseInsensitiveDict()
+        for name, value in httpx_response.headers.multi_items():
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        response.reason = httpx_response.reason_phrase
+        response.raw = HTTP2Body(httpx_response, request, self.loop)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def _record(self, url, http_version):
+        with self.lock:
+            stats = self.host_stats.setdefault(urlparse(url).netloc.lower(), {})
+            stats[http_version] = stats.get(http_version, 0) + 1
+
+    def close(self):
+        if self.loop.is_running():
+            self._run(self.client.aclose())
+            self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Shared Pooled HTTP Client - used by every scraper and helper
+One process-wide requests.Session with a tuned connection pool per host,
+so listing pages, article pages and webhooks all reuse keep-alive
+connections instead of opening a new TCP+TLS connection per request.
+With HTTP_TRANSPORT=http2 HTTPS requests go through the HTTP/2 adapter
+instead, which multiplexes every request to a host over one connection
+"""
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from circuit_breaker import get_circuit_breaker, CircuitOpenError, RETRYABLE_STATUSES
+
+# Connection pool settings (override via environment)
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # Hosts with a cached pool
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '8'))  # Connections kept open per host
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '10'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+HTTP_KEEP_ALIVE = os.getenv('HTTP_KEEP_ALIVE', 'true').lower() not in ('0', 'false', 'no')
+HTTP_ADAPTER_RETRIES = int(os.getenv('HTTP_ADAPTER_RETRIES', '2'))  # Connection-level retries per request
+
+# Transport (override via environment): "http1" (requests/urllib3) or "http2" (httpx, HTTPS only)
+HTTP_TRANSPORT = os.getenv('HTTP_TRANSPORT', 'http1').lower()
+if HTTP_TRANSPORT == 'http2':
+    # httpx is only imported when selected (it is a noticeable part of the start-up time)
+    from http2_transport import HTTP2Adapter, HTTP2_AVAILABLE
+if HTTP_TRANSPORT == 'http2' and not HTTP2_AVAILABLE:
+    print("Note: httpx[http2] not available, falling back to HTTP/1.1. Install with: pip install 'httpx[http2]'")
+    HTTP_TRANSPORT = 'http1'
+
+# Browser-like headers shared by every request (per-site Referer is sent per request)
+BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9,fil;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+def _create_session():
+    """Build the pooled session with the CI/CD retry strategy"""
+    session = requests.Session()
+
+    # Connection-level retries only: blocked/throttled statuses (403, 429, 5xx) are retried by
+    # the callers against the run-wide retry budget and per-host circuit breaker, not here
+    retry_strategy = Retry(
+        total=HTTP_ADAPTER_RETRIES,
+        backoff_factor=0.5,
+        allowed_methods=["HEAD", "GET", "POST"],
+        respect_retry_after_header=False  # Otherwise urllib3 retries 429/503 itself
+    )
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    if HTTP_TRANSPORT == 'http2':
+        # One multiplexed connection per host is the point, so the per-host pool size does not apply
+        session.mount("https://", HTTP2Adapter(max_connections=HTTP_POOL_CONNECTIONS, retries=HTTP_ADAPTER_RETRIES))
+    else:
+        session.mount("https://", adapter)
+
+    session.headers.update(BASE_HEADERS)
+    session.headers['Connection'] = 'keep-alive' if HTTP_KEEP_ALIVE else 'close'
+    return session
+
+def get_session():
+    """Return the process-wide pooled session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _create_session()
+            if HTTP_TRANSPORT == 'http2':
+                print("🔌 Shared HTTP client ready (HTTP/2 transport, one multiplexed connection per host)")
+            else:
+                print(f"🔌 Shared HTTP client ready (pool: {HTTP_POOL_CONNECTIONS} hosts x {HTTP_POOL_MAXSIZE} connections, "
+                      f"keep-alive {'on' if HTTP_KEEP_ALIVE else 'off'})")
+        return _session
+
+def get(url, **kwargs):
+    """GET through the shared pool with the configured default timeouts
+
+    Fails fast with CircuitOpenError while the host's circuit is open, and
+    reports every outcome to the circuit breaker.
+    """
+    breaker = get_circuit_breaker()
+    if not breaker.allow(url):
+        raise CircuitOpenError(f"Circuit open for {url}")
+
+    kwargs.setdefault('timeout', (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+    try:
+        response = get_session().get(url, **kwargs)
+    except requests.exceptions.RequestException:
+        breaker.record_failure(url)
+        raise
+
+    if response.status_code in RETRYABLE_STATUSES:
+        breaker.record_failure(url)
+    else:
+        breaker.record_success(url)
+    return response
+
+def post(url, **kwargs):
+    """POST through the shared pool with the configured default timeouts"""
+    kwargs.setdefault('timeout', (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+    return get_session().post(url, **kwargs)
+
+def connection_stats():
+    """Return {host: (requests, new_connections)} for every pool still held by the client"""
+    stats = {}
+    if _session is None:
+        return stats
+
+    for adapter in set(_session.adapters.values()):
+        if not isinstance(adapter, HTTPAdapter):
+            continue  # The HTTP/2 adapter keeps its own per-host statistics
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_made, connections = stats.get(pool.host, (0, 0))
+            stats[pool.host] = (requests_made + pool.num_requests, connections + pool.num_connections)
+    return stats
+
+def http2_stats():
+    """Return {host: {http_version: requests}} for requests sent through the HTTP/2 adapter"""
+    stats = {}
+    if _session is None or HTTP_TRANSPORT != 'http2':
+        return stats
+
+    for adapter in set(_session.adapters.values()):
+        if isinstance(adapter, HTTP2Adapter):
+            stats.update(adapter.host_stats)
+    return stats
+
+def print_connection_stats():
+    """Print how well connections were reused per host during this run"""
+    stats = connection_stats()
+    multiplexed = http2_stats()
+    if not stats and not multiplexed:
+        return
+
+    print("🔌 HTTP connection reuse:")
+    for host, (requests_made, connections) in sorted(stats.items()):
+        reused = max(0, requests_made - connections)
+        reuse_rate = (reused / requests_made * 100) if requests_made else 0.0
+        print(f"   {host}: {requests_made} requests over {connections} connection(s) ({reuse_rate:.0f}% reused)")
+    for host, versions in sorted(multiplexed.items()):
+        breakdown = ', '.join(f"{count} over {version}" for version, count in sorted(versions.items()))
+        print(f"   {host}: {breakdown}")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Listing Page Index - shared by the site engine's listing extraction
+Walks a parsed listing page once, testing every element against the
+site's link selectors and its card field selectors (excerpt, category,
+author, date, title). Each field match is recorded as the first match of
+that selector under every ancestor, so the per-link lookups ("first
+excerpt inside the link's card, else one level up") become dictionary
+reads instead of a select per link, per ancestor level and per selector.
+The plain selectors site definitions use (tag, .class, [attr*="value"]
+compounds joined by descendant spaces) are matched by small compiled
+predicates; anything else goes through soupsieve
+"""
+import re
+
+from bs4 import Tag
+
+COMPOUND = re.compile(r'([a-z][a-z0-9-]*|\*)?((?:\.[\w-]+)*)((?:\[[\w-]+(?:[*^$]?="[^"\s]*")?\])*)', re.IGNORECASE)
+ATTRIBUTE = re.compile(r'\[([\w-]+)(?:([*^$]?=)"([^"]*)")?\]')
+
+CLASSED = '.'  # Dispatch key of selectors that only match elements carrying a class attribute
+
+def _compile_compound(text):
+    """(dispatch key, predicate) for one compound selector (tag, classes, attribute tests); None when unsupported
+
+    The key is the required tag name, else CLASSED when the compound tests the
+    class attribute, else None (any element).
+    """
+    match = COMPOUND.fullmatch(text)
+    if not match or not text:
+        return None
+    name = match.group(1).lower() if match.group(1) and match.group(1) != '*' else None
+    classes = [part for part in match.group(2).split('.') if part]
+    attributes = ATTRIBUTE.findall(match.group(3))
+
+    def matches(element):
+        if name is not None and element.name != name:
+            return False
+        if classes:
+            element_classes = element.get('class') or ()
+            if not all(class_name in element_classes for class_name in classes):
+                return False
+        for attribute, operator, value in attributes:
+            actual = element.get(attribute)
+            if actual is None:
+                return False
+            if isinstance(actual, list):
+                actual = ' '.join(actual)  # Multi-valued attributes (class, rel) compare as written
+            if (operator == '=' and actual != value or operator == '*=' and value not in actual
+                    or operator == '^=' and not actual.startswith(value)
+                    or operator == '$=' and not actual.endswith(value)):
+                return False
+        return True
+    if name is None and (classes or any(attribute == 'class' for attribute, _, _ in attributes)):
+        return CLASSED, matches
+    return name, matches
+
+def compile_matcher(selector, compiled):
+    """(dispatch key, predicate) for a selector
+
+    Descendant-only selectors of simple compounds get a fast predicate; anything
+    else uses the soupsieve matcher. The key of the last compound (its tag name,
+    or CLASSED) lets the index skip the predicate for elements that cannot match.
+    """
+    compounds = [_compile_compound(part) for part in selector.split()]
+    if not compounds or any(compound is None for compound in compounds):
+        return None, compiled.match
+    name, last = compounds[-1]
+    ancestors = [predicate for _, predicate in compounds[:-1]]
+
+    def matches(element):
+        if not last(element):
+            return False
+        # Descendant combinators only: match the remaining compounds on the nearest ancestors, right to left
+        parent = element.parent
+        for compound in reversed(ancestors):
+            while parent is not None and not (isinstance(parent, Tag) and compound(parent)):
+                parent = parent.parent
+            if parent is None:
+                return False
+            parent = parent.parent
+        return True
+    return name, matches
+
+class ListingIndex:
+    """Link lists and per-element first matches for one listing page, built in one walk
+
+    link_selectors is a list of (selector, compiled) pairs whose matches are
+    collected per selector in document order. field_selectors maps a field name
+    to its (selector, compiled) pairs in priority order.
+    """
+
+    def __init__(self, soup, link_selectors, field_selectors):
+        self.links = [[] for _ in link_selectors]
+        self.document_links = []  # Elements matching any link selector, in document order
+        self.first = {}  # id(ancestor) -> {(field, selector position): first matching descendant}
+        self.texts = {}
+
+        # Matchers grouped by dispatch key (tag name, CLASSED or None for any element), in priority order
+        link_matchers = {}
+        for position, (selector, compiled) in enumerate(link_selectors):
+            name, matches = compile_matcher(selector, compiled)
+            link_matchers.setdefault(name, []).append((position, matches))
+        field_matchers = {}
+        for field, selectors in field_selectors.items():
+            for position, (selector, compiled) in enumerate(selectors):
+                name, matches = compile_matcher(selector, compiled)
+                field_matchers.setdefault(name, []).append(((field, position), matches))
+        any_link, any_field = link_matchers.get(None, []), field_matchers.get(None, [])
+        classed_link = link_matchers.get(CLASSED, []) + any_link
+        classed_field = field_matchers.get(CLASSED, []) + any_field
+
+        for element in soup.find_all(True):
+            classed = 'class' in element.attrs
+            matched_link = False
+            for position, matches in link_matchers.get(element.name, []) + (classed_link if classed else any_link):
+                if matches(element):
+                    self.links[position].append(element)
+                    matched_link = True
+            if matched_link:
+                self.document_links.append(element)
+
+            for key, matches in field_matchers.get(element.name, []) + (classed_field if classed else any_field):
+                if not matches(element):
+                    continue
+                for ancestor in element.parents:
+                    found = self.first.setdefault(id(ancestor), {})
+                    if key in found:
+                        break  # An earlier element already holds this ancestor and everything above it
+                    found[key] = element
+
+    def first_match(self, scope, field, position):
+        """First descendant of scope matching the field's selector at position (like select_one), or None"""
+        return self.first.get(id(scope), {}).get((field, position))
+
+    def text(self, element, separator=''):
+        """Element text (a <meta> tag's content), computed once per element"""
+        key = (id(element), separator)
+        if key not in self.texts:
+            if element.name == 'meta':
+                self.texts[key] = (element.get('content') or '').strip()
+            elif separator:
+                self.texts[key] = element.get_text(separator)
+            else:
+                self.texts[key] = element.get_text(strip=True)
+        return self.texts[key]
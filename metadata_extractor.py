@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Structured Metadata Extractor - shared by the article page lookups
+Reads an article's title, description, author, publication date and
+modified time in one walk over its <head> meta and JSON-LD tags (schema.org
+NewsArticle, OpenGraph, article:* and the common name= tags) instead of a
+separate selector pass per field. The site's DOM selectors run only for
+the fields still missing afterwards, and the source each field came from
+is counted for the run summary
+"""
+import json
+import re
+import threading
+from collections import namedtuple
+
+from date_engine import parse_date
+
+# One article's metadata: sources maps each resolved field to where it came from
+ArticleMetadata = namedtuple('ArticleMetadata', ['title', 'description', 'author', 'published', 'modified', 'sources'])
+FIELDS = ('title', 'description', 'author', 'published', 'modified')
+
+# schema.org types whose JSON-LD object describes the article itself
+ARTICLE_TYPES = {'newsarticle', 'article', 'reportagenewsarticle', 'analysisnewsarticle', 'opinionnewsarticle',
+                 'backgroundnewsarticle', 'reviewnewsarticle', 'blogposting'}
+
+# <meta> key (property, name or itemprop) -> (field, rank, source); a lower rank wins, JSON-LD is rank 0
+META_FIELDS = {
+    'og:title': ('title', 1, 'opengraph'),
+    'twitter:title': ('title', 2, 'meta'),
+    'og:description': ('description', 1, 'opengraph'),
+    'description': ('description', 2, 'meta'),
+    'twitter:description': ('description', 3, 'meta'),
+    'article:author': ('author', 1, 'article-meta'),
+    'author': ('author', 2, 'meta'),
+    'parsely-author': ('author', 3, 'meta'),
+    'dc.creator': ('author', 3, 'meta'),
+    'article:published_time': ('published', 1, 'article-meta'),
+    'og:published_time': ('published', 2, 'opengraph'),
+    'datepublished': ('published', 2, 'meta'),
+    'pubdate': ('published', 3, 'meta'),
+    'publish_date': ('published', 3, 'meta'),
+    'publication_date': ('published', 3, 'meta'),
+    'parsely-pub-date': ('published', 3, 'meta'),
+    'dc.date': ('published', 3, 'meta'),
+    'date': ('published', 3, 'meta'),
+    'og:updated_time': ('published', 4, 'opengraph'),
+}
+
+# <meta> keys of the last-modified time (kept as the raw timestamp): key -> (rank, source)
+MODIFIED_META = {
+    'article:modified_time': (1, 'article-meta'),
+    'og:updated_time': (2, 'opengraph'),
+    'datemodified': (2, 'meta'),
+    'last-modified': (3, 'meta'),
+}
+
+def _clean(value):
+    return re.sub(r'\s+', ' ', value).strip() if isinstance(value, str) else ''
+
+def _author_names(value):
+    """Author name(s) from a JSON-LD author (string, Person object or a list of either)"""
+    if isinstance(value, list):
+        return ', '.join(name for name in map(_author_names, value) if name)
+    if isinstance(value, dict):
+        return _clean(value.get('name'))
+    return _clean(value)
+
+def _json_ld_articles(text):
+    """Yield the article objects of a JSON-LD block (top level, lists and @graph), in document order"""
+    try:
+        stack = [json.loads(text, strict=False)]
+    except (TypeError, ValueError):
+        return
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        types = node.get('@type')
+        if any(isinstance(name, str) and name.lower() in ARTICLE_TYPES
+               for name in (types if isinstance(types, list) else [types])):
+            yield node
+        if '@graph' in node:
+            stack.append(node['@graph'])
+
+def _field_value(field, value):
+    """Normalize a raw metadata value; None when it is unusable for the field"""
+    if field == 'published':
+        return parse_date(value) if isinstance(value, str) else None
+    value = _author_names(value) if field == 'author' else _clean(value)
+    if field == 'author' and value.startswith('http'):
+        return None  # article:author is often a profile URL rather than a name
+    return value or None
+
+class MetadataExtractor:
+    """One-pass structured metadata reader with per-field source statistics"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {field: {} for field in FIELDS}
+        self.redundant_fetches_avoided = 0  # Detail-site dates read from the article page already downloaded
+
+    def extract(self, soup, fields=FIELDS, fallbacks=None, record=True):
+        """Read the requested fields from a parsed page
+
+        fallbacks maps a field to (source, callable); the callable runs only
+        when the structured metadata did not provide that field. record=False
+        leaves the statistics alone (for lookups repeated on a growing prefix).
+        """
+        found = {}  # field -> (rank, value, source)
+
+        def offer(field, rank, value, source):
+            if field in fields and (field not in found or rank < found[field][0]):
+                value = _field_value(field, value)
+                if value:
+                    found[field] = (rank, value, source)
+
+        scope = soup.head or soup
+        for tag in scope.find_all(('meta', 'script')):
+            if tag.name == 'script':
+                if (tag.get('type') or '').lower() == 'application/ld+json':
+                    for article in _json_ld_articles(tag.string):
+                        offer('title', 0, article.get('headline'), 'json-ld')
+                        offer('description', 0, article.get('description'), 'json-ld')
+                        offer('author', 0, article.get('author'), 'json-ld')
+                        offer('published', 0, article.get('datePublished'), 'json-ld')
+                        offer('modified', 0, article.get('dateModified'), 'json-ld')
+                continue
+            key = (tag.get('property') or tag.get('name') or tag.get('itemprop') or '').lower()
+            if key in META_FIELDS:
+                field, rank, source = META_FIELDS[key]
+                offer(field, rank, tag.get('content'), source)
+            if key in MODIFIED_META:
+                rank, source = MODIFIED_META[key]
+                offer('modified', rank, tag.get('content'), source)
+
+        values = {field: found[field][1] for field in found}
+        sources = {field: found[field][2] for field in found}
+
+        # DOM fallbacks only for what the metadata did not provide
+        for field, (source, compute) in (fallbacks or {}).items():
+            if field in fields and field not in values:
+                value = compute()
+                if value:
+                    values[field] = value
+                    sources[field] = source
+
+        metadata = ArticleMetadata(values.get('title'), values.get('description'), values.get('author'),
+                                   values.get('published'), values.get('modified'), sources)
+        if record:
+            self.record(metadata, fields)
+        return metadata
+
+    def record(self, metadata, fields=FIELDS):
+        """Count where each requested field of an extracted record came from ('missing' when nowhere)"""
+        with self.lock:
+            for field in fields:
+                source = metadata.sources.get(field, 'missing')
+                self.stats[field][source] = self.stats[field].get(source, 0) + 1
+
+    def record_page_date(self):
+        """Count an article date taken from its already-fetched page instead of a separate date request"""
+        with self.lock:
+            self.redundant_fetches_avoided += 1
+
+    def print_summary(self):
+        """Print the per-field source breakdown for this run"""
+        with self.lock:
+            stats = {field: dict(sources) for field, sources in self.stats.items() if sources}
+            reused = self.redundant_fetches_avoided
+        if reused:
+            print(f"♻️ Date extraction reused the downloaded article {reused} time(s) instead of fetching it again")
+        if not stats:
+            return
+        print("🧾 Article metadata sources:")
+        for field, sources in stats.items():
+            breakdown = ', '.join(f"{source} {count}" for source, count in
+                                  sorted(sources.items(), key=lambda entry: -entry[1]))
+            print(f"   {field}: {breakdown}")
+
+_metadata_extractor = None
+_metadata_extractor_lock = threading.Lock()
+
+def get_metadata_extractor():
+    """Return the process-wide metadata extractor shared by every scraper"""
+    global _metadata_extractor
+    with _metadata_extractor_lock:
+        if _metadata_extractor is None:
+            _metadata_extractor = MetadataExtractor()
+        return _metadata_extractor
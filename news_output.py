@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+News Output - shared by the orchestrator and the standalone scraper scripts
+Saves a source's articles to an Excel file with a named table (Power Automate
+reads the table) and uploads the file to Azure Blob Storage
+"""
+import os
+import time
+
+# pandas and the Azure SDK are imported where they are used: together they are most of the
+# start-up import time, and nothing needs them until the output is written
+from date_engine import format_date
+
+AZURE_BLOB_SUBFOLDER = "Data/NSI/data/Azure Databricks/Automation Scripts/News/"
+
+def save_news_excel(news_items, filename, table_name, sort_by_date=False, sheet_name='Sheet1'):
+    """Save articles to an Excel file and wrap them in a named table; returns the DataFrame
+
+    published_date arrives as a date and is formatted here, for the output only.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(news_items)
+
+    if sort_by_date:
+        # Newest first (dates compare directly, no re-parsing)
+        df = df.sort_values('published_date', ascending=False, kind='stable')
+        print(f"✅ Articles sorted by date (newest first)")
+    df['published_date'] = df['published_date'].map(format_date)
+
+    df.to_excel(filename, sheet_name=sheet_name, index=False)
+    try:
+        from openpyxl import load_workbook
+        from openpyxl.worksheet.table import Table, TableStyleInfo
+        wb = load_workbook(filename)
+        ws = wb.active
+        col_letters = ws.cell(row=1, column=ws.max_column).column_letter
+        table = Table(displayName=table_name, ref=f"A1:{col_letters}{ws.max_row}")
+        table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False,
+                                              showLastColumn=False, showRowStripes=True, showColumnStripes=False)
+        ws.add_table(table)
+        wb.save(filename)
+        print(f"📊 Saved {len(df)} news items to {filename} (with table '{table_name}')")
+    except Exception as e:
+        print(f"⚠️ Could not add Excel table to {filename}: {e}")
+        print(f"📊 Saved {len(df)} news items to {filename}")
+    return df
+
+def print_news_statistics(df):
+    """Print article, category and sentiment counts for a saved source"""
+    print(f"\n📈 Summary Statistics:")
+    print(f"   Total articles: {len(df)}")
+    print(f"   Categories: {df['category'].nunique()}")
+    print(f"   Sentiment distribution:")
+    for sentiment, count in df['sentiment_label'].value_counts().items():
+        print(f"     {sentiment}: {count}")
+
+def upload_to_azure_blob(file_path, blob_name):
+    """Upload file to Azure Blob Storage - GitHub Actions Optimized"""
+    try:
+        # Get Azure connection details from environment variables
+        # This works for both local .env files and GitHub Actions secrets
+        connection_string = os.getenv('AZURE_CONNECTION_STRING')
+        container_name = os.getenv('AZURE_CONTAINER_NAME')
+
+        print(f"🔍 Azure Environment Check:")
+        print(f"   Connection String: {'✅ Found' if connection_string else '❌ Missing'}")
+        print(f"   Container Name: {'✅ Found' if container_name else '❌ Missing'}")
+
+        if not connection_string:
+            print("❌ Error: AZURE_CONNECTION_STRING environment variable not found")
+            print("   For GitHub Actions: Check repository secrets")
+            print("   For local: Check .env file")
+            return False
+
+        if not container_name:
+            print("❌ Error: AZURE_CONTAINER_NAME environment variable not found")
+            print("   For GitHub Actions: Check repository secrets")
+            print("   For local: Check .env file")
+            return False
+
+        print(f"🔗 Creating Azure Blob Service Client...")
+        from azure.storage.blob import BlobServiceClient
+        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+
+        blob_path = AZURE_BLOB_SUBFOLDER + blob_name
+        print(f"📁 Target path: {container_name}/{blob_path}")
+
+        if not os.path.exists(file_path):
+            print(f"❌ Error: File {file_path} does not exist")
+            return False
+
+        file_size = os.path.getsize(file_path) / 1024  # KB
+        print(f"📦 Uploading file: {file_path} ({file_size:.1f} KB)")
+
+        with open(file_path, "rb") as data:
+            blob_client = blob_service_client.get_blob_client(container=container_name, blob=blob_path)
+            print(f"⬆️ Starting upload...")
+            blob_client.upload_blob(data, overwrite=True)
+
+        print(f"✅ Successfully uploaded {blob_name} to Azure Blob Storage")
+        print(f"📁 Container: {container_name}")
+        print(f"🗂️ Full Path: {blob_path}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error uploading to Azure Blob Storage: {e}")
+        print(f"   Error type: {type(e).__name__}")
+        if "signature" in str(e).lower():
+            print("   💡 This might be an authentication issue")
+            print("   💡 Check if AZURE_CONNECTION_STRING is correctly set")
+        elif "404" in str(e):
+            print("   💡 Container might not exist or connection string is invalid")
+        elif "403" in str(e):
+            print("   💡 Permission denied - check access keys and permissions")
+        return False
+
+def upload_with_retries(file_path, blob_name, attempts=3):
+    """Upload to Azure, retrying a failed upload after a short pause"""
+    for attempt in range(attempts):
+        if attempt > 0:
+            print(f"🔄 Retry attempt {attempt + 1}/{attempts}...")
+            time.sleep(5)  # Wait before retry
+        if upload_to_azure_blob(file_path, blob_name):
+            return True
+    return False
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Parse Stage - shared by the site engine
+Runs the CPU-bound part of the crawl (BeautifulSoup parsing, selector
+evaluation, date scans over page text) in a pool of worker processes.
+Crawler threads hand over raw page bytes and wait for plain records
+(article candidates, article metadata) without holding the GIL, so parsing
+overlaps with the other threads' network I/O and spreads over the CPU
+cores. With one worker (or a single core) pages are parsed in the calling
+thread as before
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import date_engine
+
+# Parse settings (override via environment)
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', '0'))  # Parse worker processes (0 = one per CPU core, 1 = parse in the crawler threads)
+
+def _init_worker(window):
+    """Worker start-up: relative dates are judged against the parent run's date window"""
+    date_engine.use_date_window(window)
+
+def _timed(function, args):
+    """Run one parse job in a worker; returns (result, seconds spent)"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+class ParseJob:
+    """A submitted parse: result() waits for its worker, or parses in the calling thread without a pool"""
+
+    def __init__(self, stage, function, args, future=None):
+        self.stage = stage
+        self.function = function
+        self.args = args
+        self.future = future
+
+    def result(self):
+        """The job's record; exceptions raised by the parse are raised here, as with an inline call"""
+        if self.future is not None:
+            try:
+                result, seconds = self.future.result()
+            except BrokenProcessPool as e:
+                self.stage.disable_pool(e)
+            else:
+                self.stage.count(seconds, pooled=True)
+                return result
+        start = time.perf_counter()
+        result = self.function(*self.args)
+        self.stage.count(time.perf_counter() - start, pooled=False)
+        return result
+
+class ParseStage:
+    """Process pool for page parsing, started on first use"""
+
+    def __init__(self, workers=PARSE_WORKERS):
+        self.workers = workers or os.cpu_count() or 1
+        self.lock = threading.Lock()
+        self.pool = None
+        self.pool_failed = False
+        self.stats = {'pages': 0, 'pooled': 0, 'seconds': 0.0}
+
+    def _get_pool(self):
+        with self.lock:
+            if self.pool is None and not self.pool_failed and self.workers > 1:
+                # Spawned workers start clean instead of forking a process full of crawler threads
+                self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                                initializer=_init_worker, initargs=(date_engine.get_date_window(),))
+                print(f"🧩 Parse stage: {self.workers} worker processes")
+            return self.pool
+
+    def submit(self, function, *args):
+        """Start function(*args) on a worker (both must be picklable); returns a ParseJob"""
+        pool = self._get_pool()
+        future = None
+        if pool is not None:
+            try:
+                future = pool.submit(_timed, function, args)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self.disable_pool(e)
+        return ParseJob(self, function, args, future)
+
+    def run(self, function, *args):
+        """Parse on a worker and wait for the record"""
+        return self.submit(function, *args).result()
+
+    def disable_pool(self, error):
+        """Parse in the calling threads from now on (the worker pool died or could not start)"""
+        with self.lock:
+            if self.pool_failed:
+                return
+            self.pool_failed = True
+        print(f"⚠️ Parse worker pool unavailable ({error}) - parsing in the crawler threads")
+
+    def count(self, seconds, pooled):
+        with self.lock:
+            self.stats['pages'] += 1
+            self.stats['pooled'] += 1 if pooled else 0
+            self.stats['seconds'] += seconds
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self.lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def print_summary(self):
+        """Print how many pages were parsed, and how much parse time ran off the crawler threads"""
+        with self.lock:
+            stats = dict(self.stats)
+        if not stats['pages']:
+            return
+        print(f"🧩 Parse stage: {stats['pages']} pages parsed in {stats['seconds']:.1f}s of parse time, "
+              f"{stats['pooled']} of them in the worker pool ({self.workers} workers)")
+
+_parse_stage = None
+_parse_stage_lock = threading.Lock()
+
+def get_parse_stage():
+    """Return the process-wide parse stage shared by every scraper"""
+    global _parse_stage
+    with _parse_stage_lock:
+        if _parse_stage is None:
+            _parse_stage = ParseStage()
+        return _parse_stage
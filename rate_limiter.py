@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Per-Host Politeness Scheduler - shared by all news scrapers
+Token-bucket rate limiting per host: a host that is cooling down only
+blocks its own requests, so crawls of different sites interleave
+"""
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+# Default politeness settings (override via environment)
+DEFAULT_RATE_PER_SECOND = float(os.getenv('HOST_RATE_PER_SECOND', '1.0'))
+DEFAULT_BURST = float(os.getenv('HOST_RATE_BURST', '1'))
+
+def parse_host_rates(spec):
+    """Parse "host=rate,host=rate" into a dict of per-host request rates"""
+    rates = {}
+    for entry in (spec or '').split(','):
+        if '=' not in entry:
+            continue
+        host, rate = entry.split('=', 1)
+        try:
+            rates[host.strip().lower()] = float(rate)
+        except ValueError:
+            print(f"⚠️ Ignoring invalid host rate '{entry}'")
+    return rates
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, at most `capacity` stored"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now):
+        """Take one token and return how long the caller must wait before using it"""
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def penalize(self, now, seconds):
+        """Push the bucket into debt so the host cools down for an extra `seconds`"""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+class HostRateLimiter:
+    """Thread-safe registry of token buckets, one per host"""
+
+    def __init__(self, default_rate=DEFAULT_RATE_PER_SECOND, burst=DEFAULT_BURST, host_rates=None):
+        self.default_rate = default_rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.buckets = {}
+        self.waited = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.host_rates.get(host, self.default_rate), self.burst)
+            self.buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url):
+        """Reserve the next request slot for the URL's host and return the delay"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            delay = self._bucket(host).reserve(time.monotonic())
+            self.waited[host] = self.waited.get(host, 0.0) + delay
+        return delay
+
+    def wait(self, url):
+        """Block the calling thread until the URL's host may be contacted again"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, url, seconds):
+        """Make a host cool down (e.g. before a retry) without stalling other hosts"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            self._bucket(host).penalize(time.monotonic(), seconds)
+
+    def print_summary(self):
+        """Print total politeness wait time per host"""
+        if not self.waited:
+            return
+        print("🚦 Politeness scheduler summary:")
+        for host, waited in sorted(self.waited.items()):
+            print(f"   {host}: {waited:.1f}s of scheduled cool-down")
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """Return the process-wide rate limiter shared by every scraper"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter(host_rates=parse_host_rates(os.getenv('HOST_RATE_LIMITS')))
+        return _rate_limiter
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+On-Disk HTTP Response Cache - shared by all news scrapers
+Stores compressed article page bodies keyed by canonical URL so the same
+article is downloaded at most once per TTL, across helpers and across runs.
+Bounded by a size cap with least-recently-used eviction.
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from url_utils import canonical_url
+
+# Cache settings (override via environment)
+CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache')
+RESPONSE_CACHE_PATH = os.path.join(CACHE_DIR, 'responses.sqlite3')
+RESPONSE_CACHE_MAX_BYTES = int(float(os.getenv('RESPONSE_CACHE_MAX_MB', '200')) * 1024 * 1024)
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv('RESPONSE_CACHE_TTL_HOURS', '24')) * 3600
+
+class CachedResponse:
+    """Minimal response object served from the cache (same attributes the scrapers use)"""
+
+    def __init__(self, url, content, encoding=None, status_code=200, headers=None):
+        self.url = url
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.status_code = status_code
+        self.reason = 'OK (cached)'
+        self.headers = headers or {}
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+class ResponseCache:
+    """SQLite-backed, zlib-compressed response body cache with TTL and LRU eviction"""
+
+    def __init__(self, path=RESPONSE_CACHE_PATH, max_bytes=RESPONSE_CACHE_MAX_BYTES,
+                 ttl_seconds=RESPONSE_CACHE_TTL_SECONDS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expired': 0}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+        self.conn.commit()
+
+    def get(self, url):
+        """Return a CachedResponse for the URL, or None on a miss or expired entry"""
+        key = canonical_url(url)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT body, encoding, stored_at FROM responses WHERE url = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+
+            body, encoding, stored_at = row
+            if now - stored_at > self.ttl_seconds:
+                self.conn.execute('DELETE FROM responses WHERE url = ?', (key,))
+                self.conn.commit()
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self.conn.execute('UPDATE responses SET last_access = ? WHERE url = ?', (now, key))
+            self.conn.commit()
+            self.stats['hits'] += 1
+
+        return CachedResponse(url, zlib.decompress(body), encoding)
+
+    def fresh(self, url):
+        """True when the URL's page is cached and within the TTL (the body is not read, nor counted as a hit)"""
+        with self.lock:
+            row = self.conn.execute('SELECT stored_at FROM responses WHERE url = ?', (canonical_url(url),)).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl_seconds
+
+    def put(self, url, response):
+        """Store a successful response body and evict old entries beyond the size cap"""
+        if response is None or response.status_code != 200 or getattr(response, 'from_cache', False):
+            return
+
+        body = zlib.compress(response.content, 6)
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (url, body, encoding, size, stored_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (canonical_url(url), body, response.encoding, len(body), now, now)
+            )
+            self.stats['stores'] += 1
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache is back under its size cap"""
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        rows = self.conn.execute('SELECT url, size FROM responses ORDER BY last_access ASC').fetchall()
+        for url, size in rows:
+            if total <= target:
+                break
+            self.conn.execute('DELETE FROM responses WHERE url = ?', (url,))
+            total -= size
+            self.stats['evictions'] += 1
+
+    def fetch(self, url, fetch_func):
+        """Read-through: serve from cache, otherwise call fetch_func(url) and store the result"""
+        cached = self.get(url)
+        if cached is not None:
+            return cached
+
+        response = fetch_func(url)
+        self.put(url, response)
+        return response
+
+    def print_summary(self):
+        """Print hit/miss counters for this run"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] / lookups * 100) if lookups else 0.0
+        print(f"🗄️ Response cache: {self.stats['hits']} hits / {self.stats['misses']} misses "
+              f"({hit_rate:.0f}% hit rate), {self.stats['stores']} stored, "
+              f"{self.stats['evictions']} evicted, {self.stats['expired']} expired")
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache():
+    """Return the process-wide response cache shared by every scraper"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
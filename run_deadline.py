@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Deadline-Aware Run Scheduler - shared by the orchestrator and all news scrapers
+The workflow kills the job at a hard timeout, so the run gets an overall
+deadline with time reserved for writing and uploading the output. As the
+crawl uses up its share of that time the scrapers degrade in a fixed order
+(skip pagination, then TextBlob, then article detail fetches) and finally
+stop crawling, so whatever was collected is still saved and uploaded
+"""
+import os
+import threading
+import time
+
+# Deadline settings (override via environment)
+RUN_DEADLINE_MINUTES = float(os.getenv('RUN_DEADLINE_MINUTES', '40'))  # Workflow timeout is 45 minutes
+OUTPUT_RESERVE_SECONDS = float(os.getenv('OUTPUT_RESERVE_SECONDS', '180'))  # Kept back for Excel + Azure upload
+CRAWL_GRACE_SECONDS = float(os.getenv('CRAWL_GRACE_SECONDS', '30'))  # Part of the reserve a collector may use to wrap up
+
+# Degradation stages in the order they are given up, with the share of crawl time after which they are skipped
+DEGRADATION_STAGES = [
+    ('pagination', float(os.getenv('DEGRADE_PAGINATION_AT', '0.5'))),
+    ('textblob', float(os.getenv('DEGRADE_TEXTBLOB_AT', '0.7'))),
+    ('detail_fetches', float(os.getenv('DEGRADE_DETAIL_FETCHES_AT', '0.85'))),
+]
+
+class RunDeadline:
+    """Overall run deadline with a crawl budget and staged degradation"""
+
+    def __init__(self, total_seconds=None, reserve_seconds=OUTPUT_RESERVE_SECONDS):
+        self.started_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.degraded = set()
+        if total_seconds is None:
+            # No deadline (scrapers run on their own): every stage is always allowed
+            self.deadline = None
+            self.crawl_seconds = None
+        else:
+            self.deadline = self.started_at + total_seconds
+            self.crawl_seconds = max(0.0, total_seconds - reserve_seconds)
+
+    def crawl_remaining(self):
+        """Seconds left for crawling before the output reserve starts (None without a deadline)"""
+        if self.crawl_seconds is None:
+            return None
+        return max(0.0, self.started_at + self.crawl_seconds - time.monotonic())
+
+    def crawl_used(self):
+        """Share of the crawl budget used so far (0.0 without a deadline)"""
+        if not self.crawl_seconds:
+            return 0.0 if self.crawl_seconds is None else 1.0
+        return (time.monotonic() - self.started_at) / self.crawl_seconds
+
+    def remaining(self):
+        """Seconds left until the overall deadline (None without a deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def crawl_expired(self):
+        """True once crawling must stop so the output can still be written and uploaded"""
+        return self.crawl_seconds is not None and self.crawl_used() >= 1.0
+
+    def allows(self, stage):
+        """True while the given optional stage still fits in the crawl budget"""
+        used = self.crawl_used()
+        for name, threshold in DEGRADATION_STAGES:
+            if name == stage:
+                if used < threshold:
+                    return True
+                with self.lock:
+                    first_time = stage not in self.degraded
+                    self.degraded.add(stage)
+                if first_time:
+                    print(f"⏱️ {used * 100:.0f}% of the crawl budget used - skipping {stage.replace('_', ' ')} from now on")
+                return False
+        raise ValueError(f"Unknown degradation stage: {stage}")
+
+    def print_summary(self):
+        """Print how much of the deadline was used and which stages were skipped"""
+        if self.deadline is None:
+            return
+        elapsed = time.monotonic() - self.started_at
+        skipped = ', '.join(name for name, _ in DEGRADATION_STAGES if name in self.degraded) or 'none'
+        print(f"⏱️ Run deadline: {elapsed / 60:.1f} min used of {(self.deadline - self.started_at) / 60:.1f} min, "
+              f"skipped stages: {skipped}")
+
+_run_deadline = RunDeadline()
+_run_deadline_lock = threading.Lock()
+
+def start_run_deadline(total_seconds=RUN_DEADLINE_MINUTES * 60, reserve_seconds=OUTPUT_RESERVE_SECONDS):
+    """Start the process-wide deadline (called once by the orchestrator)"""
+    global _run_deadline
+    with _run_deadline_lock:
+        _run_deadline = RunDeadline(total_seconds, reserve_seconds)
+        print(f"⏱️ Run deadline: {total_seconds / 60:.0f} min ({reserve_seconds:.0f}s reserved for output and upload)")
+        return _run_deadline
+
+def get_run_deadline():
+    """Return the current run deadline (unlimited unless the orchestrator started one)"""
+    with _run_deadline_lock:
+        return _run_deadline
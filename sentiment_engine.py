@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Sentiment Engine - shared by the site engine
+Scores article texts in batches once a site's articles are collected,
+instead of one TextBlob + VADER call per article inside the crawl loop.
+Large batches are split into chunks and spread over a pool of worker
+processes, each loading the analyzers once; small batches, single-core
+machines and environments where the pool cannot start are scored inline.
+Every text gets the same sentiment_score / sentiment_label / emotion
+triple as before; texts scored on an earlier run come from the enrichment
+cache
+"""
+import functools
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib import metadata
+
+from enrichment_cache import get_enrichment_cache
+
+# Sentiment settings (override via environment)
+SENTIMENT_WORKERS = int(os.getenv('SENTIMENT_WORKERS', '0'))  # Worker processes (0 = one per CPU core, 1 = always inline)
+SENTIMENT_CHUNK_SIZE = int(os.getenv('SENTIMENT_CHUNK_SIZE', '64'))  # Texts sent to a worker at a time
+SENTIMENT_POOL_MIN_TEXTS = int(os.getenv('SENTIMENT_POOL_MIN_TEXTS', '200'))  # Smaller batches are scored inline (pool start-up costs more)
+SENTIMENT_LEXICON_CACHE = os.getenv('SENTIMENT_LEXICON_CACHE', 'true').lower() not in ('0', 'false', 'no')  # Keep the parsed lexicons in a faster-loading pickle
+
+# Directory for state persisted between runs (cached in the GitHub workflow)
+CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache')
+LEXICON_CACHE_PATH = os.path.join(CACHE_DIR, 'sentiment_lexicons.pickle')
+
+NEUTRAL = {'sentiment_score': 0.0, 'sentiment_label': 'Neutral', 'emotion': 'Neutral'}
+SENTIMENT_VERSION = 1  # Bump when the score formula or the label thresholds change (invalidates cached scores)
+
+# Analyzers of the current process, loaded on first use (once per process, shared by every caller)
+_analyzers = None
+_analyzers_lock = threading.Lock()
+
+def _read_lexicon_cache():
+    """Parsed lexicons from the pickle cache, or None when missing or written by other library versions"""
+    try:
+        with open(LEXICON_CACHE_PATH, 'rb') as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Could not read sentiment lexicon cache {LEXICON_CACHE_PATH}: {e}")
+        return None
+    return data if isinstance(data, dict) and data.get('version') == analyzer_version() else None
+
+def _write_lexicon_cache(vader, pattern):
+    data = {'version': analyzer_version(),
+            'vader': (vader.lexicon, vader.emojis),
+            'pattern': (dict(pattern.items()), pattern.labeler, pattern._synsets, pattern.language)}
+    try:
+        os.makedirs(os.path.dirname(LEXICON_CACHE_PATH) or '.', exist_ok=True)
+        tmp_path = f"{LEXICON_CACHE_PATH}.{os.getpid()}.tmp"  # Worker processes may write at the same time
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, LEXICON_CACHE_PATH)
+    except Exception as e:
+        print(f"⚠️ Could not save sentiment lexicon cache {LEXICON_CACHE_PATH}: {e}")
+
+def load_analyzers():
+    """Return this process's (VADER analyzer, TextBlob pattern lexicon); None when the libraries are not installed
+
+    Built once per process. TextBlob's polarity comes straight from its pattern
+    lexicon (what TextBlob(text).sentiment runs), without building a TextBlob
+    per text. With SENTIMENT_LEXICON_CACHE both lexicons are read from a pickle
+    instead of being parsed from the library's text and XML files.
+    """
+    global _analyzers
+    with _analyzers_lock:
+        if _analyzers is not None:
+            return _analyzers or None
+        try:
+            from textblob.en import sentiment as pattern
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        except ImportError:
+            _analyzers = False
+            return None
+
+        cached = _read_lexicon_cache() if SENTIMENT_LEXICON_CACHE else None
+        if cached:
+            vader = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+            vader.lexicon, vader.emojis = cached['vader']
+            if not dict.__len__(pattern):  # Fill the lazy lexicon the way its XML loader does
+                words, labels, synsets, pattern._language = cached['pattern']
+                dict.update(pattern, words)
+                dict.update(pattern.labeler, labels)
+                dict.update(pattern._synsets, synsets)
+        else:
+            vader = SentimentIntensityAnalyzer()
+            if SENTIMENT_LEXICON_CACHE:
+                pattern.load()
+                _write_lexicon_cache(vader, pattern)
+        _analyzers = (vader, pattern)
+        return _analyzers
+
+@functools.lru_cache(maxsize=None)
+def analyzer_version(use_textblob=True):
+    """Scoring setup behind a result: formula version, analyzer mode and library versions"""
+    versions = []
+    for package in ('vaderSentiment', 'textblob') if use_textblob else ('vaderSentiment',):
+        try:
+            versions.append(f"{package} {metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package} unknown")
+    return f"sentiment/{SENTIMENT_VERSION}/{'+'.join(versions)}"
+
+def sentiment_fields(score):
+    """sentiment_score / sentiment_label / emotion for a combined score"""
+    if score >= 0.1:
+        label, emotion = 'Positive', 'Optimistic' if score > 0.3 else 'Positive'
+    elif score <= -0.1:
+        label, emotion = 'Negative', 'Concerning' if score < -0.3 else 'Negative'
+    else:
+        label, emotion = 'Neutral', 'Neutral'
+    return {'sentiment_score': round(score, 3), 'sentiment_label': label, 'emotion': emotion}
+
+def analyze_texts(texts, use_textblob=True):
+    """Score a list of texts in this process (VADER, averaged with TextBlob unless use_textblob is False)"""
+    analyzers = load_analyzers()
+    if analyzers is None:
+        return [dict(NEUTRAL) for _ in texts]
+    vader, pattern = analyzers
+    results = []
+    for text in texts:
+        if not text:
+            results.append(dict(NEUTRAL))
+            continue
+        try:
+            score = vader.polarity_scores(text)['compound']
+            if use_textblob:
+                score = (pattern(text)[0] + score) / 2  # TextBlob polarity
+            results.append(sentiment_fields(score))
+        except Exception as e:
+            print(f"Sentiment analysis error: {e}")
+            results.append(dict(NEUTRAL))
+    return results
+
+class SentimentEngine:
+    """Batch sentiment scoring over a lazily started process pool"""
+
+    def __init__(self, workers=SENTIMENT_WORKERS, chunk_size=SENTIMENT_CHUNK_SIZE, pool_min_texts=SENTIMENT_POOL_MIN_TEXTS):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.pool_min_texts = pool_min_texts
+        self.lock = threading.Lock()
+        self.pool = None
+        self.pool_failed = False
+        self.stats = {'texts': 0, 'pooled': 0, 'seconds': 0.0}
+
+        if load_analyzers() is None:
+            print("Note: Sentiment analysis libraries not available. Install with: pip install textblob vaderSentiment")
+
+    def _get_pool(self):
+        with self.lock:
+            if self.pool is None and not self.pool_failed:
+                # Spawned workers start clean instead of forking a process full of crawler threads
+                self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=load_analyzers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+            return self.pool
+
+    def analyze_batch(self, texts, use_textblob=True):
+        """Sentiment triples for a list of texts, in order"""
+        texts = list(texts)
+        start = time.perf_counter()
+        results = None
+        pooled = self.workers > 1 and len(texts) >= self.pool_min_texts and load_analyzers() is not None
+        if pooled:
+            pool = self._get_pool()
+            if pool is not None:
+                chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+                try:
+                    results = [result for chunk in pool.map(analyze_texts, chunks, [use_textblob] * len(chunks))
+                               for result in chunk]
+                except (BrokenProcessPool, OSError) as e:
+                    print(f"⚠️ Sentiment worker pool unavailable ({e}) - scoring inline")
+                    with self.lock:
+                        self.pool_failed = True
+        if results is None:
+            pooled = False
+            results = analyze_texts(texts, use_textblob)
+
+        with self.lock:
+            self.stats['texts'] += len(texts)
+            self.stats['pooled'] += len(texts) if pooled else 0
+            self.stats['seconds'] += time.perf_counter() - start
+        return results
+
+    def enrich(self, items, text_of, use_textblob=True, modified_of=None):
+        """Fill in the sentiment fields of the items that do not have them yet (in place); returns the items
+
+        text_of returns the text an item is scored on, modified_of the article's
+        modified time for its fingerprint (default: its publication date).
+        """
+        pending = [item for item in items if item.get('sentiment_score') is None]
+        # Scores come from the enrichment cache when the same text was scored before; neutral
+        # placeholders for missing libraries are never cached
+        cache = get_enrichment_cache() if load_analyzers() is not None else None
+        misses = {}  # fingerprint -> (text, items): a text repeated within the batch is scored once
+        for position, item in enumerate(pending):
+            text = text_of(item)
+            modified = modified_of(item) if modified_of else item.get('published_date')
+            key = cache.fingerprint(analyzer_version(use_textblob), text, modified) if cache else position
+            cached = cache.lookup('sentiment', key) if cache and key not in misses else None
+            if cached:
+                item.update(cached)
+            else:
+                misses.setdefault(key, (text, []))[1].append(item)
+
+        if misses:
+            results = self.analyze_batch([text for text, _ in misses.values()], use_textblob)
+            for (key, (_, waiting)), result in zip(misses.items(), results):
+                for item in waiting:
+                    item.update(result)
+                if cache:
+                    cache.store(key, result)
+        return items
+
+    def shutdown(self):
+        """Stop the worker processes (the pool is started again if another batch arrives)"""
+        with self.lock:
+            pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def print_summary(self):
+        """Print how many texts were scored, and how many of them in the worker pool"""
+        with self.lock:
+            stats = dict(self.stats)
+        if not stats['texts']:
+            return
+        rate = stats['texts'] / stats['seconds'] if stats['seconds'] else 0
+        print(f"💭 Sentiment: {stats['texts']} texts scored in {stats['seconds']:.1f}s ({rate:.0f}/s), "
+              f"{stats['pooled']} in the worker pool ({self.workers} workers)")
+
+_sentiment_engine = None
+_sentiment_engine_lock = threading.Lock()
+
+def get_sentiment_engine():
+    """Return the process-wide sentiment engine shared by every scraper"""
+    global _sentiment_engine
+    with _sentiment_engine_lock:
+        if _sentiment_engine is None:
+            _sentiment_engine = SentimentEngine()
+        return _sentiment_engine
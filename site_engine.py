@@ -0,0 +1,960 @@
+#!/usr/bin/env python3
+"""
+Declarative Site Engine - drives every news source from its definition in sites/
+A site definition (sites/<key>.json) holds a source's section URLs, feed
+location, listing and article extraction rules, date rules, pagination and
+category mapping. Selectors and regexes are compiled once when the
+definition is loaded, and every source runs through the same fetch, parse,
+date-filter and enrichment path, so adding a source is a new JSON file
+"""
+import functools
+import json
+import os
+import random
+import re
+import threading
+from datetime import date, datetime
+from urllib.parse import urljoin
+
+import requests
+import soupsieve
+
+import http_client
+from categorizer import Categorizer, CATEGORY_MODE
+from circuit_breaker import get_circuit_breaker, RETRYABLE_STATUSES
+from crawl_state import get_crawl_state
+from enrichment_cache import get_enrichment_cache
+from date_engine import get_date_window, parse_date, format_date, local_date
+from feed_discovery import discover_sections, clean_summary
+from fetch_engine import fetch_pages, run_worker_pool
+from head_fetch import get_head_fetcher
+from html_parser import parse_html, ANCHORS, METADATA_TAGS
+from listing_index import ListingIndex
+from metadata_extractor import get_metadata_extractor
+from parse_stage import get_parse_stage
+from rate_limiter import get_rate_limiter
+from response_cache import get_response_cache
+from run_deadline import get_run_deadline
+from sentiment_engine import get_sentiment_engine
+from url_memo import SingleFlightMemo
+from validator_store import get_validator_store
+
+# Engine settings (override via environment)
+SITES_DIR = os.getenv('SITES_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sites'))
+DETAIL_CONCURRENCY = int(os.getenv('DETAIL_CONCURRENCY', os.getenv('PHILSTAR_DETAIL_CONCURRENCY', '4')))  # Article-page workers
+DETAIL_TIMEOUT = float(os.getenv('DETAIL_TIMEOUT', os.getenv('PHILSTAR_DETAIL_TIMEOUT', '90')))  # Per-article timeout in seconds
+
+# Output placeholder for articles without a description (not part of the text sentiment is scored on)
+NO_DESCRIPTION = "No description available"
+
+# Keyword lists shared by the site definitions (referenced by name from "categories")
+KEYWORD_SETS_FILE = 'keyword_sets.json'
+
+# Enhanced user agents for GitHub Actions bypassing
+GITHUB_ACTIONS_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+]
+
+def shorten(text, limit=200):
+    """Collapse whitespace and cut a description to the length stored in the output"""
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text[:limit] + "..." if len(text) > limit else text
+
+def compile_selectors(selectors):
+    """Compile CSS selectors once; returns (selector, compiled) pairs in priority order"""
+    return [(selector, soupsieve.compile(selector)) for selector in selectors or []]
+
+def element_value(element):
+    """Text of an element, or the content attribute of a <meta> tag"""
+    if element.name == 'meta':
+        return (element.get('content') or '').strip()
+    return element.get_text(strip=True)
+
+class TextRule:
+    """First element text matching any of the selectors, within length limits and not ignored
+
+    The lookup starts at the given element and moves up to its ancestors for
+    ancestor_levels levels in total (1 = the element only). On listing pages the
+    lookups are answered from the page's ListingIndex under the rule's field name.
+    """
+
+    def __init__(self, config):
+        config = config or {}
+        self.selectors = compile_selectors(config.get('selectors'))
+        self.ancestor_levels = max(1, config.get('ancestor_levels', 1))
+        self.min_length = config.get('min_length', 1)
+        self.max_length = config.get('max_length')
+        self.ignore = {value.lower() for value in config.get('ignore', [])}
+
+    def extract(self, element, index=None, field=None):
+        scope = element
+        for _ in range(self.ancestor_levels):
+            if scope is None:
+                break
+            for position, (_, compiled) in enumerate(self.selectors):
+                found = index.first_match(scope, field, position) if index is not None else compiled.select_one(scope)
+                if found is None:
+                    continue
+                text = index.text(found) if index is not None else element_value(found)
+                if (len(text) >= self.min_length and (self.max_length is None or len(text) <= self.max_length)
+                        and text.lower() not in self.ignore):
+                    return text
+            scope = scope.parent
+        return ''
+
+class SiteDefinition:
+    """A news source loaded from its JSON definition, with every selector and regex compiled"""
+
+    def __init__(self, key, config, keyword_sets, sites_dir=SITES_DIR):
+        self.key = key
+        self.sites_dir = sites_dir
+        self.name = config['name']
+        self.base_url = config['base_url'].rstrip('/')
+        self.referer = config.get('referer', self.base_url + '/')
+        self.output_file = config['output']['filename']
+        self.table_name = config['output']['table']
+        self.sheet_name = config['output'].get('sheet', self.name)
+        self.sections = config['sections']
+        self.author = config.get('author')  # None: the output has no author column
+        self.max_items_per_section = config.get('max_items_per_section')
+
+        feed = config.get('feed')
+        self.feed_pattern = re.compile(feed['pattern']) if feed else None
+        self.feed_replacement = feed['replacement'] if feed else None
+
+        article_urls = config.get('article_urls', {})
+        self.include_url = re.compile(article_urls['include']) if article_urls.get('include') else None
+        self.exclude_url = re.compile(article_urls['exclude'], re.IGNORECASE) if article_urls.get('exclude') else None
+
+        listing = config['listing']
+        self.listing_type = listing['type']
+        if self.listing_type not in ('links', 'cards'):
+            raise ValueError(f"{key}: listing type must be 'links' or 'cards', not {self.listing_type!r}")
+        self.listing_selectors = compile_selectors(listing['selectors'])
+        self.first_match = listing.get('first_match', self.listing_type == 'cards')
+        self.anchors_only = listing.get('anchors_only', False)
+        self.title_selectors = compile_selectors(listing.get('title_selectors'))
+        self.min_title_length = listing.get('min_title_length', 0)
+        self.listing_description = TextRule(listing.get('description'))
+        self.listing_category = TextRule(listing.get('category'))
+        self.listing_author = TextRule({'selectors': listing.get('author_selectors')})
+
+        detail = config.get('detail')
+        self.detail = detail is not None
+        if self.detail:
+            self.max_articles = detail.get('max_articles')
+            self.detail_title_selectors = compile_selectors(detail['title_selectors'])
+            self.detail_min_title_length = detail.get('min_title_length', 1)
+            self.skip_titles = detail.get('skip_titles', [])
+            self.detail_description = TextRule(detail.get('description'))
+            self.detail_author = TextRule({'selectors': detail.get('author_selectors')})
+
+        pagination = config.get('pagination')
+        if pagination and not self.detail:
+            raise ValueError(f"{key}: pagination is only supported for sites with a detail block")
+        self.pagination_param = pagination['param'] if pagination else None
+        self.pagination_pages = pagination['pages'] if pagination else []
+        self.stop_at_high_water = pagination.get('stop_at_high_water', False) if pagination else False
+
+        dates = config.get('dates', {})
+        self.url_date_pattern = re.compile(dates['url_pattern']) if dates.get('url_pattern') else None
+        self.listing_date_selectors = compile_selectors(dates.get('listing_selectors'))
+        self.article_meta_selectors = compile_selectors(dates.get('article_meta'))
+        self.article_date_selectors = compile_selectors(dates.get('article_selectors'))
+        self.date_text_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in dates.get('article_text_patterns', [])]
+        self.relative_time = dates.get('relative_time', False)
+        self.listing_text_dates = dates.get('listing_text', False)
+        self.when_missing = dates.get('when_missing', 'skip')
+        if self.when_missing not in ('skip', 'today'):
+            raise ValueError(f"{key}: dates.when_missing must be 'skip' or 'today'")
+
+        categories = config.get('categories', {})
+        self.default_category = categories.get('default', 'General Business')
+        self.categorizer = Categorizer(keyword_sets[categories.get('keyword_set', 'business')], self.default_category,
+                                       categories.get('mode', CATEGORY_MODE))
+        self.prefix_section = categories.get('prefix_section', False)
+        self.section_names = categories.get('section_names', {})
+
+    def __reduce__(self):
+        # Sent to parse workers by reference: each worker process loads the definition once
+        return cached_site, (self.key, self.sites_dir)
+
+    def feed_urls(self, section):
+        """Candidate feed URLs for a section (none when the site has no feed)"""
+        if self.feed_pattern is None:
+            return []
+        return [self.feed_pattern.sub(self.feed_replacement, section, count=1)]
+
+    def absolute_url(self, href):
+        return urljoin(self.base_url + '/', href)
+
+    def accepts_url(self, href):
+        """True when a link is one of this site's articles"""
+        if not href or (self.exclude_url is not None and self.exclude_url.search(href)):
+            return False
+        return self.include_url is None or bool(self.include_url.search(self.absolute_url(href)))
+
+    def section_name(self, section):
+        """Category prefix for a section URL (its last path segment, mapped through section_names)"""
+        slug = section.rstrip('/').rsplit('/', 1)[-1]
+        return self.section_names.get(slug, slug.replace('-', ' ').title())
+
+    def categorize(self, title, description, listing_category=None, section=None, modified=None):
+        """Category from the listing, else the best keyword category; optionally prefixed with the section
+
+        Keyword categories are reused from the enrichment cache for text seen before
+        (modified is the article's modified time, else its publication date).
+        """
+        category = listing_category
+        if not category:
+            cache = get_enrichment_cache()
+            key = cache.fingerprint(self.categorizer.version, f"{title} {description}", modified)
+            category = cache.lookup('category', key)
+            if category is None:
+                category = self.categorizer.categorize(title, description)
+                cache.store(key, category)
+        if self.prefix_section and section:
+            # Avoid redundant names like "Economy - Economy"
+            section_name = self.section_name(section)
+            if section_name.lower() not in category.lower():
+                category = f"{section_name} - {category}"
+        return category
+
+    def candidate_groups(self, soup):
+        """Yield the listing's article candidates, one list per selector (or one list for the whole page)
+
+        The page is indexed in one walk first, so every per-link lookup below is
+        answered from the index. A candidate is
+        {'url', 'title', 'description', 'category', 'author', 'date', 'card_text'}.
+        """
+        index = ListingIndex(soup, self.listing_selectors, {
+            field: selectors for field, selectors in (
+                ('title', self.title_selectors),
+                ('description', self.listing_description.selectors),
+                ('category', self.listing_category.selectors),
+                ('author', self.listing_author.selectors),
+                ('date', self.listing_date_selectors),
+            ) if selectors
+        })
+
+        if self.listing_type == 'cards':
+            for cards in index.links:
+                if cards:
+                    yield [candidate for candidate in (self._card_candidate(card, index) for card in cards) if candidate]
+                    return
+            return
+
+        if self.first_match:
+            for links in index.links:
+                yield [candidate for candidate in (self._link_candidate(link, index) for link in links) if candidate]
+            return
+
+        # Union of all selectors in page order
+        yield [candidate for candidate in (self._link_candidate(link, index) for link in index.document_links)
+               if candidate]
+
+    def _candidate(self, href, title, card, index, author=''):
+        return {
+            'url': self.absolute_url(href),
+            'title': title,
+            'description': self.listing_description.extract(card, index, 'description'),
+            'category': self.listing_category.extract(card, index, 'category'),
+            'author': author,
+            'date': self.element_date(card, self.listing_date_selectors, index, 'date'),
+            'card_text': index.text(card, ' ') if self.listing_text_dates else '',
+        }
+
+    def _link_candidate(self, link, index):
+        href = link.get('href', '')
+        title = index.text(link)
+        if len(title) < self.min_title_length or not self.accepts_url(href) or link.parent is None:
+            return None
+        return self._candidate(href, title, link.parent, index)
+
+    def _card_candidate(self, card, index):
+        title_elem = next((found for found in (index.first_match(card, 'title', position)
+                                               for position in range(len(self.title_selectors))) if found), None)
+        if title_elem is None:
+            return None
+        href = title_elem.get('href', '')
+        title = index.text(title_elem)
+        if len(title) < self.min_title_length or not self.accepts_url(href):
+            return None
+        return self._candidate(href, title, card, index, author=self.listing_author.extract(card, index, 'author'))
+
+    def url_date(self, url):
+        """Date embedded in the article URL (/2025/08/06/), if the site uses one"""
+        if self.url_date_pattern is None:
+            return None
+        match = self.url_date_pattern.search(url)
+        if not match:
+            return None
+        try:
+            return date(*(int(part) for part in match.groups()))
+        except ValueError:
+            return None
+
+    def text_date(self, text):
+        """First date written out in a block of text"""
+        for pattern in self.date_text_patterns:
+            match = pattern.search(text)
+            if match:
+                parsed = parse_date(match.group(0))
+                if parsed:
+                    return parsed
+        return None
+
+    def element_date(self, scope, selectors, index=None, field=None):
+        """Date from the first element matching the selectors (datetime/content attribute, then text)"""
+        for position, (_, compiled) in enumerate(selectors):
+            found = index.first_match(scope, field, position) if index is not None else compiled.select_one(scope)
+            if found is None:
+                continue
+            parsed = parse_date(found.get('datetime') or found.get('content'))
+            if parsed:
+                return parsed
+            parsed = get_date_window().parse(found.get_text(strip=True), relative=self.relative_time)
+            if parsed:
+                return parsed
+        return None
+
+    def head_metadata(self, markup):
+        """Publication date metadata of a (possibly partial) article page, without counting it in the stats"""
+        soup = parse_html(markup, only=METADATA_TAGS)
+        return get_metadata_extractor().extract(soup, fields=('published',), record=False, fallbacks={
+            'published': ('dom', lambda: self.element_date(soup, self.article_meta_selectors)),
+        })
+
+    def page_date(self, soup):
+        """Publication date from a full article page's DOM: date tags, date elements, then the page text
+
+        Only used once the structured metadata had no date.
+        """
+        return (self.element_date(soup, self.article_meta_selectors)
+                or self.element_date(soup, self.article_date_selectors)
+                or self.text_date(soup.get_text()))
+
+    def detail_title(self, soup):
+        """Article title from the first title element on the page"""
+        for _, compiled in self.detail_title_selectors:
+            title_elem = compiled.select_one(soup)
+            if title_elem is not None:
+                return title_elem.get_text(strip=True)
+        return ''
+
+    def missing_date(self):
+        """Date used when none could be found (today, or None to drop the article)"""
+        return get_date_window().today if self.when_missing == 'today' else None
+
+def load_keyword_sets(sites_dir=SITES_DIR):
+    with open(os.path.join(sites_dir, KEYWORD_SETS_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+def load_site(key, sites_dir=SITES_DIR, keyword_sets=None):
+    """Load and compile one site definition (sites/<key>.json)"""
+    with open(os.path.join(sites_dir, f"{key}.json"), encoding='utf-8') as f:
+        config = json.load(f)
+    return SiteDefinition(key, config, keyword_sets or load_keyword_sets(sites_dir), sites_dir)
+
+@functools.lru_cache(maxsize=None)
+def cached_site(key, sites_dir=SITES_DIR):
+    """Site definition loaded once per process (how parse workers receive a site)"""
+    return load_site(key, sites_dir)
+
+def load_site_definitions(sites_dir=SITES_DIR):
+    """Load every site definition in the sites directory, ordered by file name"""
+    keyword_sets = load_keyword_sets(sites_dir)
+    keys = sorted(name[:-len('.json')] for name in os.listdir(sites_dir)
+                  if name.endswith('.json') and name != KEYWORD_SETS_FILE)
+    return [load_site(key, sites_dir, keyword_sets) for key in keys]
+
+def fetch_page(site, url, max_retries=3, conditional=False):
+    """Enhanced page fetching with GitHub Actions bypassing (conditional=True sends stored validators)
+
+    Network errors are retried inline against the run-wide retry budget. Blocked or
+    throttled responses (403/429/5xx) are not: the host is cooled down and the URL
+    is deferred to the retry pass at the end of its batch.
+    """
+    session = http_client.get_session()
+    rate_limiter = get_rate_limiter()
+    breaker = get_circuit_breaker()
+    validator_headers = get_validator_store().conditional_headers(url) if conditional else {}
+    for attempt in range(max_retries):
+        # No new requests once the crawl time is up: the rest of the run belongs to the output
+        if get_run_deadline().crawl_expired():
+            print(f"  ⏰ Crawl deadline reached - not fetching {url}")
+            return None
+
+        # Fast-fail the remaining URLs of a host whose circuit is open
+        if not breaker.allow(url):
+            print(f"  ⛔ Circuit open - skipping {url}")
+            return None
+
+        # Retries beyond the first attempt draw from the run-wide budget
+        if attempt > 0 and not breaker.spend_retry():
+            print(f"  💸 Retry budget exhausted - giving up on {url}")
+            return None
+
+        try:
+            # Randomize user agent for each attempt
+            # (sent per request so concurrent fetches never share mutated session headers)
+            user_agent = random.choice(GITHUB_ACTIONS_USER_AGENTS)
+            print(f"🤖 Using User-Agent: {user_agent}")
+
+            # Add random IP headers to bypass IP-based blocking
+            request_headers = {
+                'User-Agent': user_agent,
+                'Referer': site.referer,
+                'X-Forwarded-For': f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
+                'X-Real-IP': f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
+                'CF-Connecting-IP': f"{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
+            }
+            request_headers.update(validator_headers)
+
+            # Cool the host down between attempts; other hosts keep being served meanwhile
+            if attempt > 0:
+                delay = random.uniform(3, 8)
+                print(f"  ⏳ Host cooling down {delay:.1f}s before retry...")
+                rate_limiter.penalize(url, delay)
+
+            # Wait for this host's politeness token
+            rate_limiter.wait(url)
+
+            print(f"  🔄 Attempt {attempt + 1}/{max_retries}: Fetching {url}")
+            response = session.get(url, headers=request_headers, timeout=30)
+
+            if response.status_code == 200:
+                breaker.record_success(url)
+                print(f"  ✅ Success: {len(response.content)} bytes received")
+                return response
+            elif response.status_code == 304 and validator_headers:
+                breaker.record_success(url)
+                print(f"  ♻️ 304 Not Modified - page unchanged since last run")
+                return response
+            elif response.status_code in RETRYABLE_STATUSES:
+                if response.status_code == 403:
+                    print(f"  ❌ 403 Forbidden - GitHub Actions may be blocked, deferring retry to the end of the batch")
+                else:
+                    print(f"  ⚠️ Status {response.status_code}: {response.reason} - deferring retry to the end of the batch")
+                breaker.record_failure(url)
+                # Honour Retry-After (capped) when the server sends one
+                retry_after = response.headers.get('Retry-After', '')
+                rate_limiter.penalize(url, min(float(retry_after), 60) if retry_after.isdigit() else random.uniform(3, 8))
+                breaker.defer(url)
+                return None
+            else:
+                # The host answered; this page just is not available
+                breaker.record_success(url)
+                print(f"  ⚠️ Status {response.status_code}: {response.reason}")
+                return None
+
+        except requests.exceptions.RequestException as e:
+            breaker.record_failure(url)
+            print(f"  ❌ Network error (attempt {attempt + 1}): {e}")
+            if attempt == max_retries - 1:
+                print(f"  💀 All {max_retries} attempts failed for {url}")
+                breaker.defer(url)
+                return None
+
+    return None
+
+def article_description(item):
+    """An article's description, or "" when none was found"""
+    return item['description'] if item['description'] != NO_DESCRIPTION else ""
+
+def sentiment_text(item):
+    """Text an article's sentiment is scored on: its title and description"""
+    return item['title'] + " " + article_description(item)
+
+def build_news_item(site, title, link, description, published, category=None, author=None, section=None, modified=None):
+    """Categorize an article and build its output row (sentiment is filled in by the enrichment stage)"""
+    description = description or ""
+    news_item = {
+        "title": title,
+        "category": site.categorize(title, description, listing_category=category, section=section,
+                                    modified=modified or published),
+        "description": description or NO_DESCRIPTION,
+        "link": link,
+    }
+    if site.author is not None:
+        news_item["author"] = author or site.author
+    news_item.update({
+        "published_date": published,
+        "sentiment_score": None,
+        "sentiment_label": None,
+        "emotion": None,
+        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    })
+    return news_item
+
+def known_article(url, description=None, modified=None):
+    """(True, item or None) when an article was processed on an earlier run, (False, None) otherwise
+
+    A known article keeps its resolved date and enrichment; it is returned again
+    only while its date is still inside the run's date window. When the caller
+    already has the article's description or modified time and either differs
+    from the stored one, the article counts as new and is built and enriched again.
+    """
+    crawl_state = get_crawl_state()
+    record = crawl_state.get(url)
+    if record is None:
+        return False, None
+    item = record['item']
+    if item and get_date_window().contains(item['published_date']):
+        if crawl_state.changed(url, description, modified):
+            return False, None
+        return True, item
+    return True, None
+
+def article_modified(item):
+    """An article's modified time for the enrichment fingerprints, else its publication date"""
+    return get_crawl_state().modified(item['link']) or item['published_date']
+
+def skip_article(url, published, section, title=None):
+    """Remember an article outside the date window so later runs do not look it up again"""
+    label = f"{title[:50]}..." if title else url
+    if published is None:
+        print(f"    📅 Skipping article - no date found: {label}")
+    else:
+        print(f"    📅 Skipping article from {format_date(published)}: {label}")
+        get_crawl_state().remember(url, published_date=published, section=section)
+
+class NewsList:
+    """Ordered article list that keeps one article per title
+
+    Shared with the orchestrator, which reads what a site collected so far
+    when its collector is still running at the crawl deadline.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.titles = set()
+        self.lock = threading.Lock()
+
+    def add(self, item):
+        with self.lock:
+            if item['title'] in self.titles:
+                return False
+            self.titles.add(item['title'])
+            self.items.append(item)
+            return True
+
+    def add_all(self, items):
+        return sum(1 for item in items if self.add(item))
+
+    def sort(self, key):
+        with self.lock:
+            self.items.sort(key=key)
+
+    def snapshot(self):
+        """Copies of the articles collected so far (safe to enrich while the collector keeps running)"""
+        with self.lock:
+            return [dict(item) for item in self.items]
+
+def extract_listing(site, content):
+    """Article candidates of a listing page's raw bytes, one list per selector group (runs in the parse stage)"""
+    soup = parse_html(content, only=ANCHORS if site.anchors_only else None)
+    return list(site.candidate_groups(soup))
+
+def extract_article(site, content, fields):
+    """Metadata of an article page's raw bytes (runs in the parse stage; the caller records the sources)
+
+    One pass over the structured metadata; the site's selectors only fill what it lacks.
+    """
+    soup = parse_html(content)
+    return get_metadata_extractor().extract(soup, fields=fields, record=False, fallbacks={
+        'title': ('dom', lambda: site.detail_title(soup)),
+        'description': ('dom', lambda: site.detail_description.extract(soup)),
+        'author': ('dom', lambda: site.detail_author.extract(soup)),
+        'published': ('dom', lambda: site.page_date(soup)),
+    })
+
+def feed_items(site, entries, section):
+    """Build news items from a section feed (date, title and summary come from the feed)"""
+    crawl_state = get_crawl_state()
+    section_items = NewsList()
+
+    for entry in entries[:site.max_items_per_section]:
+        if not site.accepts_url(entry.url):
+            continue
+
+        summary = clean_summary(entry.summary)
+        modified = entry.updated or None
+        known, item = known_article(entry.url, summary or NO_DESCRIPTION, modified)
+        if known:
+            if item:
+                section_items.add(item)
+            continue
+
+        # Feeds often stamp UTC (WordPress pubDate is +0000): date the article by its Manila day, as HTML pages do
+        published = local_date(entry.published) if entry.published else None
+        if not get_date_window().contains(published):
+            skip_article(entry.url, published, section, entry.title)
+            continue
+
+        news_item = build_news_item(site, entry.title, entry.url, summary, published, section=section, modified=modified)
+        crawl_state.remember(entry.url, news_item, section=section, modified=modified)
+        section_items.add(news_item)
+
+    return section_items.items
+
+def article_date(site, url):
+    """Look up an article's publication date on its page (streamed: stops once the <head> has it)"""
+    extractor = get_metadata_extractor()
+    resolved = []
+
+    def extract_date(markup):
+        metadata = site.head_metadata(markup)
+        if metadata.published:
+            resolved.append(metadata)
+        return metadata.published
+
+    try:
+        headers = {'User-Agent': random.choice(GITHUB_ACTIONS_USER_AGENTS)}
+        head_date, page_content = get_head_fetcher().fetch_date(url, extract_date, headers=headers, timeout=10)
+        if head_date:
+            extractor.record(resolved[-1], fields=('published',))
+            return head_date
+        if page_content is None:
+            return None
+        # Date not in the head: fall back to the whole page
+        metadata = get_parse_stage().run(extract_article, site, page_content, ('published',))
+        extractor.record(metadata, fields=('published',))
+        return metadata.published
+    except Exception as e:
+        print(f"Error extracting date from {url}: {e}")
+        return None
+
+def listing_item(site, candidate, section, memo):
+    """Resolve a listing candidate's date and build its news item; None when it is outside the window"""
+    url = candidate['url']
+    published = site.url_date(url) or candidate['date']
+
+    # Article page lookups are the last optional stage dropped on a tight run deadline
+    if published is None and site.article_meta_selectors and get_run_deadline().allows('detail_fetches'):
+        print(f"🔍 Checking actual date for: {url}")
+        published = memo.get(url, lambda article_url: article_date(site, article_url), section=section)
+    if published is None and site.listing_text_dates:
+        published = site.text_date(candidate['card_text'])
+    if published is None:
+        published = site.missing_date()
+
+    if not get_date_window().contains(published):
+        skip_article(url, published, section, candidate['title'])
+        return None
+
+    print(f"    ✅ Including {site.name} article from {format_date(published)}: {candidate['title'][:50]}...")
+    return build_news_item(site, candidate['title'], url, shorten(candidate['description']), published,
+                           category=candidate['category'], author=candidate['author'], section=section)
+
+def listing_items(site, candidate_groups, section, memo):
+    """Date-filter and enrich the articles extracted from one listing page"""
+    crawl_state = get_crawl_state()
+    section_items = NewsList()
+    seen_urls = set()
+
+    for candidates in candidate_groups:
+        for candidate in candidates[:site.max_items_per_section]:
+            url = candidate['url']
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            known, item = known_article(url, shorten(candidate['description']) or NO_DESCRIPTION)
+            if known:
+                if item:
+                    section_items.add(item)
+                continue
+
+            news_item = listing_item(site, candidate, section, memo)
+            if news_item:
+                crawl_state.remember(url, news_item, section=section)
+                section_items.add(news_item)
+
+        if section_items.items and site.first_match:
+            break  # Stop trying other selectors once one found news
+
+    return section_items.items
+
+def listing_links(candidate_groups):
+    """Article URLs on a listing page, in page order"""
+    links = {}
+    for candidates in candidate_groups:
+        for candidate in candidates:
+            links.setdefault(candidate['url'], True)
+    return list(links)
+
+def crawl_listing_site(site, feed_entries, memo, news):
+    """Sites whose listing pages carry everything: one item per listing entry"""
+    validator_store = get_validator_store()
+    html_sections = [section for section in site.sections if feed_entries[section] is None]
+    responses = dict(zip(html_sections, fetch_pages(html_sections, lambda url: fetch_page(site, url, conditional=True))))
+    # Hand every fetched page to the parse stage at once: later pages parse while earlier ones are processed
+    parsed = {section: get_parse_stage().submit(extract_listing, site, response.content)
+              for section, response in responses.items() if response is not None and response.status_code != 304}
+
+    for index, section in enumerate(site.sections, 1):
+        if get_run_deadline().crawl_expired():
+            print(f"    ⏰ Crawl deadline reached - keeping the {len(news.items)} articles collected so far")
+            break
+        try:
+            print(f"  [{index}/{len(site.sections)}] Processing: {section}")
+
+            response = responses.get(section)
+            if feed_entries[section] is not None:
+                # Feed entries already carry title, date and summary - no listing page needed
+                section_items = feed_items(site, feed_entries[section], section)
+                print(f"    📡 Read {len(feed_entries[section])} feed entries")
+            elif response is None:
+                print(f"    ❌ Failed to fetch {section} after all retry attempts")
+                continue
+            elif response.status_code == 304:
+                # Unchanged since last run: reuse its articles, re-checking dates against the window
+                cached_news = validator_store.cached_links(section) or []
+                section_items = [item for item in cached_news if get_date_window().contains(item['published_date'])]
+                print(f"    ♻️ Reusing {len(section_items)}/{len(cached_news)} articles from the previous run")
+            else:
+                section_items = listing_items(site, parsed[section].result(), section, memo)
+                validator_store.record(section, response, section_items)
+
+            added = news.add_all(section_items)
+            print(f"    ✅ Found {len(section_items)} articles, {added} unique added")
+
+        except Exception as e:
+            print(f"    ❌ Error processing {section}: {e}")
+            continue
+
+def process_listing_pages(site, page_urls, all_links):
+    """Fetch listing pages concurrently and add their article links to all_links (link -> section)
+
+    Returns {page_url: links on that page, or None when the page could not be fetched}.
+    """
+    validator_store = get_validator_store()
+    responses = fetch_pages(page_urls, lambda url: fetch_page(site, url, conditional=True))
+    parsed = {page_url: get_parse_stage().submit(extract_listing, site, response.content)
+              for page_url, response in zip(page_urls, responses) if response is not None and response.status_code != 304}
+
+    links_by_page = dict.fromkeys(page_urls)
+    for index, (page_url, response) in enumerate(zip(page_urls, responses), 1):
+        if get_run_deadline().crawl_expired():
+            print(f"    ⏰ Crawl deadline reached - skipping the remaining {len(page_urls) - index + 1} listing pages")
+            break
+        try:
+            print(f"  [{index}/{len(page_urls)}] Processing: {page_url}")
+
+            if response is None:
+                print(f"    ❌ Failed to fetch {page_url} after all retry attempts")
+                continue
+
+            if response.status_code == 304:
+                # Unchanged since last run: reuse its link list without re-parsing
+                page_links = validator_store.cached_links(page_url) or []
+                print(f"    ♻️ Reusing {len(page_links)} links from the previous run")
+            else:
+                page_links = listing_links(parsed[page_url].result())
+                validator_store.record(page_url, response, page_links)
+
+            links_by_page[page_url] = page_links
+            section = page_url.split('?')[0]
+            new_links = [href for href in page_links if href not in all_links]
+            for href in new_links:
+                all_links[href] = section
+
+            print(f"    ✅ Found {len(new_links)} new articles on this page")
+
+        except Exception as e:
+            print(f"    ❌ Error fetching {page_url}: {e}")
+            continue
+
+    return links_by_page
+
+def detail_item(site, link, section):
+    """Fetch and parse one article page; returns None when the article is skipped
+
+    A known article inside the window is read again only once its cached page
+    expired (the cached copy is the page it was built from), and is rebuilt
+    when the page's description or modified time changed.
+    """
+    known, item = known_article(link)
+    if known and (item is None or get_response_cache().fresh(link) or not get_run_deadline().allows('detail_fetches')):
+        return item
+
+    # A date in the URL settles old articles without downloading them
+    published = site.url_date(link)
+    if published is not None and not get_date_window().contains(published):
+        skip_article(link, published, section)
+        return None
+
+    # New articles need a detail fetch - the last optional stage dropped on a tight run deadline
+    if not get_run_deadline().allows('detail_fetches'):
+        return None
+
+    # Read through the shared response cache
+    response = get_response_cache().fetch(link, lambda url: fetch_page(site, url))
+    if response is None:
+        raise RuntimeError("fetch failed after all retry attempts")
+
+    # Parsed on a parse worker while this thread's slot waits without holding the GIL
+    fields = ('title', 'description', 'author', 'modified') + (('published',) if published is None else ())
+    metadata = get_parse_stage().run(extract_article, site, response.content, fields)
+    get_metadata_extractor().record(metadata, fields)
+    description = shorten(metadata.description or '')
+    if known and not get_crawl_state().changed(link, description or NO_DESCRIPTION, metadata.modified):
+        return item
+
+    title = metadata.title or ''
+    if len(title) < site.detail_min_title_length:
+        print(f"    ⚠️ Skipping - no valid title found")
+        return None
+    if any(phrase in title for phrase in site.skip_titles):
+        print(f"    ❌ Skipping error page: {title}")
+        return None
+
+    if published is None:
+        if metadata.published is not None:
+            get_metadata_extractor().record_page_date()
+        published = metadata.published or site.missing_date()
+    if not get_date_window().contains(published):
+        skip_article(link, published, section, title)
+        return None
+
+    news_item = build_news_item(site, title, link, description, published, author=metadata.author, section=section,
+                                modified=metadata.modified)
+    get_crawl_state().remember(link, news_item, section=section, modified=metadata.modified)
+    return news_item
+
+def crawl_detail_site(site, feed_entries, news):
+    """Sites whose listings only give links: collect links (with pagination), then fetch each article"""
+    crawl_state = get_crawl_state()
+
+    # Sections with a feed get their articles (with dates and summaries) straight from it
+    for section in site.sections:
+        if get_run_deadline().crawl_expired():
+            print(f"    ⏰ Crawl deadline reached - keeping the {len(news.items)} articles collected so far")
+            return
+        if feed_entries[section] is not None:
+            news.add_all(feed_items(site, feed_entries[section], section))
+    if news.items:
+        print(f"📡 {len(news.items)} articles from section feeds")
+
+    # Sections without a feed: fetch the first listing page, then only go deeper where
+    # the first page did not reach last run's newest article (the high-water mark)
+    html_sections = [section for section in site.sections if feed_entries[section] is None]
+    all_links = {}  # Insertion-ordered link -> section dict to avoid duplicates while keeping link order
+    first_page_links = process_listing_pages(site, html_sections, all_links)
+
+    pages_to_try = []
+    paginate = get_run_deadline().allows('pagination')
+    for section in html_sections:
+        page_links = first_page_links.get(section)
+        reached_high_water = (site.stop_at_high_water and page_links is not None
+                              and crawl_state.reached_high_water(section, page_links))
+        if reached_high_water or not paginate:
+            if reached_high_water:
+                print(f"    ⏹️ {section}: reached last run's newest article, skipping deeper pages")
+                crawl_state.record_skipped_pages(len(site.pagination_pages))
+            # Known articles from the skipped pages are still part of today's output
+            for href in crawl_state.section_urls(section):
+                all_links.setdefault(href, section)
+            continue
+        pages_to_try.extend(f"{section}?{site.pagination_param}={page}" for page in site.pagination_pages)
+
+    if pages_to_try and not get_run_deadline().crawl_expired():
+        process_listing_pages(site, pages_to_try, all_links)
+
+    # Only move the mark when the section was fully crawled, so a deadline-shortened run is caught up next time
+    if site.stop_at_high_water:
+        for section, page_links in first_page_links.items():
+            if page_links and (paginate or crawl_state.reached_high_water(section, page_links)):
+                crawl_state.set_high_water(section, page_links[0])
+
+    get_validator_store().save()
+    print(f"📊 Total unique article links found: {len(all_links)}")
+    if get_run_deadline().crawl_expired():
+        print(f"    ⏰ Crawl deadline reached - keeping the {len(news.items)} articles collected so far")
+        return
+
+    # Now process each article on a worker pool (results come back in link order)
+    links_to_process = list(all_links)[:site.max_articles]
+    if len(all_links) > len(links_to_process):
+        print(f"    ⏹️ Limiting to the first {site.max_articles} articles to be respectful")
+    print(f"📰 Processing {len(links_to_process)} articles with {DETAIL_CONCURRENCY} workers...")
+
+    # Each article joins the shared list as soon as it is built, so a deadline cut keeps it
+    def worker(link):
+        news_item = detail_item(site, link, all_links[link])
+        return news_item, news_item is not None and news.add(news_item)
+
+    results = run_worker_pool(links_to_process, worker, concurrency=DETAIL_CONCURRENCY, timeout=DETAIL_TIMEOUT)
+
+    # Articles whose fetch was deferred (blocked or throttled host) get one more try now that the pool is done
+    breaker = get_circuit_breaker()
+    retry_links = [link for link in breaker.pop_deferred([result.item for result in results if result.error])
+                   if breaker.spend_retry()]
+    if retry_links:
+        print(f"🔁 Retrying {len(retry_links)} deferred article(s)...")
+        retried = {result.item: result for result in run_worker_pool(
+            retry_links, worker, concurrency=DETAIL_CONCURRENCY, timeout=DETAIL_TIMEOUT)}
+        breaker.record_deferred_recovered(sum(1 for result in retried.values() if not result.error))
+        results = [retried.get(result.item, result) for result in results]
+
+    failures = {}
+    for index, result in enumerate(results, 1):
+        print(f"  [{index}/{len(results)}] {result.item} ({result.elapsed:.1f}s)")
+        if result.error:
+            # Record failures and timeouts per URL for the run summary
+            failures[result.item] = result.error
+            print(f"    ❌ Error processing {result.item}: {result.error}")
+            continue
+        news_item, added = result.value
+        if added:
+            print(f"    ✅ Added article: {news_item['title'][:50]}...")
+
+    # Back to link order (feed articles first), whatever order the workers finished in
+    order = {link: position for position, link in enumerate(links_to_process)}
+    news.sort(key=lambda item: order.get(item['link'], -1))
+
+    if failures:
+        timeouts = sum(1 for error in failures.values() if error == 'timeout')
+        print(f"⚠️ {len(failures)} article(s) failed ({timeouts} timed out)")
+
+def scrape_site(site, news=None):
+    """Collect the articles inside the run's date window from one site; returns the news items in discovery order
+
+    Articles are added to news (a NewsList) as they are found, so a caller can
+    read a partial result when the collector does not finish in time.
+    """
+    print(f"🔍 Starting {site.name} scraping ({len(site.sections)} sections)...")
+    news = NewsList() if news is None else news
+    memo = SingleFlightMemo(f"{site.name} article dates")
+
+    # Discover articles from each section's feed; only sections without one are scraped as HTML
+    if site.feed_pattern is not None:
+        feed_entries = discover_sections(
+            {section: site.feed_urls(section) for section in site.sections},
+            headers={'User-Agent': random.choice(GITHUB_ACTIONS_USER_AGENTS), 'Referer': site.referer}
+        )
+    else:
+        feed_entries = {section: None for section in site.sections}
+
+    if site.detail:
+        crawl_detail_site(site, feed_entries, news)
+    else:
+        crawl_listing_site(site, feed_entries, memo, news)
+
+    # Enrichment stage: score the new articles in one batch (known articles keep their stored scores)
+    # TextBlob is the first thing dropped on a tight run deadline (VADER alone is used)
+    get_sentiment_engine().enrich(news.items, sentiment_text, use_textblob=get_run_deadline().allows('textblob'),
+                                  modified_of=article_modified)
+
+    get_validator_store().save()
+    get_crawl_state().save()
+    get_enrichment_cache().save()
+    memo.print_summary()
+    print(f"🎯 Total unique {site.name} articles collected: {len(news.items)}")
+    return news.items
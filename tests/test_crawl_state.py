@@ -0,0 +1,134 @@
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+import date_engine
+import site_engine
+from crawl_state import CrawlState
+from date_engine import DateWindow
+from enrichment_cache import EnrichmentCache
+from feed_discovery import FeedEntry, parse_feed
+from metadata_extractor import MetadataExtractor
+from html_parser import parse_html
+
+NOW = datetime(2025, 8, 6, 12, 0)
+URL = 'https://business.inquirer.net/541201/bsp-keeps-key-rate-steady'
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    """A fresh crawl state and enrichment cache in a temporary directory, and a fixed date window"""
+    crawl_state = CrawlState(path=str(tmp_path / 'crawl_state.json'))
+    monkeypatch.setattr(site_engine, 'get_crawl_state', lambda: crawl_state)
+    cache = EnrichmentCache(path=str(tmp_path / 'enrichment_cache.json'))
+    monkeypatch.setattr(site_engine, 'get_enrichment_cache', lambda: cache)
+    monkeypatch.setattr(date_engine, '_date_window', DateWindow(days=2, now=NOW))  # Undone after each test
+    return crawl_state
+
+def entry(summary='The BSP kept its policy rate unchanged.', updated=''):
+    return FeedEntry(URL, 'BSP keeps key rate steady', datetime(2025, 8, 6, 8, 30), summary, updated)
+
+def test_changed_compares_only_known_values(state):
+    item = {'title': 'BSP keeps key rate steady', 'description': 'Old excerpt.', 'published_date': NOW.date()}
+    state.remember(URL, item, modified='2025-08-06T09:00:00+08:00')
+
+    assert not state.changed(URL)
+    assert not state.changed(URL, description='Old excerpt.', modified='2025-08-06T09:00:00+08:00')
+    assert state.changed(URL, description='New excerpt.')
+    assert state.changed(URL, modified='2025-08-06T11:30:00+08:00')
+    assert not state.changed('https://business.inquirer.net/unknown', description='Anything')
+    assert state.stats['changed'] == 2
+    assert state.modified(URL) == '2025-08-06T09:00:00+08:00'
+
+def test_feed_items_reuse_unchanged_and_rebuild_changed_articles(state):
+    site = site_engine.load_site('inquirer')
+    section = site.sections[0]
+
+    first, = site_engine.feed_items(site, [entry()], section)
+    again, = site_engine.feed_items(site, [entry()], section)
+    assert again == first
+    assert state.stats['known_reused'] == 1 and state.stats['changed'] == 0
+
+    edited, = site_engine.feed_items(site, [entry(summary='The BSP kept rates unchanged for a third meeting.')], section)
+    assert edited['description'] == 'The BSP kept rates unchanged for a third meeting.'
+    assert state.stats['changed'] == 1
+
+    updated, = site_engine.feed_items(site, [entry(summary=edited['description'], updated='2025-08-06T10:00:00Z')],
+                                      section)
+    assert state.stats['changed'] == 2
+    assert state.modified(URL) == '2025-08-06T10:00:00Z'
+    assert site_engine.article_modified(updated) == '2025-08-06T10:00:00Z'
+
+def test_metadata_extractor_reads_modified_time():
+    page = parse_html('''<html><head>
+        <meta property="article:published_time" content="2025-08-06T08:30:00+08:00">
+        <meta property="og:updated_time" content="2025-08-06T10:15:00+08:00">
+        <meta property="article:modified_time" content="2025-08-06T10:00:00+08:00">
+        </head><body></body></html>''')
+
+    metadata = MetadataExtractor().extract(page)
+
+    assert metadata.published == datetime(2025, 8, 6).date()
+    assert metadata.modified == '2025-08-06T10:00:00+08:00'  # article:modified_time outranks og:updated_time
+    assert metadata.sources['modified'] == 'article-meta'
+
+def test_metadata_extractor_prefers_json_ld_date_modified():
+    page = parse_html('''<html><head>
+        <script type="application/ld+json">{"@type": "NewsArticle", "headline": "Peso closes stronger",
+            "datePublished": "2025-08-06T16:42:00+08:00", "dateModified": "2025-08-06T18:05:00+08:00"}</script>
+        <meta property="og:updated_time" content="2025-08-06T18:00:00+08:00">
+        </head><body></body></html>''')
+
+    assert MetadataExtractor().extract(page).modified == '2025-08-06T18:05:00+08:00'
+
+def test_concurrent_saves_leave_a_complete_file(tmp_path):
+    crawl_state = CrawlState(path=str(tmp_path / 'crawl_state.json'))
+    for number in range(200):
+        crawl_state.remember(f'https://business.inquirer.net/{number}/story',
+                             {'title': 'Story', 'description': 'x' * 200, 'published_date': NOW.date(),
+                              'link': f'https://business.inquirer.net/{number}/story'})
+
+    threads = [threading.Thread(target=crawl_state.save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(CrawlState(path=crawl_state.path).articles) == 200
+    assert os.listdir(tmp_path) == ['crawl_state.json']  # No temporary file left behind
+
+def test_detail_item_reads_the_date_from_the_fetched_page(state, monkeypatch, capsys):
+    class Response:
+        content = b'''<html><head><title>Peso closes stronger vs dollar</title>
+            <meta property="og:title" content="Peso closes stronger vs dollar">
+            <meta property="article:published_time" content="2025-08-06T16:42:00+08:00"></head></html>'''
+    class Cache:
+        def fresh(self, url):
+            return False
+        def fetch(self, url, fetch):
+            return Response()
+    class InlineParse:
+        def run(self, function, *args):
+            return function(*args)
+    extractor = MetadataExtractor()
+    monkeypatch.setattr(site_engine, 'get_response_cache', lambda: Cache())
+    monkeypatch.setattr(site_engine, 'get_parse_stage', lambda: InlineParse())
+    monkeypatch.setattr(site_engine, 'get_metadata_extractor', lambda: extractor)
+    site = site_engine.load_site('philstar')
+
+    news_item = site_engine.detail_item(site, 'https://www.philstar.com/business/peso-closes-stronger', site.sections[0])
+
+    assert news_item['published_date'] == NOW.date()
+    assert extractor.redundant_fetches_avoided == 1
+    extractor.print_summary()
+    assert 'reused the downloaded article 1 time(s)' in capsys.readouterr().out
+
+def test_feed_items_date_articles_by_the_manila_day(state):
+    site = site_engine.load_site('inquirer')
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'feeds', 'rss2.xml'), 'rb') as f:
+        entries = parse_feed(f.read())
+
+    items = site_engine.feed_items(site, entries[-1:], site.sections[0])
+
+    assert [item['published_date'] for item in items] == [NOW.date()]  # pubDate 22:00 UTC the day before
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+from dedupe import DedupeArticle, near_duplicate_clusters, opposite_directions, directions, remove_near_duplicates
+
+pytest.importorskip('numpy')
+
+DAY = date(2025, 8, 6)
+LEDE = ("Households will pay {} as the generation charge {} by 12 centavos per kilowatt-hour, "
+        "the power distributor said on Monday.")
+
+def article(source, title, description='', published=DAY):
+    return DedupeArticle(source, title, description, published)
+
+def grouped(articles):
+    return sorted(sorted(cluster) for cluster in near_duplicate_clusters(articles))
+
+def test_copies_across_sources_are_one_story():
+    articles = [article('inquirer', 'Meralco cuts power rates this month', LEDE.format('less', 'falls')),
+                article('philstar', 'UPDATE: Meralco trims power rates this month', LEDE.format('less', 'falls'),
+                        date(2025, 8, 7)),
+                article('businessmirror', 'Meralco cuts power rates this month')]  # No excerpt: title match
+
+    assert grouped(articles) == [[0, 1, 2]]
+
+def test_same_template_opposite_meaning_stays_apart():
+    articles = [article('inquirer', 'Meralco cuts power rates this month', LEDE.format('less', 'falls')),
+                article('philstar', 'Meralco hikes power rates this month', LEDE.format('more', 'rises'))]
+
+    assert grouped(articles) == [[0], [1]]
+    assert opposite_directions(directions('PSEi ends higher'), directions('PSEi ends lower'))
+    assert not opposite_directions(directions('Peso surges'), directions('Peso jumps to record'))
+
+def test_same_source_articles_are_never_merged():
+    articles = [article('inquirer', 'Meralco cuts power rates this month', LEDE.format('less', 'falls')),
+                article('inquirer', 'Meralco cuts power rates this month', LEDE.format('less', 'falls'))]
+
+    assert grouped(articles) == [[0], [1]]
+
+def test_copies_published_days_apart_are_different_stories():
+    articles = [article('inquirer', 'Meralco cuts power rates this month', LEDE.format('less', 'falls')),
+                article('philstar', 'Meralco cuts power rates this month', LEDE.format('less', 'falls'),
+                        date(2025, 8, 8)),
+                article('businessmirror', 'Meralco cuts power rates this month', LEDE.format('less', 'falls'), None)]
+
+    assert grouped(articles) == [[0, 2], [1]]  # An unknown date fits either
+
+def test_remove_near_duplicates_keeps_the_most_complete_copy():
+    short = {'title': 'Meralco cuts power rates this month', 'description': '', 'published_date': DAY}
+    full = {'title': 'Meralco cuts power rates this month', 'description': LEDE.format('less', 'falls'),
+            'published_date': DAY, 'author': 'Reporter'}
+    other = {'title': 'Peso closes stronger vs dollar', 'description': '', 'published_date': DAY}
+
+    kept = remove_near_duplicates({'inquirer': [short, other], 'philstar': [full]}, lambda item: item['description'])
+
+    assert kept == {'inquirer': [other], 'philstar': [full]}
@@ -0,0 +1,170 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import feed_discovery
+import http_client
+from feed_discovery import FeedEntry, clean_summary, discover_sections, parse_feed, parse_feed_date
+from date_engine import local_date
+from run_deadline import RunDeadline
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'feeds')
+MANILA = timezone(timedelta(hours=8))
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+class Response:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+
+class NoWait:
+    def wait(self, url):
+        pass
+
+@pytest.fixture
+def feeds(monkeypatch):
+    """Serve feed URLs from a dict: a Response, or an exception to raise; records the URLs requested"""
+    responses, requested = {}, []
+
+    def get(url, headers=None, timeout=None):
+        requested.append(url)
+        response = responses.get(url, Response(404))
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(http_client, 'get', get)
+    monkeypatch.setattr(feed_discovery, 'get_rate_limiter', lambda: NoWait())
+    monkeypatch.setattr(feed_discovery, 'FEED_DISCOVERY_ENABLED', True)
+    return responses, requested
+
+def test_parse_rss():
+    entries = parse_feed(fixture('rss2.xml'))
+
+    assert [entry.url for entry in entries] == [
+        'https://business.inquirer.net/541201/bsp-keeps-key-rate-steady',
+        'https://business.inquirer.net/541188/meralco-cuts-power-rates',  # From the guid when there is no link
+        'https://business.inquirer.net/541140/psei-ends-lower',
+        'https://business.inquirer.net/541230/peso-opens-stronger',
+    ]
+    first = entries[0]
+    assert first.title == 'BSP keeps key rate steady at 5.75% as inflation eases'
+    assert first.published == datetime(2025, 8, 6, 8, 30, tzinfo=timezone.utc)
+    assert first.summary.startswith('<p>The Bangko Sentral')
+    assert entries[1].published == datetime(2025, 8, 6, 1, 5, tzinfo=MANILA)  # dc:date
+    assert entries[2].published is None
+    assert entries[2].summary == ''
+    assert all(entry.updated == '' for entry in entries)
+
+def test_parse_atom():
+    entries = parse_feed(fixture('atom.xml'))
+
+    assert entries == [
+        FeedEntry('https://businessmirror.com.ph/2025/08/06/exports-rebound/',
+                  'Exports rebound in June on electronics demand',
+                  datetime(2025, 8, 6, 2, 15, tzinfo=timezone.utc),
+                  '<p>Merchandise exports grew 8 percent in June.</p>',
+                  '2025-08-06T04:00:00Z'),
+        FeedEntry('https://businessmirror.com.ph/2025/08/05/remittances-record/',
+                  'Remittances hit record in first half',
+                  datetime(2025, 8, 5, 23, 40, tzinfo=MANILA),
+                  'Cash sent home by overseas Filipinos rose 3 percent.',
+                  '2025-08-05T23:40:00+08:00'),
+    ]
+
+def test_parse_news_sitemap():
+    entries = parse_feed(fixture('news_sitemap.xml'))
+
+    assert [(entry.title, entry.published) for entry in entries] == [
+        ('Peso closes stronger vs dollar', datetime(2025, 8, 6, 16, 42, tzinfo=MANILA)),
+        ('Ayala Land first-half profit up 12%', datetime(2025, 8, 6, 10, 0, tzinfo=MANILA)),  # From lastmod
+    ]
+    assert all(entry.summary == '' for entry in entries)
+    assert [entry.updated for entry in entries] == ['', '2025-08-06T10:00:00+08:00']
+
+def test_utc_pub_date_is_dated_by_the_manila_day():
+    entry = parse_feed(fixture('rss2.xml'))[-1]
+
+    assert entry.published == datetime(2025, 8, 5, 22, 0, tzinfo=timezone.utc)
+    assert local_date(entry.published) == date(2025, 8, 6)  # 06:00 in Manila
+    assert local_date(datetime(2025, 8, 5, 22, 0)) == date(2025, 8, 5)  # Naive: already local
+
+@pytest.mark.parametrize('content', [
+    fixture('error_page.html'),
+    b'<html><body><p>Service unavailable</p></body></html>',
+    b'',
+    b'{"items": []}',
+])
+def test_parse_feed_rejects_non_feeds(content):
+    assert parse_feed(content) is None
+
+@pytest.mark.parametrize('text, expected', [
+    ('Wed, 06 Aug 2025 08:30:00 +0000', datetime(2025, 8, 6, 8, 30, tzinfo=timezone.utc)),
+    ('Wed, 06 Aug 2025 16:30:00 +0800', datetime(2025, 8, 6, 16, 30, tzinfo=MANILA)),
+    ('2025-08-06T02:15:00Z', datetime(2025, 8, 6, 2, 15, tzinfo=timezone.utc)),
+    ('  2025-08-06T10:00:00+08:00\n', datetime(2025, 8, 6, 10, 0, tzinfo=MANILA)),
+    ('2025-08-06', datetime(2025, 8, 6)),
+    ('not a date', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_feed_date(text, expected):
+    assert parse_feed_date(text) == expected
+
+def test_clean_summary_strips_markup_and_wordpress_footer():
+    summary = parse_feed(fixture('rss2.xml'))[0].summary
+
+    assert clean_summary(summary) == ('The Bangko Sentral ng Pilipinas kept its policy rate unchanged on Wednesday, '
+                                      'citing slower price growth.')
+
+def test_clean_summary_plain_text_and_footer():
+    text = "Households will see   lower bills.\nThe post Meralco cuts rates appeared first on Inquirer Business."
+    assert clean_summary(text) == 'Households will see lower bills.'
+
+def test_clean_summary_shortens_long_text():
+    assert clean_summary('word ' * 100, limit=20) == 'word word word word ...'
+    assert clean_summary('') == ''
+    assert clean_summary(None) == ''
+
+def test_discover_sections_reads_feeds_and_falls_back(feeds):
+    responses, requested = feeds
+    responses.update({
+        'https://a.example/feed/': Response(200, fixture('rss2.xml')),
+        'https://b.example/feed/': Response(200, fixture('error_page.html')),
+        'https://c.example/feed/': Response(503),
+        'https://c.example/sitemap.xml': Response(200, fixture('news_sitemap.xml')),
+        'https://d.example/feed/': ConnectionError('connection reset'),
+    })
+
+    discovered = discover_sections({
+        'https://a.example/': ['https://a.example/feed/'],
+        'https://b.example/': ['https://b.example/feed/'],
+        'https://c.example/': ['https://c.example/feed/', 'https://c.example/sitemap.xml'],
+        'https://d.example/': ['https://d.example/feed/'],
+        'https://e.example/': ['https://e.example/feed/'],
+    })
+
+    assert len(discovered['https://a.example/']) == 4
+    assert discovered['https://b.example/'] is None  # HTML error page served with status 200
+    assert [entry.title for entry in discovered['https://c.example/']][0] == 'Peso closes stronger vs dollar'
+    assert discovered['https://d.example/'] is None  # Request failed
+    assert discovered['https://e.example/'] is None  # 404
+    assert 'https://c.example/sitemap.xml' in requested
+
+def test_discover_sections_disabled(feeds, monkeypatch):
+    responses, requested = feeds
+    monkeypatch.setattr(feed_discovery, 'FEED_DISCOVERY_ENABLED', False)
+
+    assert discover_sections({'https://a.example/': ['https://a.example/feed/']}) == {'https://a.example/': None}
+    assert requested == []
+
+def test_discover_sections_stops_at_the_crawl_deadline(feeds, monkeypatch):
+    responses, requested = feeds
+    monkeypatch.setattr(feed_discovery, 'get_run_deadline', lambda: RunDeadline(total_seconds=0, reserve_seconds=0))
+
+    assert discover_sections({'https://a.example/': ['https://a.example/feed/']}) == {'https://a.example/': None}
+    assert requested == []
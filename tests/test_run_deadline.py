@@ -0,0 +1,146 @@
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date
+
+import pytest
+
+import http_client
+import site_engine
+import universal_news_scraper
+from crawl_state import CrawlState
+from enrichment_cache import EnrichmentCache
+from response_cache import ResponseCache
+from run_deadline import RunDeadline
+from site_engine import NewsList
+
+def item(title, link):
+    return {'title': title, 'description': 'Details.', 'link': link, 'published_date': date(2025, 8, 6),
+            'sentiment_score': None, 'sentiment_label': None, 'emotion': None}
+
+def test_fetch_page_stops_at_the_crawl_deadline(monkeypatch):
+    requested = []
+    monkeypatch.setattr(site_engine, 'get_run_deadline', lambda: RunDeadline(total_seconds=0, reserve_seconds=0))
+    monkeypatch.setattr(http_client, 'get_session', lambda: type('Session', (), {'get': requested.append})())
+
+    site = site_engine.load_site('inquirer')
+    assert site_engine.fetch_page(site, 'https://business.inquirer.net/') is None
+    assert requested == []
+
+def test_process_listing_pages_skips_pages_after_the_deadline(monkeypatch):
+    monkeypatch.setattr(site_engine, 'get_run_deadline', lambda: RunDeadline(total_seconds=0, reserve_seconds=0))
+    monkeypatch.setattr(site_engine, 'fetch_pages', lambda urls, fetch: [None] * len(urls))
+
+    site = site_engine.load_site('philstar')
+    pages = ['https://www.philstar.com/business', 'https://www.philstar.com/business?page=2']
+    all_links = {}
+    assert site_engine.process_listing_pages(site, pages, all_links) == dict.fromkeys(pages)
+    assert all_links == {}
+
+def test_news_list_snapshot_is_a_copy():
+    news = NewsList()
+    news.add(item('Peso closes stronger', 'https://a.example/1'))
+    assert not news.add(item('Peso closes stronger', 'https://b.example/1'))
+
+    partial = news.snapshot()
+    partial[0]['sentiment_score'] = 0.5
+    assert news.items[0]['sentiment_score'] is None
+
+def test_unfinished_source_keeps_its_partial_articles(monkeypatch):
+    scored = []
+    class Engine:
+        def enrich(self, items, text_of, use_textblob=True, modified_of=None):
+            scored.append(use_textblob)
+            for news_item in items:
+                news_item['sentiment_score'] = 0.0
+            return items
+    monkeypatch.setattr(universal_news_scraper, 'get_sentiment_engine', lambda: Engine())
+    news = NewsList()
+    news.add(item('Peso closes stronger', 'https://a.example/1'))
+
+    partial = universal_news_scraper.finished_result(Future(), news, 'Philstar')
+
+    assert [news_item['title'] for news_item in partial] == ['Peso closes stronger']
+    assert partial[0]['sentiment_score'] == 0.0 and scored == [False]
+    assert news.items[0]['sentiment_score'] is None  # The collector's own list is left alone
+
+def test_finished_source_returns_its_result():
+    future = Future()
+    future.set_result(['done'])
+    assert universal_news_scraper.finished_result(future, NewsList(), 'Inquirer') == ['done']
+
+def test_detail_articles_join_the_shared_list_and_keep_link_order(monkeypatch):
+    links = [f'https://www.philstar.com/business/2025/08/06/{number}/story' for number in range(6)]
+    site = site_engine.load_site('philstar')
+
+    def process_listing_pages(site, page_urls, all_links):
+        for link in links:
+            all_links.setdefault(link, page_urls[0])
+        return {page_url: None for page_url in page_urls}
+
+    def detail_item(site, link, section):
+        time.sleep(0.01 * (6 - links.index(link)))  # The last links finish first
+        return None if link == links[2] else item(f'Story {links.index(link)}', link)
+
+    monkeypatch.setattr(site_engine, 'process_listing_pages', process_listing_pages)
+    monkeypatch.setattr(site_engine, 'detail_item', detail_item)
+    monkeypatch.setattr(site_engine, 'get_run_deadline', lambda: RunDeadline())
+    monkeypatch.setattr(site_engine, 'get_validator_store', lambda: type('Store', (), {'save': lambda self: None})())
+    monkeypatch.setattr(site_engine.get_crawl_state(), 'section_urls', lambda section: [])
+    news = NewsList()
+
+    site_engine.crawl_detail_site(site, {section: None for section in site.sections}, news)
+
+    assert [news_item['title'] for news_item in news.items] == ['Story 0', 'Story 1', 'Story 3', 'Story 4', 'Story 5']
+
+@pytest.mark.parametrize('upload_ok, status', [(True, 0), (False, 1)])
+def test_deadline_cut_run_exits_by_its_save_and_upload_errors(tmp_path, monkeypatch, capsys, upload_ok, status):
+    release = threading.Event()
+
+    def scrape_site(site, news):
+        news.add(item(f'{site.name} story', f'https://{site.key}.example/1'))
+        if site.key == 'philstar':
+            release.wait(10)  # Still crawling at the deadline
+        return news.items
+
+    class Exited(Exception):
+        pass
+
+    def exit_now(code):
+        raise Exited(code)
+
+    class Engine:
+        def enrich(self, items, text_of, use_textblob=True, modified_of=None):
+            return items
+        def print_summary(self):
+            pass
+        def shutdown(self):
+            pass
+
+    crawl_state = CrawlState(path=str(tmp_path / 'crawl_state.json'))
+    cache = EnrichmentCache(path=str(tmp_path / 'enrichment_cache.json'))
+    responses = ResponseCache(path=str(tmp_path / 'responses.sqlite3'))
+    monkeypatch.setenv('AZURE_CONNECTION_STRING', 'UseDevelopmentStorage=true')
+    monkeypatch.setenv('AZURE_CONTAINER_NAME', 'news')
+    monkeypatch.setattr(universal_news_scraper, 'start_run_deadline',
+                        lambda: RunDeadline(total_seconds=0.5, reserve_seconds=0))
+    monkeypatch.setattr(universal_news_scraper, 'CRAWL_GRACE_SECONDS', 0)
+    monkeypatch.setattr(universal_news_scraper, 'CROSS_SOURCE_DEDUPE', False)
+    monkeypatch.setattr(universal_news_scraper, 'scrape_site', scrape_site)
+    monkeypatch.setattr(universal_news_scraper, 'get_sentiment_engine', lambda: Engine())
+    monkeypatch.setattr(universal_news_scraper, 'get_crawl_state', lambda: crawl_state)
+    monkeypatch.setattr(universal_news_scraper, 'get_enrichment_cache', lambda: cache)
+    monkeypatch.setattr(universal_news_scraper, 'get_response_cache', lambda: responses)
+    monkeypatch.setattr(universal_news_scraper, 'output_file_locked', lambda filename: False)
+    monkeypatch.setattr(universal_news_scraper, 'save_news_excel', lambda news, filename, table: None)
+    monkeypatch.setattr(universal_news_scraper, 'upload_to_azure_blob', lambda path, name: upload_ok)
+    monkeypatch.setattr(universal_news_scraper.os, '_exit', exit_now)
+
+    try:
+        with pytest.raises(Exited) as exited:
+            universal_news_scraper.main()
+    finally:
+        release.set()
+
+    assert exited.value.args == (status,)
+    assert '⚠️ Still crawling at the deadline (partial output saved): Philstar' in capsys.readouterr().out
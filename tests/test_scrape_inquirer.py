@@ -0,0 +1,31 @@
+from datetime import date
+
+import http_client
+import scrape_inquirer
+
+class Response:
+    status_code = 200
+
+def news_item(title, category, label):
+    return {'title': title, 'category': category, 'description': f"{title}.", 'link': f"https://example.com/{title}",
+            'published_date': date(2025, 8, 6), 'sentiment_score': 0.0, 'sentiment_label': label, 'emotion': 'Calm'}
+
+def test_post_to_teams_sends_summary(monkeypatch):
+    posted = []
+    monkeypatch.setenv('TEAMS_WEBHOOK_URL', 'https://teams.example.com/hook')
+    monkeypatch.setattr(http_client, 'post', lambda url, json: posted.append((url, json)) or Response())
+    items = [news_item('PSEi gains', 'Stock Market', 'Positive'),
+             news_item('Peso slides', 'Banking & Finance', 'Negative'),
+             news_item('BSP holds rates', 'Banking & Finance', 'Neutral')]
+
+    assert scrape_inquirer.post_to_teams(items) is True
+    url, message = posted[0]
+    assert url == 'https://teams.example.com/hook'
+    facts = {fact['name']: fact['value'] for fact in message['sections'][0]['facts']}
+    assert facts['📈 Positive News'] == '1'
+    assert facts['🏷️ Categories'] == '2'
+    assert 'PSEi gains' in message['sections'][0]['text']
+
+def test_post_to_teams_skips_without_webhook(monkeypatch):
+    monkeypatch.delenv('TEAMS_WEBHOOK_URL', raising=False)
+    assert scrape_inquirer.post_to_teams([news_item('PSEi gains', 'Stock Market', 'Positive')]) is False
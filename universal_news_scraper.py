@@ -1,28 +1,63 @@
 #!/usr/bin/env python3
 """
 Universal News Scraper for Inquirer, Business Mirror, and Philstar
-Scrapes all sources, saves Excel files, and uploads to Azure Blob Storage
+Scrapes every source defined in sites/, saves Excel files, and uploads to Azure Blob Storage
 Optimized for GitHub Actions workflow with enhanced error handling
 """
 
 import os
 import sys
-import pandas as pd
 from datetime import datetime
-import importlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from dotenv import load_dotenv
+import http_client
+from rate_limiter import get_rate_limiter
+from validator_store import get_validator_store
+from response_cache import get_response_cache
+from crawl_state import get_crawl_state
+from enrichment_cache import get_enrichment_cache
+from head_fetch import get_head_fetcher
+from metadata_extractor import get_metadata_extractor
+from parse_stage import get_parse_stage
+from dedupe import remove_near_duplicates, CROSS_SOURCE_DEDUPE
+from sentiment_engine import get_sentiment_engine
+from circuit_breaker import get_circuit_breaker
+from run_deadline import start_run_deadline, get_run_deadline, CRAWL_GRACE_SECONDS
+from news_output import save_news_excel, upload_to_azure_blob
+import date_engine
+from site_engine import (NewsList, load_site_definitions, scrape_site, article_description, article_modified,
+                         sentiment_text)
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
-def import_scraper(module_name, function_name):
-    """Import scraper functions with error handling"""
+def output_file_locked(filename):
+    """True when an existing output file is open in another application (Excel on Windows)"""
+    if not os.path.exists(filename):
+        return False
     try:
-        module = importlib.import_module(module_name)
-        return getattr(module, function_name)
-    except Exception as e:
-        print(f"❌ Error importing {module_name}.{function_name}: {e}")
-        return None
+        # Test if we can access the file
+        with open(filename, 'r+b'):
+            pass
+    except PermissionError:
+        return True
+    except OSError:
+        print(f"   Removing existing file: {filename}")
+        os.remove(filename)
+    return False
+
+def finished_result(future, news, source_name):
+    """Return a source's collected articles; a source still crawling at the deadline gives what it has so far
+
+    The partial articles are copies, scored here (VADER only) since their
+    collector never reached its enrichment stage.
+    """
+    if future.done():
+        return future.result()
+    partial = news.snapshot()
+    print(f"⏰ {source_name} did not finish before the crawl deadline - keeping the {len(partial)} articles "
+          f"collected so far")
+    return get_sentiment_engine().enrich(partial, sentiment_text, use_textblob=False, modified_of=article_modified)
 
 def validate_azure_environment():
     """Validate Azure environment configuration for both local and CI environments"""
@@ -49,40 +84,23 @@ def main():
     """Main orchestrator function with enhanced error handling for GitHub Actions"""
     print("🤖 Universal News Scraper - GitHub Actions Optimized")
     print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    deadline = start_run_deadline()
     
     # Validate Azure environment first
     if not validate_azure_environment():
         print("❌ Azure environment validation failed - cannot proceed")
         sys.exit(1)
     
-    # Import enhanced scrapers with dynamic date filtering and improved extraction
-    print("\n📰 Importing news scraper modules...")
-    
-    # Import all three scrapers
-    inquirer_scraper = import_scraper('scrape_inquirer', 'scrape_inquirer_news')
-    inquirer_upload = import_scraper('scrape_inquirer', 'upload_to_azure_blob')
-    
-    businessmirror_scraper = import_scraper('scrape_businessmirror_fixed', 'scrape_businessmirror_news')
-    businessmirror_upload = import_scraper('scrape_businessmirror_fixed', 'upload_to_azure_blob')
-    
-    philstar_scraper = import_scraper('scrape_philstar_improved', 'scrape_philstar_news')
-    philstar_upload = import_scraper('scrape_philstar_improved', 'upload_to_azure_blob')
-    
-    # Check if all imports were successful
-    missing_functions = []
-    if not inquirer_scraper: missing_functions.append("inquirer_scraper")
-    if not inquirer_upload: missing_functions.append("inquirer_upload")
-    if not businessmirror_scraper: missing_functions.append("businessmirror_scraper")
-    if not businessmirror_upload: missing_functions.append("businessmirror_upload")
-    if not philstar_scraper: missing_functions.append("philstar_scraper")
-    if not philstar_upload: missing_functions.append("philstar_upload")
-    
-    if missing_functions:
-        print(f"❌ Could not import required functions: {', '.join(missing_functions)}")
-        print("💡 Ensure all scraper files are present and contain the required functions")
+    # Load the site definitions (sites/*.json): one collector per source
+    print("\n📰 Loading news site definitions...")
+    try:
+        sites = load_site_definitions()
+    except Exception as e:
+        print(f"❌ Could not load site definitions: {e}")
+        print("💡 Ensure the sites/ directory is present and every definition is valid JSON")
         sys.exit(1)
-    
-    print("✅ All scraper modules imported successfully")
+
+    print(f"✅ Loaded {len(sites)} sites: {', '.join(site.name for site in sites)}")
     print("🚀 Enhanced Features:")
     print("   • Dynamic date filtering (today & yesterday)")
     print("   • Enhanced anti-bot measures with modern user agents")
@@ -92,158 +110,93 @@ def main():
     # Track success/failure for exit code
     scraping_errors = 0
 
-    # Scrape Inquirer
+    # Crawl all sources at once: the shared per-host politeness scheduler keeps each
+    # site at its configured rate while requests to the other hosts fill the cool-down gaps
     print("\n==============================")
-    print("🔍 Scraping Inquirer Business News...")
-    try:
-        inquirer_news = inquirer_scraper()
-        if inquirer_news:
-            import pandas as pd
-            df_inq = pd.DataFrame(inquirer_news)
-            inq_filename = "inquirer_news.xlsx"
-            df_inq.to_excel(inq_filename, index=False)
-            # Add Excel table named 'NewsTable'
-            try:
-                from openpyxl import load_workbook
-                from openpyxl.worksheet.table import Table, TableStyleInfo
-                wb = load_workbook(inq_filename)
-                ws = wb.active
-                nrows = ws.max_row
-                ncols = ws.max_column
-                col_letters = ws.cell(row=1, column=ncols).column_letter
-                table_ref = f"A1:{col_letters}{nrows}"
-                table = Table(displayName="NewsTable", ref=table_ref)
-                style = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False,
-                                       showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-                table.tableStyleInfo = style
-                ws.add_table(table)
-                wb.save(inq_filename)
-                print(f"📊 Saved {len(df_inq)} Inquirer news items to {inq_filename} (with table 'NewsTable')")
-            except Exception as e:
-                print(f"⚠️ Could not add Excel table to Inquirer file: {e}")
-                print(f"📊 Saved {len(df_inq)} Inquirer news items to {inq_filename}")
-            
-            print("☁️ Uploading Inquirer news to Azure...")
-            upload_success = inquirer_upload(inq_filename, inq_filename)
-            if not upload_success:
-                print("❌ Failed to upload Inquirer news to Azure")
-                scraping_errors += 1
-            else:
-                print("✅ Inquirer news uploaded successfully")
-        else:
-            print("❌ No Inquirer news found.")
+    print(f"🚦 Crawling {', '.join(site.name for site in sites)} concurrently...")
+    executor = ThreadPoolExecutor(max_workers=len(sites))
+    news_lists = {site.key: NewsList() for site in sites}  # Read directly for sources still crawling at the deadline
+    collected = {site.key: executor.submit(scrape_site, site, news_lists[site.key]) for site in sites}
+    # Wait for the crawl only as long as the deadline allows; the output reserve (less a short
+    # grace period for collectors finishing their current page) is kept for saving and uploading
+    done, not_done = wait(collected.values(), timeout=deadline.crawl_remaining() + CRAWL_GRACE_SECONDS)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    # Collect each source's articles; a collector that raised fails only its own source
+    results, failed = {}, set()
+    for site in sites:
+        try:
+            results[site.key] = finished_result(collected[site.key], news_lists[site.key], site.name)
+        except Exception as e:
+            print(f"❌ {site.name} scraping failed: {str(e)}")
+            results[site.key] = None
+            failed.add(site.key)
             scraping_errors += 1
-    except Exception as e:
-        print(f"❌ Inquirer scraping failed: {str(e)}")
-        scraping_errors += 1
 
-    # Scrape Business Mirror
-    print("\n==============================")
-    print("🔍 Scraping Business Mirror News...")
-    try:
-        # Check if file is locked before proceeding
-        bm_filename = "businessmirror_news.xlsx"
-        if os.path.exists(bm_filename):
-            try:
-                # Test if we can access the file
-                with open(bm_filename, 'r+b') as test_file:
-                    pass
-            except PermissionError:
-                print(f"⚠️  File {bm_filename} is currently locked. Please close any Excel applications and try again.")
-                print("   Skipping Business Mirror scraping to continue with other sources...")
-                bm_news = None
-            except:
-                print(f"   Removing existing file: {bm_filename}")
-                os.remove(bm_filename)
-        
-        if 'bm_news' not in locals() or bm_news is None:
-            bm_news = businessmirror_scraper()
-        
-        if bm_news:
-            import pandas as pd
-            df_bm = pd.DataFrame(bm_news)
-            df_bm.to_excel(bm_filename, index=False)
-            # Add Excel table named 'NewsTable1'
-            try:
-                from openpyxl import load_workbook
-                from openpyxl.worksheet.table import Table, TableStyleInfo
-                wb = load_workbook(bm_filename)
-                ws = wb.active
-                nrows = ws.max_row
-                ncols = ws.max_column
-                col_letters = ws.cell(row=1, column=ncols).column_letter
-                table_ref = f"A1:{col_letters}{nrows}"
-                table = Table(displayName="NewsTable1", ref=table_ref)
-                style = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False,
-                                       showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-                table.tableStyleInfo = style
-                ws.add_table(table)
-                wb.save(bm_filename)
-                print(f"📊 Saved {len(df_bm)} Business Mirror news items to {bm_filename} (with table 'NewsTable1')")
-            except Exception as e:
-                print(f"⚠️ Could not add Excel table to Business Mirror file: {e}")
-                print(f"📊 Saved {len(df_bm)} Business Mirror news items to {bm_filename}")
-            
-            print("☁️ Uploading Business Mirror news to Azure...")
-            upload_success = businessmirror_upload(bm_filename, bm_filename)
-            if not upload_success:
-                print("❌ Failed to upload Business Mirror news to Azure")
+    if not_done:
+        # Unfinished collectors never saved their state: keep what they resolved and scored for the next run
+        get_crawl_state().save()
+        get_enrichment_cache().save()
+
+    get_run_deadline().print_summary()
+    get_rate_limiter().print_summary()
+    get_validator_store().print_summary()
+    get_response_cache().print_summary()
+    get_crawl_state().print_summary()
+    get_enrichment_cache().print_summary()
+    get_head_fetcher().print_summary()
+    get_metadata_extractor().print_summary()
+    get_parse_stage().print_summary()
+    get_parse_stage().shutdown()
+    get_sentiment_engine().print_summary()
+    get_sentiment_engine().shutdown()
+    get_circuit_breaker().print_summary()
+    date_engine.print_summary()
+    http_client.print_connection_stats()
+
+    # Cross-source duplicate removal: a story carried by several sources is saved once, from its most complete record
+    finished = {key: news for key, news in results.items() if news}
+    if CROSS_SOURCE_DEDUPE and len(finished) > 1:
+        print("\n==============================")
+        print("🧬 Removing near-duplicate stories across sources...")
+        results.update(remove_near_duplicates(finished, article_description))
+
+    # Save and upload each source's output
+    for site in sites:
+        if site.key in failed:
+            continue
+        print("\n==============================")
+        print(f"🔍 Saving {site.name} News...")
+        try:
+            # Check if the output file is locked before proceeding
+            if output_file_locked(site.output_file):
+                print(f"⚠️  File {site.output_file} is currently locked. Please close any Excel applications and try again.")
+                print(f"   Skipping {site.name} output to continue with other sources...")
                 scraping_errors += 1
-            else:
-                print("✅ Business Mirror news uploaded successfully")
-        else:
-            print("❌ No Business Mirror news found.")
-            scraping_errors += 1
-    except Exception as e:
-        print(f"❌ Business Mirror scraping failed: {str(e)}")
-        if "Permission denied" in str(e):
-            print("   💡 Suggestion: Close any Excel files and ensure no applications are using the output file")
-        scraping_errors += 1
+                continue
 
-    # Scrape Philstar
-    print("\n==============================")
-    print("🔍 Scraping Philstar Business News...")
-    try:
-        philstar_news = philstar_scraper()
-        if philstar_news:
-            import pandas as pd
-            df_philstar = pd.DataFrame(philstar_news)
-            philstar_filename = "philstar_news.xlsx"
-            df_philstar.to_excel(philstar_filename, index=False)
-            # Add Excel table named 'NewsTable2'
-            try:
-                from openpyxl import load_workbook
-                from openpyxl.worksheet.table import Table, TableStyleInfo
-                wb = load_workbook(philstar_filename)
-                ws = wb.active
-                nrows = ws.max_row
-                ncols = ws.max_column
-                col_letters = ws.cell(row=1, column=ncols).column_letter
-                table_ref = f"A1:{col_letters}{nrows}"
-                table = Table(displayName="NewsTable2", ref=table_ref)
-                style = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False,
-                                       showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-                table.tableStyleInfo = style
-                ws.add_table(table)
-                wb.save(philstar_filename)
-                print(f"📊 Saved {len(df_philstar)} Philstar news items to {philstar_filename} (with table 'NewsTable2')")
-            except Exception as e:
-                print(f"⚠️ Could not add Excel table to Philstar file: {e}")
-                print(f"📊 Saved {len(df_philstar)} Philstar news items to {philstar_filename}")
-            
-            print("☁️ Uploading Philstar news to Azure...")
-            upload_success = philstar_upload(philstar_filename, philstar_filename)
-            if not upload_success:
-                print("❌ Failed to upload Philstar news to Azure")
+            news = results[site.key]
+            if news == [] and finished.get(site.key):
+                print(f"ℹ️ Every {site.name} article was also carried by another source - nothing left to save")
+                continue
+            if not news:
+                print(f"❌ No {site.name} news found.")
                 scraping_errors += 1
+                continue
+
+            save_news_excel(news, site.output_file, site.table_name)
+
+            print(f"☁️ Uploading {site.name} news to Azure...")
+            if upload_to_azure_blob(site.output_file, site.output_file):
+                print(f"✅ {site.name} news uploaded successfully")
             else:
-                print("✅ Philstar news uploaded successfully")
-        else:
-            print("❌ No Philstar news found.")
+                print(f"❌ Failed to upload {site.name} news to Azure")
+                scraping_errors += 1
+        except Exception as e:
+            print(f"❌ {site.name} scraping failed: {str(e)}")
+            if "Permission denied" in str(e):
+                print("   💡 Suggestion: Close any Excel files and ensure no applications are using the output file")
             scraping_errors += 1
-    except Exception as e:
-        print(f"❌ Philstar scraping failed: {str(e)}")
-        scraping_errors += 1
 
     # Final status and exit code
     print("\n==============================")
@@ -251,9 +204,7 @@ def main():
         print("✅ Enhanced Universal News Scraping Complete!")
         print("🎯 All improvements implemented:")
         print("   ✓ Dynamic date filtering (adapts to any date)")
-        print("   ✓ Business Mirror: More articles + proper categories")
-        print("   ✓ Inquirer: Better date filtering accuracy")
-        print("   ✓ Philstar: Infinite scroll simulation")
+        print("   ✓ Declarative site definitions (sites/*.json) on one shared engine")
         print("   ✓ Enhanced error handling for GitHub Actions")
         print("   ✓ Retry logic for Azure uploads")
         print(f"⏰ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -261,6 +212,15 @@ def main():
         print(f"⚠️ Universal News Scraping completed with {scraping_errors} error(s)")
         print("💡 Check the logs above for specific error details")
         print(f"⏰ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    if not_done:
+        # Degraded but delivered: the unfinished sources' partial output was saved above, so only a save or
+        # upload error fails the run. Exit without joining the collector threads still running past the deadline
+        unfinished = [site.name for site in sites if collected[site.key] in not_done]
+        print(f"⚠️ Still crawling at the deadline (partial output saved): {', '.join(unfinished)}")
+        sys.stdout.flush()
+        os._exit(1 if scraping_errors else 0)
+    if scraping_errors:
         sys.exit(1)  # Exit with error code for GitHub Actions
 
 if __name__ == "__main__":
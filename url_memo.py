@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Single-Flight URL Memo - run-scoped de-duplication of per-article work
+Concurrent and repeated requests for the same canonical URL share one
+fetch and one parsed result; duplicate hits are counted per section
+"""
+import threading
+from concurrent.futures import Future
+
+from url_utils import canonical_url
+
+class SingleFlightMemo:
+    """Memoize compute(url) per canonical URL, coalescing concurrent callers into one call"""
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.section_stats = {}  # section -> [lookups, duplicate hits]
+
+    def get(self, url, compute, section=None):
+        """Return compute(url), running it at most once per canonical URL for this run"""
+        key = canonical_url(url)
+        with self.lock:
+            future = self.entries.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.entries[key] = future
+
+            stats = self.section_stats.setdefault(section or 'default', [0, 0])
+            stats[0] += 1
+            if not is_owner:
+                stats[1] += 1
+
+        if is_owner:
+            try:
+                future.set_result(compute(url))
+            except Exception as e:
+                future.set_exception(e)
+
+        # Waits for the owner when another thread is still computing the same URL
+        return future.result()
+
+    def print_summary(self):
+        """Print the duplicate-hit rate per section"""
+        if not self.section_stats:
+            return
+
+        total_lookups = sum(stats[0] for stats in self.section_stats.values())
+        total_hits = sum(stats[1] for stats in self.section_stats.values())
+        print(f"🧠 {self.name}: {len(self.entries)} unique URLs, {total_hits}/{total_lookups} lookups served from memo")
+        for section, (lookups, hits) in self.section_stats.items():
+            hit_rate = (hits / lookups * 100) if lookups else 0.0
+            print(f"   {section}: {hits}/{lookups} duplicate hits ({hit_rate:.0f}%)")
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+URL helpers shared by the news scrapers
+"""
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'amp', 'utm_source', 'utm_medium',
+                   'utm_campaign', 'utm_term', 'utm_content'}
+
+def canonical_url(url):
+    """Normalize a URL so the same article always maps to the same cache key"""
+    if not url:
+        return url
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = parts.hostname.lower() if parts.hostname else ''
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    # Drop tracking parameters and sort the rest so parameter order does not matter
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Conditional GET Validator Store - shared by all news scrapers
+Remembers ETag / Last-Modified validators for listing pages across runs,
+together with the links extracted from each page, so an unchanged page
+(HTTP 304) can reuse the previous run's results without being re-parsed
+"""
+import json
+import os
+import threading
+from datetime import datetime
+
+from date_engine import json_default, restore_dates
+
+# Directory for state persisted between runs (cached in the GitHub workflow)
+CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', '.scraper_cache')
+VALIDATOR_STORE_PATH = os.path.join(CACHE_DIR, 'listing_validators.json')
+
+class ValidatorStore:
+    """URL-keyed store of HTTP validators and the links extracted from that page"""
+
+    def __init__(self, path=VALIDATOR_STORE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()  # One save at a time, so an older snapshot never replaces a newer one
+        self.entries = {}
+        self.stats = {'conditional_requests': 0, 'not_modified': 0, 'bytes_saved': 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            # Listing pages store whole news items: turn their dates back into dates once, at load
+            for entry in self.entries.values():
+                for link in entry.get('links', []):
+                    if isinstance(link, dict):
+                        restore_dates(link)
+            print(f"♻️ Loaded {len(self.entries)} listing validators from {self.path}")
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            print(f"⚠️ Could not read validator store {self.path}: {e}")
+            self.entries = {}
+
+    def conditional_headers(self, url):
+        """Return If-None-Match / If-Modified-Since headers for a previously seen URL"""
+        with self.lock:
+            entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        if headers:
+            with self.lock:
+                self.stats['conditional_requests'] += 1
+        return headers
+
+    def cached_links(self, url):
+        """Return the links extracted from the URL on the run that stored its validators"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += entry.get('size', 0)
+            return entry.get('links', [])
+
+    def record(self, url, response, links):
+        """Store the validators of a 200 response together with its extracted links"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        with self.lock:
+            self.entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'links': links,
+                'size': len(response.content),
+                'stored_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+    def save(self):
+        """Persist the store atomically so an interrupted run never corrupts it"""
+        with self.save_lock:
+            with self.lock:
+                data = json.dumps(self.entries, ensure_ascii=False, default=json_default)
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"  # Runs sharing the cache may save together
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"⚠️ Could not save validator store {self.path}: {e}")
+
+    def print_summary(self):
+        """Print conditional GET statistics for this run"""
+        print(f"♻️ Conditional GET: {self.stats['not_modified']}/{self.stats['conditional_requests']} "
+              f"listing pages unchanged, ~{self.stats['bytes_saved'] / 1024:.0f} KB not re-downloaded")
+
+_validator_store = None
+_validator_store_lock = threading.Lock()
+
+def get_validator_store():
+    """Return the process-wide validator store shared by every scraper"""
+    global _validator_store
+    with _validator_store_lock:
+        if _validator_store is None:
+            _validator_store = ValidatorStore()
+        return _validator_store